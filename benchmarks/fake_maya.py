@@ -0,0 +1,537 @@
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用の maya.cmds スタンドイン
+
+FakeSceneに保持した合成シーンに対して、checker.py が使用するコマンドを
+Mayaと同じ引数・戻り値の形で実装する。install() で sys.modules に
+"maya" / "maya.cmds" として登録する
+"""
+
+import fnmatch
+import math
+import re
+import sys
+import types
+
+
+_COMPONENT = re.compile(r'^(?P<node>[^\[\]]+)\.(?P<type>vtx|e|f|map)\[(?P<spec>[^\]]+)\]$')
+
+# ls(transforms=True) の対象
+_TRANSFORM_TYPES = {"transform", "joint"}
+# ls(materials=True) の対象
+_MATERIAL_TYPES = {"lambert", "blinn", "phong", "standardSurface"}
+# ls(shapes=True) の対象
+_SHAPE_TYPES = {"mesh", "camera"}
+# ls(type="animCurve") で返す派生タイプ
+_TYPE_FAMILIES = {
+    "animCurve": {"animCurveTL", "animCurveTA", "animCurveTU"},
+    "transform": {"transform", "joint"},
+}
+
+
+class FakeMesh:
+    """メッシュデータ（頂点座標・フェースの頂点インデックス・UV）"""
+
+    def __init__(self, points, faces, uvs=None, uv_sets=None):
+        self.points = points
+        self.faces = faces
+        self.uvs = uvs if uvs is not None else [(0.5, 0.5)] * len(points)
+        self.uv_sets = uv_sets if uv_sets is not None else ["map1"]
+        self._edges = None
+
+    @property
+    def edges(self):
+        """重複しないエッジ（頂点インデックスの組）のリスト"""
+        if self._edges is None:
+            seen = {}
+            for face in self.faces:
+                for i in range(len(face)):
+                    edge = tuple(sorted((face[i], face[(i + 1) % len(face)])))
+                    if edge not in seen:
+                        seen[edge] = len(seen)
+            self._edges = list(seen)
+        return self._edges
+
+    def face_area(self, face_index):
+        """フェースの面積（Newell法）"""
+        face = self.faces[face_index]
+        nx = ny = nz = 0.0
+        for i in range(len(face)):
+            x1, y1, z1 = self.points[face[i]]
+            x2, y2, z2 = self.points[face[(i + 1) % len(face)]]
+            nx += (y1 - y2) * (z1 + z2)
+            ny += (z1 - z2) * (x1 + x2)
+            nz += (x1 - x2) * (y1 + y2)
+        return 0.5 * math.sqrt(nx * nx + ny * ny + nz * nz)
+
+    def edge_length(self, edge_index):
+        """エッジの長さ"""
+        a, b = self.edges[edge_index]
+        return math.dist(self.points[a], self.points[b])
+
+
+class FakeNode:
+    """ノード"""
+
+    def __init__(self, name, node_type, parent=None, attrs=None, data=None, uuid=None):
+        self.name = name
+        self.type = node_type
+        self.parent = parent
+        self.attrs = attrs or {}
+        self.data = data
+        self.uuid = uuid
+
+
+class FakeScene:
+    """合成シーン"""
+
+    def __init__(self, scene_name="synthetic.ma"):
+        self.scene_name = scene_name
+        self.nodes = {}      # ロングネーム（DGノードはショートネーム） -> FakeNode
+        self.children = {}   # 親のロングネーム -> 子のロングネームのリスト
+        self.selection = []
+        self.references = []  # {"path", "file", "namespace", "reference_node", "nodes", "edits"} のリスト
+
+    def add(self, name, node_type, parent=None, attrs=None, data=None, uuid=None):
+        """ノードを追加してロングネームを返す"""
+        if parent is not None:
+            long_name = f"{parent}|{name}"
+        elif node_type in _TRANSFORM_TYPES:
+            long_name = f"|{name}"
+        else:
+            long_name = name
+        if uuid is None:
+            uuid = f"00000000-0000-0000-0000-{len(self.nodes):012X}"
+        self.nodes[long_name] = FakeNode(long_name, node_type, parent, attrs, data, uuid)
+        if parent is not None:
+            self.children.setdefault(parent, []).append(long_name)
+        return long_name
+
+    def instance(self, shape, parent):
+        """シェイプのインスタンス（データ・UUIDを共有する別のDAGパス）を追加してロングネームを返す"""
+        node = self.nodes[shape]
+        return self.add(shape.rsplit("|", 1)[-1], node.type, parent=parent, data=node.data, uuid=node.uuid)
+
+    def add_reference(self, file, namespace, nodes, edits=None):
+        """リファレンスを登録（ノードは追加済みのもの）"""
+        copies = sum(1 for reference in self.references if reference["file"] == file)
+        self.references.append({
+            "path": f"{file}{{{copies}}}" if copies else file,
+            "file": file,
+            "namespace": namespace,
+            "reference_node": f"{namespace}RN",
+            "nodes": list(nodes),
+            "edits": list(edits or []),
+        })
+
+    def find(self, name):
+        """ショートネーム・部分パス・ロングネームからノードを取得"""
+        if name in self.nodes:
+            return self.nodes[name]
+        suffix = "|" + name.lstrip("|")
+        for long_name, node in self.nodes.items():
+            if long_name.endswith(suffix):
+                return node
+        raise ValueError(f"No object matches name: {name}")
+
+    def mesh(self, name):
+        """メッシュ（シェイプまたはトランスフォーム名から）を取得"""
+        node = self.find(name)
+        if node.type != "mesh":
+            shapes = [self.nodes[c] for c in self.children.get(node.name, []) if self.nodes[c].type == "mesh"]
+            if not shapes:
+                raise ValueError(f"{name} is not a mesh")
+            node = shapes[0]
+        return node
+
+
+def _parse_indices(spec, count):
+    """"3" / "0:9" / "*" 形式のインデックス指定を展開"""
+    if spec == "*":
+        return range(count)
+    start, _, end = spec.partition(":")
+    return range(int(start), int(end or start) + 1)
+
+
+def _format_ranges(node, comp_type, indices):
+    """インデックスを範囲形式のコンポーネント文字列に変換"""
+    components = []
+    start = prev = None
+    for index in sorted(indices):
+        if start is None:
+            start = prev = index
+        elif index == prev + 1:
+            prev = index
+        else:
+            components.append(f"{node}.{comp_type}[{start}:{prev}]" if start != prev else f"{node}.{comp_type}[{start}]")
+            start = prev = index
+    if start is not None:
+        components.append(f"{node}.{comp_type}[{start}:{prev}]" if start != prev else f"{node}.{comp_type}[{start}]")
+    return components
+
+
+class FakeCmds(types.ModuleType):
+    """maya.cmds の代替モジュール"""
+
+    def __init__(self, scene):
+        super(FakeCmds, self).__init__("maya.cmds")
+        self.scene = scene
+        self.call_count = 0
+        self._constraint = None
+
+    # ----------------------------------------
+    # 内部ヘルパー
+    # ----------------------------------------
+
+    def _count(self):
+        self.call_count += 1
+
+    def _expand(self, items):
+        """ls の引数（ノード名・コンポーネント・ワイルドカード）を展開"""
+        if isinstance(items, str):
+            items = [items]
+        expanded = []
+        for item in items:
+            match = _COMPONENT.match(item)
+            if match:
+                expanded.append(item)
+            elif "*" in item and "." not in item:
+                expanded.extend(n for n in self.scene.nodes if fnmatch.fnmatch(n.split("|")[-1], item))
+            else:
+                try:
+                    expanded.append(self.scene.find(item).name)
+                except ValueError:
+                    # ショートネームが重複している場合はすべて
+                    expanded.extend(n for n in self.scene.nodes if n.split("|")[-1] == item)
+        return expanded
+
+    def _flatten(self, components):
+        """コンポーネントを1つずつに展開"""
+        flat = []
+        for item in components:
+            match = _COMPONENT.match(item)
+            if not match:
+                flat.append(item)
+                continue
+            node = match.group("node")
+            mesh = self.scene.mesh(node).data
+            comp_type = match.group("type")
+            count = {"vtx": len(mesh.points), "e": len(mesh.edges), "f": len(mesh.faces), "map": len(mesh.uvs)}[comp_type]
+            flat.extend(f"{node}.{comp_type}[{i}]" for i in _parse_indices(match.group("spec"), count))
+        return flat
+
+    @staticmethod
+    def _matches_type(node_type, wanted):
+        wanted = [wanted] if isinstance(wanted, str) else wanted
+        return any(node_type == w or node_type in _TYPE_FAMILIES.get(w, ()) for w in wanted)
+
+    # ----------------------------------------
+    # ノードの列挙・クエリ
+    # ----------------------------------------
+
+    def ls(self, *args, **kwargs):
+        self._count()
+        if kwargs.get("sl") or kwargs.get("selection"):
+            items = list(self.scene.selection)
+        elif args:
+            items = self._expand(args[0])
+        else:
+            items = list(self.scene.nodes)
+
+        if kwargs.get("flatten"):
+            items = self._flatten(items)
+
+        node_type = kwargs.get("type")
+        if node_type:
+            items = [n for n in items if n in self.scene.nodes and self._matches_type(self.scene.nodes[n].type, node_type)]
+        if kwargs.get("transforms"):
+            items = [n for n in items if n in self.scene.nodes and self.scene.nodes[n].type in _TRANSFORM_TYPES]
+        if kwargs.get("materials"):
+            items = [n for n in items if n in self.scene.nodes and self.scene.nodes[n].type in _MATERIAL_TYPES]
+        if kwargs.get("shapes"):
+            items = [n for n in items if n in self.scene.nodes and self.scene.nodes[n].type in _SHAPE_TYPES]
+        if kwargs.get("uuid"):
+            # Mayaと同じく、同じノード（インスタンス）のUUIDは1つにまとめる
+            uuids = [self.scene.nodes[n].uuid for n in items if n in self.scene.nodes]
+            return list(dict.fromkeys(uuids))
+        return items
+
+    def nodeType(self, node):
+        self._count()
+        match = _COMPONENT.match(node)
+        if match:
+            return "mesh"
+        return self.scene.find(node).type
+
+    def listRelatives(self, nodes, shapes=False, parent=False, type=None, fullPath=False, allDescendents=False,
+                      children=False):
+        self._count()
+        result = []
+        for name in [nodes] if isinstance(nodes, str) else nodes:
+            node = self.scene.find(name)
+            if parent:
+                if node.parent:
+                    result.append(node.parent)
+                continue
+            related = list(self.scene.children.get(node.name, []))
+            if shapes:
+                related = [c for c in related if self.scene.nodes[c].type in _SHAPE_TYPES]
+            if type:
+                related = [c for c in related if self._matches_type(self.scene.nodes[c].type, type)]
+            result.extend(related)
+        if not fullPath:
+            result = [r.split("|")[-1] for r in result]
+        return result or None
+
+    def getAttr(self, plug):
+        self._count()
+        node_name, attr = plug.rsplit(".", 1)
+        node = self.scene.find(node_name)
+        if attr not in node.attrs:
+            raise ValueError(f"No attribute named {attr}")
+        value = node.attrs[attr]
+        # 3要素のアトリビュートは [(x, y, z)] 形式で返す
+        if isinstance(value, tuple):
+            return [value]
+        return value
+
+    def file(self, *args, **kwargs):
+        self._count()
+        if kwargs.get("query") and kwargs.get("sceneName"):
+            return self.scene.scene_name
+        if kwargs.get("query") and kwargs.get("reference"):
+            # 入れ子のリファレンスは使用しない
+            return [] if args else [reference["path"] for reference in self.scene.references]
+        return None
+
+    def referenceQuery(self, target, isLoaded=False, referenceNode=False, nodes=False, filename=False,
+                       withoutCopyNumber=False, namespace=False, editStrings=False, **kwargs):
+        self._count()
+        reference = next(r for r in self.scene.references if target in (r["path"], r["reference_node"]))
+        if isLoaded:
+            return True
+        if referenceNode:
+            return reference["reference_node"]
+        if nodes:
+            return list(reference["nodes"])
+        if filename:
+            return reference["file"] if withoutCopyNumber else reference["path"]
+        if namespace:
+            return ":" + reference["namespace"]
+        if editStrings:
+            return list(reference["edits"])
+        return None
+
+    # ----------------------------------------
+    # ポリゴン
+    # ----------------------------------------
+
+    def select(self, items=None, replace=True, clear=False):
+        self._count()
+        if clear or items is None:
+            self.scene.selection = []
+            return
+        self.scene.selection = self._expand(items)
+
+    def polySelectConstraint(self, **kwargs):
+        self._count()
+        if kwargs.get("disable"):
+            self._constraint = None
+            return
+        if kwargs.get("mode") != 3:
+            return
+
+        selected = []
+        for item in self.scene.selection:
+            match = _COMPONENT.match(item)
+            if match:
+                selected.append((match.group("node"), match.group("type"), match.group("spec")))
+            else:
+                selected.append((item, None, "*"))
+
+        result = []
+        for node, comp_type, spec in selected:
+            mesh = self.scene.mesh(node).data
+            constraint_type = kwargs.get("type")
+            if constraint_type == 0x0001 and kwargs.get("nonmanifold"):
+                result.extend(f"{node}.vtx[{i}]" for i in self._nonmanifold_vertices(mesh))
+            elif constraint_type == 0x0008 and kwargs.get("topology") == 2:
+                result.extend(f"{node}.f[{i}]" for i in self._lamina_faces(mesh))
+            elif constraint_type == 0x0008 and kwargs.get("size") == 3:
+                result.extend(f"{node}.f[{i}]" for i, face in enumerate(mesh.faces) if len(face) > 4)
+            elif constraint_type == 0x8000 and kwargs.get("length"):
+                low, high = kwargs.get("lengthbound", (0, 0))
+                indices = _parse_indices(spec, len(mesh.edges)) if comp_type == "e" else range(len(mesh.edges))
+                result.extend(f"{node}.e[{i}]" for i in indices if low <= mesh.edge_length(i) <= high)
+        self.scene.selection = result
+
+    @staticmethod
+    def _nonmanifold_vertices(mesh):
+        edge_faces = {}
+        for face in mesh.faces:
+            for i in range(len(face)):
+                edge = tuple(sorted((face[i], face[(i + 1) % len(face)])))
+                edge_faces[edge] = edge_faces.get(edge, 0) + 1
+        vertices = set()
+        for (a, b), count in edge_faces.items():
+            if count > 2:
+                vertices.update((a, b))
+        return sorted(vertices)
+
+    @staticmethod
+    def _lamina_faces(mesh):
+        seen = {}
+        lamina = set()
+        for i, face in enumerate(mesh.faces):
+            key = frozenset(face)
+            if key in seen:
+                lamina.update((seen[key], i))
+            else:
+                seen[key] = i
+        return sorted(lamina)
+
+    def polyListComponentConversion(self, items, toEdge=False, toVertex=False, toUV=False, toFace=False):
+        self._count()
+        result = []
+        for item in [items] if isinstance(items, str) else items:
+            match = _COMPONENT.match(item)
+            node = match.group("node") if match else item
+            mesh = self.scene.mesh(node).data
+            if match and toVertex and match.group("type") == "e":
+                vertices = set()
+                for i in _parse_indices(match.group("spec"), len(mesh.edges)):
+                    vertices.update(mesh.edges[i])
+                result.extend(_format_ranges(node, "vtx", vertices))
+            elif toEdge:
+                result.extend(_format_ranges(node, "e", range(len(mesh.edges))))
+            elif toVertex:
+                result.extend(_format_ranges(node, "vtx", range(len(mesh.points))))
+            elif toUV:
+                result.extend(_format_ranges(node, "map", range(len(mesh.uvs))))
+            elif toFace:
+                result.extend(_format_ranges(node, "f", range(len(mesh.faces))))
+        return result
+
+    def polyEvaluate(self, item, face=False, vertex=False, edge=False, faceArea=False, uvcoord=False):
+        self._count()
+        match = _COMPONENT.match(item)
+        if faceArea and match:
+            mesh = self.scene.mesh(match.group("node")).data
+            return mesh.face_area(int(match.group("spec")))
+        mesh = self.scene.mesh(item).data
+        if face:
+            return len(mesh.faces)
+        if vertex:
+            return len(mesh.points)
+        if edge:
+            return len(mesh.edges)
+        if uvcoord:
+            return len(mesh.uvs)
+        return None
+
+    def polyUVSet(self, mesh, query=False, allUVSets=False):
+        self._count()
+        return list(self.scene.mesh(mesh).data.uv_sets) or None
+
+    def polyEditUV(self, uv, query=False):
+        self._count()
+        match = _COMPONENT.match(uv)
+        mesh = self.scene.mesh(match.group("node")).data
+        flat = []
+        for i in _parse_indices(match.group("spec"), len(mesh.uvs)):
+            flat.extend(mesh.uvs[i])
+        return flat
+
+    def polyInfo(self, mesh, faceToVertex=False, edgeToVertex=False):
+        self._count()
+        data = self.scene.mesh(mesh).data
+        if faceToVertex:
+            return [f"FACE {i:>6}: " + " ".join(f"{v:>6}" for v in face) + " \n"
+                    for i, face in enumerate(data.faces)]
+        if edgeToVertex:
+            return [f"EDGE {i:>6}: {a:>6} {b:>6}  Hard\n" for i, (a, b) in enumerate(data.edges)]
+        return None
+
+    def xform(self, item, query=False, worldSpace=False, translation=False, **kwargs):
+        self._count()
+        match = _COMPONENT.match(item)
+        node = self.scene.mesh(match.group("node"))
+        mesh = node.data
+        scale, offset = self._parent_transform(node) if worldSpace else ((1.0, 1.0, 1.0), (0.0, 0.0, 0.0))
+        flat = []
+        for i in _parse_indices(match.group("spec"), len(mesh.points)):
+            flat.extend(p * s + o for p, s, o in zip(mesh.points[i], scale, offset))
+        return flat
+
+    def _parent_transform(self, node):
+        """親トランスフォームを合成した (スケール, 移動)（回転は合成シーンでは使用しない）"""
+        scale, offset = (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)
+        parent = node.parent
+        while parent:
+            ancestor = self.scene.nodes[parent]
+            parent_scale = ancestor.attrs.get("scale", (1.0, 1.0, 1.0))
+            parent_offset = ancestor.attrs.get("translate", (0.0, 0.0, 0.0))
+            scale = tuple(a * b for a, b in zip(scale, parent_scale))
+            offset = tuple(o * s + t for o, s, t in zip(offset, parent_scale, parent_offset))
+            parent = ancestor.parent
+        return scale, offset
+
+    # ----------------------------------------
+    # スキン・アニメーション
+    # ----------------------------------------
+
+    def skinCluster(self, skin, query=False, geometry=False, influence=False, weightedInfluence=None, **kwargs):
+        self._count()
+        data = self.scene.find(skin).data
+        if geometry:
+            return [data["geometry"]]
+        if influence:
+            return list(data["influences"])
+        if weightedInfluence is not None:
+            column = data["influences"].index(weightedInfluence)
+            return [w[column] for w in data["weights"] if w[column] > 0] or None
+        return None
+
+    def skinPercent(self, skin, vertex, query=False, value=False):
+        self._count()
+        data = self.scene.find(skin).data
+        index = int(_COMPONENT.match(vertex).group("spec"))
+        return list(data["weights"][index])
+
+    def keyframe(self, curve, query=False, keyframeCount=False, **kwargs):
+        self._count()
+        return len(self.scene.find(curve).data["keys"])
+
+    # ----------------------------------------
+    # 編集系（ベンチマークでは何もしない）
+    # ----------------------------------------
+
+    def undoInfo(self, *args, **kwargs):
+        self._count()
+
+    def refresh(self, *args, **kwargs):
+        self._count()
+
+
+def install(scene):
+    """sys.modules に maya / maya.cmds として登録
+
+    Returns:
+        FakeCmds: 登録したモジュール
+    """
+    cmds = sys.modules.get("maya.cmds")
+    if isinstance(cmds, FakeCmds):
+        # 読み込み済みのモジュールが参照を保持しているため、シーンのみ差し替える
+        cmds.scene = scene
+        cmds.call_count = 0
+        return cmds
+
+    cmds = FakeCmds(scene)
+    maya = sys.modules.get("maya")
+    if maya is None or not getattr(maya, "_scene_checker_fake", False):
+        maya = types.ModuleType("maya")
+        maya._scene_checker_fake = True
+        sys.modules["maya"] = maya
+    maya.cmds = cmds
+    sys.modules["maya.cmds"] = cmds
+    return cmds
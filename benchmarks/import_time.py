@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Import Benchmark
+パッケージの読み込み時間と、読み込まれる重いモジュールを計測する
+
+各対象を新しいPythonプロセスで読み込み（モジュールキャッシュの影響を受けない）、
+import文の実行時間を計測する。バッチ・mayapyワーカーで使う対象がQt（PySide）や
+NumPyを読み込んだ場合、またはimport_baselines.jsonの基準値より閾値を超えて
+遅くなった場合は終了コード1を返す
+
+使用例:
+    python benchmarks/import_time.py                     # 計測・比較
+    python benchmarks/import_time.py --update-baseline   # 基準値を更新
+    python benchmarks/import_time.py --profile batch     # -X importtimeで内訳を表示
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "import_baselines.json")
+
+# 計測対象: {名前: import文}
+IMPORT_TARGETS = {
+    "package": "import sceneChecker",
+    "batch": "from sceneChecker import batch, batch_multiple",
+    "batch_worker": "import sceneChecker.batch_worker",
+    "checker": "import sceneChecker.checker",
+    "static_scan": "from sceneChecker import prescan_files",
+}
+
+# 上記の対象で読み込まれてはいけないモジュール
+FORBIDDEN_MODULES = ("PySide6", "PySide2", "shiboken6", "shiboken2", "numpy")
+
+# 基準値に対する読み込み時間の比率がこれを超えたら回帰とみなす
+DEFAULT_THRESHOLD = 1.5
+# 差がこれ未満（秒）の場合は計測誤差として無視する
+DEFAULT_MIN_DELTA = 0.01
+
+# 子プロセスで実行するスクリプト（import文の実行時間と読み込まれた禁止モジュールを出力）
+_CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+loaded = sorted(name for name in {forbidden!r} if name in sys.modules)
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules), "forbidden": loaded}}))
+"""
+
+
+def _child_env():
+    """リポジトリのルートをsys.pathに追加した環境変数"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def measure_import(statement, repeat=5):
+    """import文を新しいプロセスでrepeat回実行し、最短時間の結果を返す
+
+    Returns:
+        dict: {"seconds", "modules": 読み込み後のモジュール数, "forbidden": 読み込まれた禁止モジュール}
+    """
+    script = _CHILD_SCRIPT.format(statement=statement, forbidden=FORBIDDEN_MODULES)
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                   env=_child_env(), check=True)
+        entry = json.loads(completed.stdout.strip().splitlines()[-1])
+        if best is None or entry["seconds"] < best["seconds"]:
+            best = entry
+    return best
+
+
+def profile_import(statement, limit=15):
+    """-X importtimeで読み込みの内訳（累積時間の上位）を表示"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True,
+                               text=True, env=_child_env(), check=True)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self[us] | cumulative | imported package"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    print(f"{'cumulative(ms)':>14} {'self(ms)':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:limit]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+
+def compare(entries, baseline, threshold=DEFAULT_THRESHOLD, min_delta=DEFAULT_MIN_DELTA):
+    """計測結果を検証し、基準値と比較
+
+    Returns:
+        list: 問題のメッセージのリスト
+    """
+    problems = []
+    for name, entry in entries.items():
+        if entry["forbidden"]:
+            problems.append(f"{name}: {', '.join(entry['forbidden'])} が読み込まれました")
+        base = baseline.get(name)
+        if base is None:
+            continue
+        delta = entry["seconds"] - base["seconds"]
+        if base["seconds"] > 0 and entry["seconds"] / base["seconds"] > threshold and delta > min_delta:
+            problems.append(f"{name}: {base['seconds']:.4f}s -> {entry['seconds']:.4f}s "
+                            f"(x{entry['seconds'] / base['seconds']:.2f})")
+    return problems
+
+
+def print_table(entries, baseline):
+    """計測結果を表形式で出力"""
+    print(f"{'target':<14} {'seconds':>10} {'baseline':>10} {'ratio':>7} {'modules':>8}  forbidden")
+    for name, entry in entries.items():
+        base = baseline.get(name)
+        base_seconds = f"{base['seconds']:.4f}" if base else "-"
+        ratio = f"{entry['seconds'] / base['seconds']:.2f}" if base and base["seconds"] > 0 else "-"
+        forbidden = ", ".join(entry["forbidden"]) or "-"
+        print(f"{name:<14} {entry['seconds']:>10.4f} {base_seconds:>10} {ratio:>7} {entry['modules']:>8}  {forbidden}")
+
+
+def load_baseline(path):
+    """基準値を読み込む（ファイルがない場合は空）"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("targets", {})
+
+
+def save_baseline(path, entries):
+    """基準値を保存"""
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "targets": {name: {"seconds": entry["seconds"], "modules": entry["modules"]}
+                    for name, entry in entries.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scene Checkerの読み込み時間のベンチマーク")
+    parser.add_argument("--targets", nargs="+", default=list(IMPORT_TARGETS), choices=list(IMPORT_TARGETS),
+                        help="計測する対象")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数（最短時間を採用）")
+    parser.add_argument("--profile", choices=list(IMPORT_TARGETS), help="対象の読み込みの内訳を表示して終了")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基準値ファイル")
+    parser.add_argument("--update-baseline", action="store_true", help="計測結果で基準値を更新")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="回帰とみなす読み込み時間の比率")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="回帰とみなす最小の差（秒）")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        profile_import(IMPORT_TARGETS[args.profile])
+        return 0
+
+    entries = {name: measure_import(IMPORT_TARGETS[name], args.repeat) for name in args.targets}
+    baseline = load_baseline(args.baseline)
+    print_table(entries, baseline)
+
+    if args.update_baseline:
+        save_baseline(args.baseline, dict(baseline, **entries))
+        print(f"\n基準値を更新しました: {args.baseline}")
+        return 0
+
+    problems = compare(entries, baseline, args.threshold, args.min_delta)
+    if problems:
+        print("\n回帰が検出されました:")
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        return 1
+
+    print("\n✓ 回帰なし")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
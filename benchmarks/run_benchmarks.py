@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Benchmarks
+Mayaなしでchecker.pyの性能を計測する
+
+合成シーン（synthetic）をmaya.cmdsのスタンドイン（fake_maya）に読み込み、
+各check_*関数とSceneChecker.run_checks（設定ファイルごと）の実行時間を計測する。
+baselines.jsonに保存した基準値と比較し、閾値を超えて遅くなった項目・
+検出件数が変わった項目があれば終了コード1を返す
+
+実行時間は繰り返しの中央値を使う。各繰り返しの直前に固定の純Python処理（キャリブレーション）も
+計測して基準値と一緒に保存し、比較時は基準値をその時点のマシン・負荷の速度比で補正する。
+遅くなった項目は再計測し、再び遅い場合のみ回帰とみなす
+
+使用例:
+    python benchmarks/run_benchmarks.py                       # small規模で計測・比較
+    python benchmarks/run_benchmarks.py --scales small medium
+    python benchmarks/run_benchmarks.py --update-baseline     # 基準値を更新
+    python benchmarks/run_benchmarks.py --backend snapshot    # 記録したシーンに対して計測
+    python benchmarks/run_benchmarks.py --backend mmap        # スナップショットファイルに対して計測（NumPyが必要）
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import fake_maya
+from synthetic import LAYOUT_SCALES, SCALES, SCATTER_SCALES, generate_scale
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baselines.json")
+CONFIG_NAMES = ["bg_checks", "motion_checks", "effect_checks"]
+BACKEND_NAMES = ["cmds", "snapshot", "mmap"]
+
+# 基準値に対する実行時間の比率がこれを超えたら回帰とみなす
+DEFAULT_THRESHOLD = 1.5
+# 遅くなった項目を再計測する回数
+CONFIRM_RUNS = 2
+# 差がこれ未満（秒）の場合は計測誤差として無視する
+DEFAULT_MIN_DELTA = 0.01
+# 基準値がこれ未満（秒）の短いベンチマークは、差がSHORT_MIN_DELTA以上の場合のみ回帰とみなす
+# （数十ミリ秒の計測はスケジューラ・キャッシュの影響で1.5倍程度ぶれる）
+SHORT_SECONDS = 0.05
+SHORT_MIN_DELTA = 0.05
+
+
+def _import_checker():
+    """sceneChecker.checker / config / backendを読み込む
+
+    パッケージの__init__はUI（Qt）を遅延読み込みするため、Qtなしで読み込める
+    """
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+    checker = importlib.import_module("sceneChecker.checker")
+    config = importlib.import_module("sceneChecker.config")
+    backend = importlib.import_module("sceneChecker.backend")
+    return checker, config, backend
+
+
+def _check_functions(checker):
+    """checker内のcheck_*関数名の一覧"""
+    return sorted(name for name, value in vars(checker).items()
+                  if name.startswith("check_") and callable(value))
+
+
+def _config_checks(config_module, config_name):
+    """設定ファイルのチェック項目（run_checksに渡す形式）"""
+    config = config_module.load_check_config(config_name)
+    checks = []
+    for category_name, check_items in config.get("categories", {}).items():
+        for item in check_items:
+            checks.append(dict(item, category=category_name, severity=item.get("severity", "warning")))
+    return checks
+
+
+def _counts(results):
+    """チェック結果を {結果名: 件数} にまとめる"""
+    counts = {}
+    for result in results:
+        counts[result["name"]] = counts.get(result["name"], 0) + result["count"]
+    return counts
+
+
+def _calibration_workload(size=15000):
+    """チェックに近い純Python処理（文字列の組み立て・dict・ソート）"""
+    counts = {}
+    for i in range(size):
+        name = f"|root|grp{i % 97}|mesh{i}Shape.f[{i % 400}]"
+        node = name.partition(".")[0]
+        counts[node.rsplit("|", 1)[-1]] = counts.get(node, 0) + len(name)
+    return sorted(counts.items())
+
+
+def _measure(cmds, func, repeat):
+    """funcをrepeat回実行する
+
+    負荷の変化を計測と同じ時点で捉えるため、各繰り返しの直前にキャリブレーション処理を実行する
+
+    Returns:
+        tuple: (実行時間の中央値, キャリブレーション時間の中央値, cmds呼び出し回数, 最後の戻り値)
+    """
+    times = []
+    calibrations = []
+    calls = 0
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        calibrations.append(time.perf_counter() - start)
+
+        cmds.call_count = 0
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+        calls = cmds.call_count
+    return statistics.median(times), statistics.median(calibrations), calls, value
+
+
+def _entry(measured):
+    seconds, calibration, calls, results = measured
+    return {"seconds": seconds, "calibration": calibration, "calls": calls, "counts": _counts(results)}
+
+
+def run_scale(scale, modules, repeat=3, only=None, backend_name="cmds"):
+    """1つの規模で全ベンチマークを実行
+
+    Args:
+        backend_name: "cmds"（スタンドインに対して実行）
+                      "snapshot"（スタンドインから記録したスナップショットに対して実行）
+                      "mmap"（スナップショットファイルに書き出し、メモリマップで読み込んで実行）
+
+        only: 計測するベンチマーク名（check_*関数名・"run_checks[設定名]"）のリスト（Noneの場合はすべて）
+
+    Returns:
+        dict: {ベンチマーク名: {"seconds", "calibration", "calls", "counts"}}
+    """
+    checker, config_module, backend_module = modules
+    scene = generate_scale(scale)
+    cmds = fake_maya.install(scene)
+
+    backend = backend_module.CmdsBackend()
+    if backend_name == "snapshot":
+        backend = backend_module.SnapshotBackend.capture(backend)
+    elif backend_name == "mmap":
+        snapshot = importlib.import_module("sceneChecker.snapshot")
+        directory = tempfile.mkdtemp(prefix="scene_checker_snapshot_")
+        snapshot.save_snapshot(directory, backend)
+        backend = snapshot.load_snapshot(directory)
+
+    entries = {}
+    scene_checker = checker.SceneChecker(backend)
+
+    for function_name in _check_functions(checker):
+        if only and function_name not in only:
+            continue
+        check = {"name": function_name, "description": "", "function": function_name, "severity": "warning"}
+        entries[function_name] = _entry(_measure(cmds, lambda: scene_checker.run_check(check), repeat))
+
+    for config_name in CONFIG_NAMES:
+        if only and f"run_checks[{config_name}]" not in only:
+            continue
+        checks = _config_checks(config_module, config_name)
+        entries[f"run_checks[{config_name}]"] = _entry(_measure(cmds, lambda: scene_checker.run_checks(checks), repeat))
+
+    return entries
+
+
+def _expected_seconds(entry, base):
+    """基準値の実行時間を、計測時と基準値の記録時のキャリブレーション時間の比で補正した値"""
+    if base.get("calibration") and entry.get("calibration"):
+        return base["seconds"] * entry["calibration"] / base["calibration"]
+    return base["seconds"]
+
+
+def compare(scale, entries, baseline, threshold=DEFAULT_THRESHOLD, min_delta=DEFAULT_MIN_DELTA):
+    """計測結果を基準値と比較
+
+    Returns:
+        dict: {ベンチマーク名: 問題のメッセージ}
+    """
+    problems = {}
+    for name, entry in entries.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if entry["counts"] != base["counts"]:
+            problems[name] = f"{scale}/{name}: 検出件数が変化 {base['counts']} -> {entry['counts']}"
+            continue
+        expected = _expected_seconds(entry, base)
+        delta = entry["seconds"] - expected
+        required = max(min_delta, SHORT_MIN_DELTA) if expected < SHORT_SECONDS else min_delta
+        if expected > 0 and entry["seconds"] / expected > threshold and delta > required:
+            problems[name] = (f"{scale}/{name}: {expected:.4f}s -> {entry['seconds']:.4f}s "
+                              f"(x{entry['seconds'] / expected:.2f})")
+    return problems
+
+
+def print_table(scale, entries, baseline):
+    """計測結果を表形式で出力（baselineは速度比で補正した値）"""
+    print(f"\n== {scale} ==")
+    print(f"{'benchmark':<36} {'seconds':>10} {'baseline':>10} {'ratio':>7} {'calls':>9}")
+    for name, entry in entries.items():
+        base = baseline.get(name)
+        expected = _expected_seconds(entry, base) if base else None
+        base_seconds = f"{expected:.4f}" if base else "-"
+        ratio = f"{entry['seconds'] / expected:.2f}" if base and expected > 0 else "-"
+        print(f"{name:<36} {entry['seconds']:>10.4f} {base_seconds:>10} {ratio:>7} {entry['calls']:>9}")
+
+
+def load_baselines(path):
+    """基準値を読み込む（ファイルがない場合は空）"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("scales", {})
+
+
+def save_baselines(path, scales):
+    """基準値を保存"""
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scales": scales,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scene Checkerのベンチマーク")
+    parser.add_argument("--scales", nargs="+", default=["small"],
+                        choices=sorted(SCALES) + sorted(LAYOUT_SCALES) + sorted(SCATTER_SCALES), help="計測する規模")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数（中央値を採用）")
+    parser.add_argument("--backend", default="cmds", choices=BACKEND_NAMES, help="シーンのバックエンド")
+    parser.add_argument("--checks", nargs="+", help="計測するcheck_*関数（省略時はすべて + run_checks）")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基準値ファイル")
+    parser.add_argument("--update-baseline", action="store_true", help="計測結果で基準値を更新")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="回帰とみなす実行時間の比率")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="回帰とみなす最小の差（秒）")
+    args = parser.parse_args(argv)
+
+    # checkerがmaya.cmdsを読み込む前にスタンドインを登録する
+    fake_maya.install(fake_maya.FakeScene())
+    modules = _import_checker()
+    baselines = load_baselines(args.baseline)
+    problems = []
+
+    for scale in args.scales:
+        entries = run_scale(scale, modules, args.repeat, args.checks, args.backend)
+        # cmds以外のバックエンドは別の基準値として保存する
+        key = scale if args.backend == "cmds" else f"{scale}:{args.backend}"
+        baseline = baselines.get(key, {})
+        print_table(key, entries, baseline)
+        if args.update_baseline:
+            baselines[key] = dict(baseline, **entries)
+            continue
+
+        scale_problems = compare(key, entries, baseline, args.threshold, args.min_delta)
+        for _ in range(CONFIRM_RUNS):
+            # 検出件数の変化は再計測しても変わらない
+            slow = [name for name in scale_problems if entries[name]["counts"] == baseline[name]["counts"]]
+            if not slow:
+                break
+            print(f"再計測: {', '.join(slow)}")
+            retried = compare(key, run_scale(scale, modules, args.repeat, slow, args.backend), baseline,
+                              args.threshold, args.min_delta)
+            for name in slow:
+                if name in retried:
+                    scale_problems[name] = retried[name]
+                else:
+                    del scale_problems[name]
+        problems.extend(scale_problems.values())
+
+    if args.update_baseline:
+        save_baselines(args.baseline, baselines)
+        print(f"\n基準値を更新しました: {args.baseline}")
+        return 0
+
+    if problems:
+        print("\n回帰が検出されました:")
+        for problem in problems:
+            print(f"  ✗ {problem}")
+        return 1
+
+    print("\n✓ 回帰なし")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
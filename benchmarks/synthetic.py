@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用の合成シーン生成
+
+規模（メッシュ数・フェース数・skinCluster数・アニメーションカーブ数・fileノード数）を
+指定してFakeSceneを生成する。各チェックが検出対象を持つよう、一定割合で問題
+（N-gon・ゼロ面積・ラミナ・非多様体・UV範囲外・命名違反など）を混入させる。
+乱数シードを固定しているため、同じ規模からは常に同じシーンが生成される
+"""
+
+import random
+
+from fake_maya import FakeMesh, FakeScene
+
+
+# 規模のプリセット
+SCALES = {
+    "small": {"meshes": 20, "faces_per_mesh": 100, "skin_clusters": 5, "joints": 10,
+              "anim_curves": 50, "file_nodes": 20},
+    "medium": {"meshes": 100, "faces_per_mesh": 400, "skin_clusters": 20, "joints": 30,
+               "anim_curves": 500, "file_nodes": 100},
+    "large": {"meshes": 400, "faces_per_mesh": 1600, "skin_clusters": 50, "joints": 60,
+              "anim_curves": 5000, "file_nodes": 500},
+}
+
+# 同じプロップを多数参照するレイアウトシーンのプリセット
+LAYOUT_SCALES = {
+    "layout": {"props": 4, "instances": 200, "meshes_per_prop": 3, "faces_per_mesh": 200, "joints": 8,
+               "local_meshes": 10},
+}
+
+# 同じメッシュを複製・インスタンス化して散布したシーンのプリセット
+SCATTER_SCALES = {
+    "scatter": {"sources": 5, "copies": 200, "instances": 200, "faces_per_mesh": 400},
+}
+
+# 問題を混入させる割合（メッシュ・ノード単位）
+DEFECT_RATE = 0.1
+
+# 配置以外のリファレンス編集（インスタンスごとにチェックされる）を持つインスタンスの割合
+OVERRIDE_RATE = 0.05
+
+_IDENTITY = {"translate": (0.0, 0.0, 0.0), "rotate": (0.0, 0.0, 0.0), "scale": (1.0, 1.0, 1.0)}
+
+
+def _grid_mesh(rng, faces, defective):
+    """格子状の四角形メッシュを生成（defectiveの場合は問題を混入）"""
+    width = max(1, int(faces ** 0.5))
+    height = max(1, faces // width)
+    points = [(float(x), 0.0, float(z)) for z in range(height + 1) for x in range(width + 1)]
+    uvs = [(x / width, z / height) for z in range(height + 1) for x in range(width + 1)]
+    row = width + 1
+    polys = [[z * row + x, z * row + x + 1, (z + 1) * row + x + 1, (z + 1) * row + x]
+             for z in range(height) for x in range(width)]
+
+    if defective:
+        # N-gon: 先頭フェースに頂点を追加
+        center = len(points)
+        points.append((0.5, 0.0, -0.5))
+        uvs.append((0.5, 0.0))
+        polys[0] = [polys[0][0], center, polys[0][1], polys[0][2], polys[0][3]]
+
+        # ゼロ面積フェース・ゼロ長エッジ: 末尾フェースの頂点を1点に潰す
+        last = polys[-1]
+        for index in last[1:]:
+            points[index] = points[last[0]]
+
+        # ラミナフェース: 任意のフェースを複製
+        polys.append(list(reversed(polys[rng.randrange(len(polys))])))
+
+        # 非多様体: 既存エッジに3枚目のフェースを追加
+        a, b = polys[len(polys) // 2][:2]
+        apex = len(points)
+        points.append((0.0, 1.0, 0.0))
+        uvs.append((1.5, 0.5))  # UV範囲外
+        polys.append([a, b, apex])
+
+    return FakeMesh(points, polys, uvs, ["map1", "map2"] if defective else ["map1"])
+
+
+def _object_name(rng, index, defective):
+    """BG命名規則に沿った名前（defectiveの場合はデフォルト名）"""
+    if defective:
+        return f"pCube{index + 1}"
+    return f"{rng.choice(['maps', 'city', 'town'])}_{rng.choice(['building', 'tree', 'rock'])}_{index % 1000:03d}"
+
+
+def generate_scene(meshes=20, faces_per_mesh=100, skin_clusters=5, joints=10, anim_curves=50, file_nodes=20,
+                   seed=0):
+    """合成シーンを生成
+
+    Args:
+        meshes: メッシュ数
+        faces_per_mesh: メッシュあたりのフェース数（格子状に近い数に丸める）
+        skin_clusters: skinCluster数（それぞれ先頭から順にメッシュにバインド）
+        joints: skinClusterあたりのインフルエンス（ジョイント）数
+        anim_curves: アニメーションカーブ数
+        file_nodes: fileノード数
+        seed: 乱数シード
+
+    Returns:
+        FakeScene: 生成したシーン
+    """
+    rng = random.Random(seed)
+    scene = FakeScene(f"synthetic_{meshes}x{faces_per_mesh}.ma")
+    mesh_shapes = []
+
+    root = scene.add("maps_root_001", "transform", attrs={
+        "translate": (0.0, 0.0, 0.0), "rotate": (0.0, 0.0, 0.0), "scale": (1.0, 1.0, 1.0)})
+
+    for i in range(meshes):
+        defective = rng.random() < DEFECT_RATE
+        scale = (-1.0, 1.0, 1.0) if defective else (1.0, 1.0, 1.0)
+        translate = (float(i), 0.0, 0.0) if defective else (0.0, 0.0, 0.0)
+        transform = scene.add(_object_name(rng, i, defective), "transform", parent=root, attrs={
+            "translate": translate, "rotate": (0.0, 0.0, 0.0), "scale": scale})
+        shape = scene.add(f"{transform.split('|')[-1]}Shape", "mesh", parent=transform,
+                          data=_grid_mesh(rng, faces_per_mesh, defective))
+        mesh_shapes.append(shape)
+
+    # カメラ（命名チェックの除外対象）
+    camera = scene.add("persp", "transform", attrs={
+        "translate": (28.0, 21.0, 28.0), "rotate": (-27.9, 45.0, 0.0), "scale": (1.0, 1.0, 1.0)})
+    scene.add("perspShape", "camera", parent=camera)
+
+    # ジョイントとskinCluster
+    for s in range(min(skin_clusters, len(mesh_shapes))):
+        parent = None
+        influences = []
+        for j in range(joints):
+            orient = (180.0 if rng.random() < DEFECT_RATE else float(rng.choice([0, 90])), 0.0, 0.0)
+            parent = scene.add(f"char{s}_joint{j}", "joint", parent=parent, attrs={
+                "translate": (0.0, 1.0, 0.0), "rotate": (0.0, 0.0, 0.0), "scale": (1.0, 1.0, 1.0),
+                "jointOrient": orient})
+            influences.append(parent)
+
+        geometry = mesh_shapes[s]
+        mesh = scene.nodes[geometry].data
+        # 最後のインフルエンスはウェイトを持たない（未使用インフルエンス）
+        used = max(1, joints - 1)
+        weights = []
+        for v in range(len(mesh.points)):
+            row = [0.0] * joints
+            if rng.random() < DEFECT_RATE:
+                pass  # ウェイトなしの頂点
+            else:
+                first = v % used
+                second = (v + 1) % used
+                row[first] += 0.7
+                row[second] += 0.3
+            weights.append(row)
+        scene.add(f"skinCluster{s + 1}", "skinCluster",
+                  data={"geometry": geometry, "influences": influences, "weights": weights})
+
+    # アニメーションカーブ
+    for c in range(anim_curves):
+        key_count = 1 if rng.random() < DEFECT_RATE else rng.randint(2, 48)
+        scene.add(f"curve{c}_translateX", rng.choice(["animCurveTL", "animCurveTA", "animCurveTU"]),
+                  data={"keys": list(range(key_count))})
+
+    # マテリアル
+    scene.add("lambert1", "lambert")
+    for m in range(max(1, meshes // 10)):
+        scene.add(f"material{m}", rng.choice(["lambert", "blinn", "standardSurface"]))
+
+    # fileノード（存在しないパス・連番テクスチャを含む）
+    for f in range(file_nodes):
+        if rng.random() < DEFECT_RATE:
+            path = f"/nonexistent/textures/tex_{f}.<UDIM>.png"
+        elif rng.random() < DEFECT_RATE:
+            path = f"/nonexistent/textures/seq_{f}.####.png"
+        else:
+            path = f"/nonexistent/textures/tex_{f}.png"
+        scene.add(f"file{f + 1}", "file", attrs={"fileTextureName": path})
+
+    return scene
+
+
+def _prop_template(rng, prop, meshes, faces_per_mesh, joints):
+    """プロップ（参照ファイル）の内容: (名前, ノードタイプ, 親の位置, アトリビュート, データ) のリスト
+
+    データ（FakeMesh・ウェイト）はインスタンス間で共有する
+    """
+    template = [(f"prop{prop}_grp", "transform", None, dict(_IDENTITY), None)]
+    for m in range(meshes):
+        defective = m == 0 and prop % 2 == 0
+        template.append((f"prop{prop}_geo{m}", "transform", 0, dict(_IDENTITY), None))
+        template.append((f"prop{prop}_geo{m}Shape", "mesh", len(template) - 1, None,
+                         _grid_mesh(rng, faces_per_mesh, defective)))
+
+    # 先頭のメッシュにバインドしたジョイントチェーン（最後のインフルエンスは未使用）
+    parent = 0
+    influences = []
+    for j in range(joints):
+        orient = (180.0 if j == joints // 2 else 0.0, 0.0, 0.0)
+        template.append((f"joint{j}", "joint", parent, dict(_IDENTITY, jointOrient=orient), None))
+        parent = len(template) - 1
+        influences.append(parent)
+    vertex_count = len(template[2][4].points)
+    used = max(1, joints - 1)
+    weights = []
+    for v in range(vertex_count):
+        row = [0.0] * joints
+        if rng.random() >= DEFECT_RATE:
+            row[v % used] += 0.7
+            row[(v + 1) % used] += 0.3
+        weights.append(row)
+    template.append(("skinCluster1", "skinCluster", None, None,
+                     {"geometry": 2, "influences": influences, "weights": weights}))
+    return template
+
+
+def _add_instance(scene, template, namespace, parent):
+    """プロップのテンプレートをネームスペース付きで追加し、追加したノードのリストを返す"""
+    nodes = []
+    for name, node_type, parent_index, attrs, data in template:
+        if parent_index is not None:
+            node_parent = nodes[parent_index]
+        else:
+            # ルートのトランスフォームはシーン側のグループの下に配置
+            node_parent = parent if node_type == "transform" else None
+        if isinstance(data, dict):
+            data = dict(data, geometry=nodes[data["geometry"]],
+                        influences=[nodes[index] for index in data["influences"]])
+        nodes.append(scene.add(f"{namespace}:{name}", node_type, parent=node_parent,
+                               attrs=dict(attrs) if attrs else None, data=data))
+    return nodes
+
+
+def generate_layout(props=4, instances=200, meshes_per_prop=3, faces_per_mesh=200, joints=8, local_meshes=10,
+                    seed=0):
+    """同じプロップを多数参照するレイアウトシーンを生成
+
+    Args:
+        props: プロップ（参照ファイル）数
+        instances: リファレンス数（プロップを順番に参照）
+        meshes_per_prop: プロップあたりのメッシュ数
+        faces_per_mesh: メッシュあたりのフェース数
+        joints: プロップあたりのジョイント（インフルエンス）数
+        local_meshes: リファレンス外のメッシュ数
+        seed: 乱数シード
+
+    Returns:
+        FakeScene: 生成したシーン
+    """
+    rng = random.Random(seed)
+    scene = FakeScene(f"layout_{props}x{instances}.ma")
+    templates = [_prop_template(random.Random(seed * 1000 + prop), prop, meshes_per_prop, faces_per_mesh, joints)
+                 for prop in range(props)]
+
+    layout = scene.add("maps_layout_001", "transform", attrs=dict(_IDENTITY))
+    rows = [scene.add(f"maps_row_{r:03d}", "transform", parent=layout, attrs=dict(_IDENTITY)) for r in range(4)]
+    for i in range(instances):
+        prop = i % props
+        namespace = f"prop{prop}_{i // props + 1:03d}"
+        nodes = _add_instance(scene, templates[prop], namespace, rows[i % len(rows)])
+        edits = [f'setAttr "{namespace}:prop{prop}_grp.translate" -type "double3" {float(i)} 0 0']
+        if rng.random() < OVERRIDE_RATE:
+            edits.append(f'setAttr "{namespace}:prop{prop}_geo0.scale" -type "double3" 2 2 2')
+        scene.add_reference(f"/assets/props/prop{prop}.ma", namespace, nodes, edits)
+
+    for i in range(local_meshes):
+        defective = rng.random() < DEFECT_RATE * 3
+        transform = scene.add(_object_name(rng, i, defective), "transform", parent=layout, attrs=dict(_IDENTITY))
+        scene.add(f"{transform.split('|')[-1]}Shape", "mesh", parent=transform,
+                  data=_grid_mesh(rng, faces_per_mesh, defective))
+
+    camera = scene.add("persp", "transform", attrs={
+        "translate": (28.0, 21.0, 28.0), "rotate": (-27.9, 45.0, 0.0), "scale": (1.0, 1.0, 1.0)})
+    scene.add("perspShape", "camera", parent=camera)
+    scene.add("lambert1", "lambert")
+    return scene
+
+
+def _scatter_scale(i):
+    """散布したコピー・インスタンスのスケール（長さ・面積の判定がスケールに依存しないことの確認用）"""
+    return ((1.0, 1.0, 1.0), (1e-6, 1e-6, 1e-6), (1e3, 1e3, 1e3))[i % 3]
+
+
+def generate_scatter(sources=5, copies=200, instances=200, faces_per_mesh=400, seed=0):
+    """同じメッシュを複製（移動・スケールしただけのコピー）・インスタンス化して散布したシーンを生成
+
+    Args:
+        sources: 元のメッシュ数（半数に問題を混入）
+        copies: 複製数（元のメッシュを順番に複製し、データは別に持つ）
+        instances: インスタンス数（元のシェイプを順番に別のトランスフォームの下に追加）
+        faces_per_mesh: メッシュあたりのフェース数
+        seed: 乱数シード
+
+    Returns:
+        FakeScene: 生成したシーン
+    """
+    rng = random.Random(seed)
+    scene = FakeScene(f"scatter_{sources}x{copies + instances}.ma")
+    root = scene.add("maps_scatter_001", "transform", attrs=dict(_IDENTITY))
+
+    shapes = []
+    for i in range(sources):
+        transform = scene.add(_object_name(rng, i, False), "transform", parent=root, attrs=dict(_IDENTITY))
+        shapes.append(scene.add(f"{transform.split('|')[-1]}Shape", "mesh", parent=transform,
+                                data=_grid_mesh(rng, faces_per_mesh, i % 2 == 0)))
+
+    for i in range(copies):
+        source = scene.nodes[shapes[i % sources]].data
+        transform = scene.add(_object_name(rng, sources + i, False), "transform", parent=root,
+                              attrs=dict(_IDENTITY, translate=(float(i), 0.0, float(i % 7)), scale=_scatter_scale(i)))
+        scene.add(f"{transform.split('|')[-1]}Shape", "mesh", parent=transform,
+                  data=FakeMesh(list(source.points), [list(face) for face in source.faces], list(source.uvs),
+                                list(source.uv_sets)))
+
+    for i in range(instances):
+        transform = scene.add(_object_name(rng, sources + copies + i, False), "transform", parent=root,
+                              attrs=dict(_IDENTITY, translate=(float(-i), 0.0, 0.0), scale=_scatter_scale(i)))
+        scene.instance(shapes[i % sources], transform)
+
+    camera = scene.add("persp", "transform", attrs={
+        "translate": (28.0, 21.0, 28.0), "rotate": (-27.9, 45.0, 0.0), "scale": (1.0, 1.0, 1.0)})
+    scene.add("perspShape", "camera", parent=camera)
+    scene.add("lambert1", "lambert")
+    return scene
+
+
+def generate_scale(scale, seed=0):
+    """プリセットの規模で合成シーンを生成"""
+    if scale in LAYOUT_SCALES:
+        return generate_layout(seed=seed, **LAYOUT_SCALES[scale])
+    if scale in SCATTER_SCALES:
+        return generate_scatter(seed=seed, **SCATTER_SCALES[scale])
+    return generate_scene(seed=seed, **SCALES[scale])
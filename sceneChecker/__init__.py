@@ -11,54 +11,103 @@ Maya2025向けシーンチェッカー
     # バッチモードでCSV出力
     from sceneChecker import batch
     batch()
+
+UI（Qt）とMaya専用のモジュールは最初に名前が参照された時に読み込む。
+バッチ・mayapyワーカー・事前スキャンではPySideを読み込まない
 """
 
-from .ui import SceneCheckerUI
-from .check_selector import CheckSelectorUI
-from .main import run_scene_checker
-from .batch import run_batch_check, batch_check_multiple_files, export_to_csv
+import importlib
+
+# batchサブモジュールはQtに依存しないため先に読み込む
+# （後から読み込むとパッケージの属性 "batch" が下のbatch関数からサブモジュールに置き換わる）
+from .batch import run_batch_check, batch_check_multiple_files, export_to_csv, export_to_csv_long
+
+
+# 遅延読み込みする公開API: {名前: モジュール}
+_LAZY_ATTRIBUTES = {
+    "SceneCheckerUI": ".ui",
+    "CheckSelectorUI": ".check_selector",
+    "run_scene_checker": ".main",
+    "CheckScope": ".scope",
+    "prescan_files": ".static_scan",
+    "add_plugin_dir": ".plugins",
+}
+
+
+def __getattr__(name):
+    """公開APIを初回参照時に読み込む"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
-def run(config_name="bg_checks"):
+def run(config_name="bg_checks", scope=None, blocking=True):
     """シーンチェッカーを実行（チェック項目選択→チェック実行→結果表示）
 
     Args:
         config_name: 使用する設定ファイル名（"bg_checks", "motion_checks", "effect_checks"）
+        scope: チェック範囲の初期値（CheckScope、Noneの場合はシーン全体）
+        blocking: Falseの場合、チェック中もMayaを操作でき、結果は完了したものから表示される
     """
-    return run_scene_checker(config_name)
+    from .main import run_scene_checker
+    return run_scene_checker(config_name, scope, blocking)
 
 
-def batch(config_name="bg_checks", output_csv=None, scene_file=None):
+def batch(config_name="bg_checks", output_csv=None, scene_file=None, open_profile=None, results_db=None):
     """バッチモードでチェックを実行してCSVに出力
 
     Args:
         config_name: 使用する設定ファイル名（デフォルト: "bg_checks"）
+                     リストの場合はシーンを1回だけ開いて設定ごとにCSVを出力
         output_csv: 出力するCSVファイルのパス（Noneの場合は自動生成）
         scene_file: チェックするシーンファイル（Noneの場合は現在のシーン）
+        open_profile: シーンオープンのプロファイル（Noneの場合はチェック項目から自動選択）
+        results_db: 結果の履歴を蓄積するSQLiteデータベースのパス
 
     Returns:
-        str: 出力されたCSVファイルのパス
+        str: 出力されたCSVファイルのパス（複数の設定の場合は {設定名: パス} のdict）
     """
-    return run_batch_check(config_name, output_csv, scene_file)
+    return run_batch_check(config_name, output_csv, scene_file, open_profile, results_db)
 
 
-def batch_multiple(scene_files, config_name="bg_checks", output_dir=None):
+def batch_multiple(scene_files, config_name="bg_checks", output_dir=None, workers=None, open_profile=None,
+                   timeout=None, manifest_path=None, results_jsonl=None, results_csv=None, results_db=None,
+                   retry_failed=False):
     """複数のシーンファイルをバッチチェック
 
     Args:
         scene_files: チェックするシーンファイルのリスト
         config_name: 使用する設定ファイル名
         output_dir: CSV出力先ディレクトリ（Noneの場合は各シーンと同じ場所）
+        workers: 並列実行するmayapyワーカー数（Noneの場合は現在のセッションで順番に実行）
+        open_profile: シーンオープンのプロファイル（Noneの場合はチェック項目から自動選択）
+        timeout: 1シーンあたりのタイムアウト（秒、指定時はワーカープロセスで実行）
+        manifest_path: 進捗マニフェストのパス（記録済みのシーンはスキップして再開）
+        results_jsonl: 全シーンの結果を逐次書き出すJSON Linesのパス
+        results_csv: 全シーンの結果を逐次書き出す統合CSVのパス
+        results_db: 結果の履歴を蓄積するSQLiteデータベースのパス
+        retry_failed: マニフェストでエラーになっているシーンを再実行するか
 
     Returns:
         list: 出力されたCSVファイルパスのリスト
     """
-    return batch_check_multiple_files(scene_files, config_name, output_dir)
+    return batch_check_multiple_files(scene_files, config_name, output_dir, workers=workers,
+                                      open_profile=open_profile, timeout=timeout, manifest_path=manifest_path,
+                                      retry_failed=retry_failed, results_jsonl=results_jsonl,
+                                      results_csv=results_csv, results_db=results_db)
 
 
 __all__ = [
     'run', 'batch', 'batch_multiple',
-    'SceneCheckerUI', 'CheckSelectorUI',
+    'SceneCheckerUI', 'CheckSelectorUI', 'CheckScope',
     'run_scene_checker',
-    'run_batch_check', 'batch_check_multiple_files', 'export_to_csv'
+    'run_batch_check', 'batch_check_multiple_files', 'export_to_csv', 'export_to_csv_long',
+    'prescan_files', 'add_plugin_dir'
 ]
@@ -0,0 +1,603 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Scene Backend
+チェックがシーンを読み取るためのインターフェースと実装
+
+    SceneBackend:     インターフェース（ノードの列挙・アトリビュートの一括取得・
+                      メッシュ配列・スキンウェイト・アニメーションカーブ・リファレンス）
+    CmdsBackend:      maya.cmds による実装
+    OpenMayaBackend:  OpenMaya 2.0 による実装（メッシュ・スキン・カーブを一括取得）
+    SnapshotBackend:  記録したシーンデータによる実装（Maya不要）
+
+チェック関数はこのインターフェースに対してのみ書く。Mayaのモジュールは
+各実装の中で読み込むため、このモジュール自体はMayaなしで読み込める
+"""
+
+import contextlib
+import os
+
+from .references import ReferenceMap, is_placement_edit, root_names
+
+
+# 環境変数でバックエンドを指定できる（"cmds", "openmaya"）
+BACKEND_ENV = "SCENE_CHECKER_BACKEND"
+
+# ls(type=...) で派生タイプも含めるもの（スナップショットで記録する）
+RECORDED_TYPES = ["mesh", "transform", "joint", "file", "skinCluster", "animCurve"]
+
+# スナップショットで記録するアトリビュート
+RECORDED_ATTRS = {
+    "transform": ["translate", "rotate", "scale"],
+    "joint": ["translate", "rotate", "scale", "jointOrient"],
+    "file": ["fileTextureName"],
+}
+
+
+class MeshData:
+    """メッシュの配列データ
+
+    Attributes:
+        name: メッシュシェイプのロングネーム
+        points: 頂点座標（オブジェクト空間。長さ・面積の判定が親のスケールに依存しない）の (x, y, z) の配列
+        face_counts: フェースごとの頂点数の配列
+        face_vertices: 全フェースの頂点インデックスを連結した配列
+        edges: エッジごとの (頂点, 頂点) の配列（Mayaのエッジインデックス順）
+        uvs: カレントUVセットの (u, v) の配列（UVインデックス順）
+        uv_sets: UVセット名のリスト
+    """
+
+    def __init__(self, name, points, face_counts, face_vertices, edges, uvs, uv_sets):
+        self.name = name
+        self.points = points
+        self.face_counts = face_counts
+        self.face_vertices = face_vertices
+        self.edges = edges
+        self.uvs = uvs
+        self.uv_sets = uv_sets
+
+
+class SkinData:
+    """skinClusterのウェイトデータ
+
+    Attributes:
+        name: skinCluster名
+        geometry: バインドされたメッシュのロングネーム
+        influences: インフルエンス名のリスト
+        weights: 頂点ごとのウェイト（インフルエンス順）の配列
+    """
+
+    def __init__(self, name, geometry, influences, weights):
+        self.name = name
+        self.geometry = geometry
+        self.influences = influences
+        self.weights = weights
+
+
+class SceneBackend:
+    """シーン読み取りのインターフェース"""
+
+    name = None
+
+    def __init__(self):
+        self._cache = None
+
+    # ----------------------------------------
+    # キャッシュ
+    # ----------------------------------------
+
+    @contextlib.contextmanager
+    def caching(self):
+        """ブロック内ではメッシュ・スキンの読み取り結果を再利用する
+
+        複数のチェックが同じメッシュを読む run_checks の間だけ有効にする
+        （修正関数などでシーンが変わるため、ブロックを抜けると破棄する）
+        """
+        if self._cache is not None:
+            yield self
+            return
+        self._cache = {}
+        try:
+            yield self
+        finally:
+            self._cache = None
+
+    def _cached(self, key, read):
+        if self._cache is None:
+            return read()
+        if key not in self._cache:
+            self._cache[key] = read()
+        return self._cache[key]
+
+    def memo(self, key, compute):
+        """caching()のブロック内でcomputeの結果を再利用する（チェック間で共有する判定結果など）
+
+        Args:
+            key: ハッシュ可能なキー（メッシュ・スキンの読み取り結果のキーと重ならないもの）
+            compute: 引数なしで結果を返す関数
+        """
+        return self._cached(("memo",) + tuple(key), compute)
+
+    # ----------------------------------------
+    # インターフェース
+    # ----------------------------------------
+
+    def ls(self, nodes=None, type=None, transforms=False, materials=False, long=True):
+        """ノードを列挙（cmds.lsのサブセット）
+
+        Args:
+            nodes: 対象を限定するノードのリスト（Noneの場合はシーン全体）
+            type: ノードタイプ（派生タイプを含む）
+            transforms: トランスフォームのみ
+            materials: マテリアルのみ
+            long: ロングネームで返す
+
+        Returns:
+            list: ノード名のリスト
+        """
+        raise NotImplementedError
+
+    def node_type(self, node):
+        """ノードタイプ"""
+        raise NotImplementedError
+
+    def shapes(self, node, node_type=None):
+        """子シェイプ（ロングネーム）のリスト"""
+        raise NotImplementedError
+
+    def parent(self, node):
+        """親のロングネーム（ない場合はNone）"""
+        raise NotImplementedError
+
+    def same_name_nodes(self, name):
+        """同じショートネームを持つノード（ロングネーム）のリスト"""
+        raise NotImplementedError
+
+    def get_attrs(self, nodes, attr):
+        """複数ノードのアトリビュートを一括取得
+
+        Returns:
+            list: ノード順の値（3要素のアトリビュートはタプル、取得できない場合はNone）
+        """
+        raise NotImplementedError
+
+    def mesh(self, mesh):
+        """メッシュの配列データ（MeshData）"""
+        return self._cached(("mesh", mesh), lambda: self._read_mesh(mesh))
+
+    def skin(self, skin):
+        """skinClusterのウェイトデータ（SkinData）"""
+        return self._cached(("skin", skin), lambda: self._read_skin(skin))
+
+    def key_counts(self, curves):
+        """アニメーションカーブごとのキー数のリスト"""
+        raise NotImplementedError
+
+    def mesh_identities(self, meshes):
+        """メッシュ（DAGパス）ごとのシェイプノードの識別子のリスト
+
+        インスタンス化されたシェイプは複数のDAGパスで同じ識別子になる
+        （識別できない場合はパスをそのまま返す）
+        """
+        return list(meshes)
+
+    def reference_map(self):
+        """参照ファイルごとのリファレンスの表（ReferenceMap）"""
+        return self._cached(("references",), lambda: ReferenceMap(self._read_references()))
+
+    def _read_mesh(self, mesh):
+        raise NotImplementedError
+
+    def _read_skin(self, skin):
+        raise NotImplementedError
+
+    def _read_references(self):
+        """読み込まれているリファレンスのリスト（ReferenceMapの引数の形式、取得できない場合は空）"""
+        return []
+
+
+# ========================================
+# maya.cmds
+# ========================================
+
+def _parse_poly_info(lines, count=None):
+    """polyInfoの出力（"FACE 0: 0 1 3 2" など）をインデックスのリストに変換
+
+    Args:
+        count: 行ごとに使用する値の数（"EDGE 0: 0 1 Hard" の場合は2）
+    """
+    return [list(map(int, line.partition(":")[2].split()[:count])) for line in lines or []]
+
+
+class CmdsBackend(SceneBackend):
+    """maya.cmds による実装"""
+
+    name = "cmds"
+
+    def __init__(self):
+        super(CmdsBackend, self).__init__()
+        import maya.cmds as cmds
+        self.cmds = cmds
+
+    def ls(self, nodes=None, type=None, transforms=False, materials=False, long=True):
+        kwargs = {"long": long}
+        if type:
+            kwargs["type"] = type
+        if transforms:
+            kwargs["transforms"] = True
+        if materials:
+            kwargs["materials"] = True
+        if nodes is None:
+            return self.cmds.ls(**kwargs) or []
+        if not nodes:
+            return []
+        return self.cmds.ls(nodes, **kwargs) or []
+
+    def node_type(self, node):
+        return self.cmds.nodeType(node)
+
+    def shapes(self, node, node_type=None):
+        kwargs = {"shapes": True, "fullPath": True}
+        if node_type:
+            kwargs["type"] = node_type
+        return self.cmds.listRelatives(node, **kwargs) or []
+
+    def parent(self, node):
+        parents = self.cmds.listRelatives(node, parent=True, fullPath=True)
+        return parents[0] if parents else None
+
+    def same_name_nodes(self, name):
+        return self.cmds.ls(name, long=True) or []
+
+    def get_attrs(self, nodes, attr):
+        values = []
+        for node in nodes:
+            try:
+                value = self.cmds.getAttr(f"{node}.{attr}")
+            except Exception:
+                value = None
+            # 3要素のアトリビュートは [(x, y, z)] で返る
+            if isinstance(value, list) and len(value) == 1 and isinstance(value[0], tuple):
+                value = value[0]
+            values.append(value)
+        return values
+
+    def _read_mesh(self, mesh):
+        cmds = self.cmds
+        flat_points = cmds.xform(f"{mesh}.vtx[*]", query=True, objectSpace=True, translation=True) or []
+        points = [tuple(flat_points[i:i + 3]) for i in range(0, len(flat_points), 3)]
+
+        faces = _parse_poly_info(cmds.polyInfo(mesh, faceToVertex=True))
+        face_counts = [len(face) for face in faces]
+        face_vertices = [vertex for face in faces for vertex in face]
+        edges = [tuple(edge) for edge in _parse_poly_info(cmds.polyInfo(mesh, edgeToVertex=True), 2)]
+
+        uv_sets = cmds.polyUVSet(mesh, query=True, allUVSets=True) or []
+        uvs = []
+        if uv_sets and cmds.polyEvaluate(mesh, uvcoord=True):
+            flat_uvs = cmds.polyEditUV(f"{mesh}.map[*]", query=True) or []
+            uvs = [tuple(flat_uvs[i:i + 2]) for i in range(0, len(flat_uvs), 2)]
+
+        return MeshData(mesh, points, face_counts, face_vertices, edges, uvs, uv_sets)
+
+    def _read_skin(self, skin):
+        cmds = self.cmds
+        geometry = cmds.skinCluster(skin, query=True, geometry=True)
+        if not geometry:
+            return SkinData(skin, None, [], [])
+        geometry = (cmds.ls(geometry[0], long=True) or geometry)[0]
+        influences = cmds.skinCluster(skin, query=True, influence=True) or []
+        vertex_count = cmds.polyEvaluate(geometry, vertex=True)
+        weights = [cmds.skinPercent(skin, f"{geometry}.vtx[{i}]", query=True, value=True)
+                   for i in range(vertex_count)]
+        return SkinData(skin, geometry, influences, weights)
+
+    def key_counts(self, curves):
+        counts = []
+        for curve in curves:
+            try:
+                counts.append(self.cmds.keyframe(curve, query=True, keyframeCount=True))
+            except Exception:
+                counts.append(None)
+        return counts
+
+    def mesh_identities(self, meshes):
+        if not meshes:
+            return []
+        try:
+            uuids = self.cmds.ls(meshes, uuid=True) or []
+        except Exception:
+            uuids = []
+        # インスタンスのパスをまとめて渡すと重複が除かれるため、数が合わない場合は1つずつ取得
+        if len(uuids) != len(meshes):
+            uuids = []
+            for mesh in meshes:
+                try:
+                    uuids.append((self.cmds.ls(mesh, uuid=True) or [mesh])[0])
+                except Exception:
+                    uuids.append(mesh)
+        return uuids
+
+    def _reference_nodes(self, path):
+        """リファレンスのノード（入れ子のリファレンスを含む）"""
+        cmds = self.cmds
+        nodes = cmds.referenceQuery(path, nodes=True, dagPath=True) or []
+        for child in cmds.file(path, query=True, reference=True) or []:
+            if cmds.referenceQuery(child, isLoaded=True):
+                nodes.extend(self._reference_nodes(child))
+        return nodes
+
+    def _read_references(self):
+        cmds = self.cmds
+        references = []
+        for path in cmds.file(query=True, reference=True) or []:
+            if not cmds.referenceQuery(path, isLoaded=True):
+                continue
+            reference_node = cmds.referenceQuery(path, referenceNode=True)
+            nodes = cmds.ls(self._reference_nodes(path), long=True) or []
+            roots = root_names(nodes)
+            edits = cmds.referenceQuery(reference_node, editStrings=True) or []
+            references.append({
+                "file": cmds.referenceQuery(path, filename=True, withoutCopyNumber=True),
+                "namespace": cmds.referenceQuery(path, namespace=True),
+                "nodes": nodes,
+                "overridden": not all(is_placement_edit(edit, roots) for edit in edits),
+            })
+        return references
+
+
+# ========================================
+# OpenMaya 2.0
+# ========================================
+
+class OpenMayaBackend(CmdsBackend):
+    """OpenMaya 2.0 による実装
+
+    ノードの列挙・アトリビュートはcmdsのまま、メッシュ・スキンウェイト・カーブを
+    API呼び出し1回ずつで配列として取得する
+    """
+
+    name = "openmaya"
+
+    def __init__(self):
+        super(OpenMayaBackend, self).__init__()
+        import maya.api.OpenMaya as om
+        import maya.api.OpenMayaAnim as oma
+        self.om = om
+        self.oma = oma
+
+    def _selection(self, node):
+        selection = self.om.MSelectionList()
+        selection.add(node)
+        return selection
+
+    def _read_mesh(self, mesh):
+        om = self.om
+        fn_mesh = om.MFnMesh(self._selection(mesh).getDagPath(0))
+        points = [(p.x, p.y, p.z) for p in fn_mesh.getPoints(om.MSpace.kObject)]
+        face_counts, face_vertices = fn_mesh.getVertices()
+        edges = [fn_mesh.getEdgeVertices(i) for i in range(fn_mesh.numEdges)]
+        uv_sets = list(fn_mesh.getUVSetNames())
+        uvs = []
+        if uv_sets and fn_mesh.numUVs():
+            us, vs = fn_mesh.getUVs()
+            uvs = list(zip(us, vs))
+        return MeshData(mesh, points, list(face_counts), list(face_vertices), edges, uvs, uv_sets)
+
+    def _read_skin(self, skin):
+        om = self.om
+        fn_skin = self.oma.MFnSkinCluster(self._selection(skin).getDependNode(0))
+        influences = [path.partialPathName() for path in fn_skin.influenceObjects()]
+        if not fn_skin.numOutputConnections():
+            return SkinData(skin, None, influences, [])
+
+        geometry_path = fn_skin.getPathAtIndex(fn_skin.indexForOutputConnection(0))
+        fn_component = om.MFnSingleIndexedComponent()
+        components = fn_component.create(om.MFn.kMeshVertComponent)
+        fn_component.setCompleteData(om.MFnMesh(geometry_path).numVertices)
+
+        flat, influence_count = fn_skin.getWeights(geometry_path, components)
+        weights = [list(flat[i:i + influence_count]) for i in range(0, len(flat), influence_count)]
+        return SkinData(skin, geometry_path.fullPathName(), influences, weights)
+
+    def key_counts(self, curves):
+        counts = []
+        for curve in curves:
+            try:
+                counts.append(self.oma.MFnAnimCurve(self._selection(curve).getDependNode(0)).numKeys)
+            except Exception:
+                counts.append(None)
+        return counts
+
+
+# ========================================
+# スナップショット
+# ========================================
+
+class SnapshotBackend(SceneBackend):
+    """記録したシーンデータによる実装（Maya不要）
+
+    capture() で別のバックエンドからチェックに必要なデータを記録する。
+    ls(type=...) の派生タイプ・transforms・materials はRECORDED_TYPESについて
+    記録時の結果を使用し、それ以外は完全一致で判定する
+    """
+
+    name = "snapshot"
+
+    def __init__(self, nodes, parents, type_members, attrs, meshes, skins, key_counts, references=None):
+        """
+        Args:
+            nodes: {ノード名: ノードタイプ}（DAGノードはロングネーム）
+            parents: {ロングネーム: 親のロングネーム}
+            type_members: {"mesh" / "transforms" / "materials" など: ノード名のリスト}
+            attrs: {アトリビュート名: {ノード名: 値}}
+            meshes: {メッシュ名: MeshData}
+            skins: {skinCluster名: SkinData}
+            key_counts: {カーブ名: キー数}
+            references: リファレンスのリスト（ReferenceMapの引数の形式）
+        """
+        super(SnapshotBackend, self).__init__()
+        self.nodes = nodes
+        self.parents = parents
+        self.type_members = {key: set(members) for key, members in type_members.items()}
+        self.attrs = attrs
+        self.meshes = meshes
+        self.skins = skins
+        self.curve_key_counts = key_counts
+        self.references = references or []
+        self._children = {}
+        for child, parent in parents.items():
+            self._children.setdefault(parent, []).append(child)
+
+    @classmethod
+    def capture(cls, source, include_geometry=True):
+        """バックエンドからシーンを記録
+
+        Args:
+            source: 記録元のバックエンド（CmdsBackendなど）
+            include_geometry: メッシュ・スキンウェイトを記録するかどうか
+                              （Falseの場合はノード表・アトリビュート・カーブのみ）
+
+        Returns:
+            SnapshotBackend: 記録したスナップショット
+        """
+        nodes = {}
+        for node in source.ls(long=True):
+            nodes[node] = source.node_type(node)
+
+        parents = {}
+        for node in nodes:
+            if node.startswith("|"):
+                parent = source.parent(node)
+                if parent:
+                    parents[node] = parent
+
+        type_members = {node_type: source.ls(type=node_type, long=True) for node_type in RECORDED_TYPES}
+        type_members["transforms"] = source.ls(transforms=True, long=True)
+        type_members["materials"] = source.ls(materials=True, long=True)
+
+        attrs = {}
+        for node_type, attr_names in RECORDED_ATTRS.items():
+            members = [node for node in type_members[node_type] if nodes.get(node) == node_type]
+            for attr in attr_names:
+                attrs.setdefault(attr, {}).update(zip(members, source.get_attrs(members, attr)))
+
+        meshes = {}
+        skins = {}
+        if include_geometry:
+            meshes = {mesh: source.mesh(mesh) for mesh in type_members["mesh"]}
+            skins = {skin: source.skin(skin) for skin in type_members["skinCluster"]}
+        curves = type_members["animCurve"]
+        key_counts = dict(zip(curves, source.key_counts(curves)))
+        references = source.reference_map().references
+
+        return cls(nodes, parents, type_members, attrs, meshes, skins, key_counts, references)
+
+    def _resolve(self, name):
+        """ショートネーム・部分パスをノード名に解決"""
+        if name in self.nodes:
+            return [name]
+        suffix = "|" + name.lstrip("|")
+        return [node for node in self.nodes if node.endswith(suffix)]
+
+    def ls(self, nodes=None, type=None, transforms=False, materials=False, long=True):
+        if nodes is None:
+            result = list(self.nodes)
+        else:
+            result = []
+            for node in nodes:
+                result.extend(self._resolve(node))
+
+        if type:
+            members = self.type_members.get(type)
+            if members is None:
+                result = [node for node in result if self.nodes[node] == type]
+            else:
+                result = [node for node in result if node in members]
+        if transforms:
+            result = [node for node in result if node in self.type_members["transforms"]]
+        if materials:
+            result = [node for node in result if node in self.type_members["materials"]]
+        if not long:
+            result = [node.split("|")[-1] for node in result]
+        return result
+
+    def node_type(self, node):
+        return self.nodes[self._resolve(node)[0]]
+
+    def shapes(self, node, node_type=None):
+        node = self._resolve(node)[0]
+        shapes = [child for child in self._children.get(node, []) if child in self.meshes or
+                  self.nodes[child] in ("mesh", "camera", "nurbsCurve", "nurbsSurface")]
+        if node_type:
+            shapes = [shape for shape in shapes if self.nodes[shape] == node_type]
+        return shapes
+
+    def parent(self, node):
+        return self.parents.get(self._resolve(node)[0])
+
+    def same_name_nodes(self, name):
+        return [node for node in self.nodes if node.split("|")[-1] == name]
+
+    def get_attrs(self, nodes, attr):
+        values = self.attrs.get(attr, {})
+        return [values.get(node) for node in nodes]
+
+    def _read_mesh(self, mesh):
+        return self.meshes[self._resolve(mesh)[0]]
+
+    def _read_skin(self, skin):
+        return self.skins[skin]
+
+    def key_counts(self, curves):
+        return [self.curve_key_counts.get(curve) for curve in curves]
+
+    def _read_references(self):
+        return self.references
+
+
+# ========================================
+# バックエンドの選択
+# ========================================
+
+BACKENDS = {
+    CmdsBackend.name: CmdsBackend,
+    OpenMayaBackend.name: OpenMayaBackend,
+}
+
+_default_backend = None
+
+
+def create_backend(name=None):
+    """バックエンドを作成
+
+    Args:
+        name: "cmds" / "openmaya"（Noneの場合は環境変数 SCENE_CHECKER_BACKEND、
+              未設定の場合はOpenMayaが使えればOpenMaya、使えなければcmds）
+
+    Returns:
+        SceneBackend: バックエンド
+    """
+    name = name or os.environ.get(BACKEND_ENV)
+    if name:
+        if name not in BACKENDS:
+            raise ValueError(f"不明なバックエンドです: {name}")
+        return BACKENDS[name]()
+
+    try:
+        return OpenMayaBackend()
+    except ImportError:
+        return CmdsBackend()
+
+
+def get_default_backend():
+    """チェックで使用するデフォルトのバックエンド（初回呼び出し時に作成）"""
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = create_backend()
+    return _default_backend
+
+
+def set_default_backend(backend):
+    """デフォルトのバックエンドを設定（Noneの場合は次回の呼び出し時に再作成）"""
+    global _default_backend
+    _default_backend = backend
@@ -5,46 +5,77 @@ Maya Scene Checker - Batch Execution
 """
 
 import csv
+import gzip
 import os
-import maya.cmds as cmds
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    # Maya外では読み込みのみ（事前スキャンなどMayaを使わない処理のため）
+    cmds = None
+
 from .checker import SceneChecker
-from .check_selector import load_check_config
+from .config import CHECK_PARAMETERS, collect_config_checks, load_check_config
+from .components import split_item
+from .batch_pool import (batch_check_parallel, scene_output_path, load_manifest, append_manifest,
+                         pending_scene_files, manifest_outputs)
+from .sinks import open_result_sinks, write_to_sinks, close_sinks
+from .results_db import SqliteResultSink
+from .scene_open import open_scene, resolve_open_profile, select_open_profile, suspended_refresh
 
 
-def run_batch_check(config_name="bg_checks", output_csv=None, scene_file=None):
+def run_batch_check(config_name="bg_checks", output_csv=None, scene_file=None, open_profile=None, results_db=None):
     """バッチモードでチェックを実行してCSVに出力
 
     Args:
         config_name: 使用する設定ファイル名（デフォルト: "bg_checks"）
+                     リストを渡した場合はシーンを1回だけ開き、重複するチェック関数は1回だけ実行して
+                     設定ごとにCSVを出力する
         output_csv: 出力するCSVファイルのパス（Noneの場合は自動生成）
+                    複数の設定の場合は "{名前}_{設定名}.csv" として設定ごとに出力
         scene_file: チェックするシーンファイル（Noneの場合は現在のシーン）
+        open_profile: シーンオープンのプロファイル名（"full", "light", "no_references"）
+                      またはプロファイル設定のdict（Noneの場合はチェック項目から自動選択）
+        results_db: 結果の履歴を蓄積するSQLiteデータベースのパス
 
     Returns:
         str: 出力されたCSVファイルのパス
+             複数の設定の場合は {設定名: CSVファイルのパス} のdict
     """
-    # シーンファイルを開く
-    if scene_file:
-        if not os.path.exists(scene_file):
-            raise FileNotFoundError(f"シーンファイルが見つかりません: {scene_file}")
-        cmds.file(scene_file, open=True, force=True)
-
-    # 設定をロード
-    config = load_check_config(config_name)
-
-    # すべてのチェックを選択
-    all_checks = []
-    for category_name, check_items in config.get("categories", {}).items():
-        for item in check_items:
-            all_checks.append({
-                "category": category_name,
-                "name": item["name"],
-                "description": item["description"],
-                "function": item.get("function", "")
-            })
-
-    # チェックを実行
-    checker = SceneChecker()
-    results = checker.run_checks(all_checks)
+    output_csv, results = _run_batch_check(config_name, output_csv, scene_file, open_profile)
+
+    if results_db:
+        sink = SqliteResultSink(results_db)
+        try:
+            sink.write_scene(scene_file or cmds.file(query=True, sceneName=True), config_name, results)
+        finally:
+            sink.close()
+
+    return output_csv
+
+
+def _run_batch_check(config_name, output_csv, scene_file, open_profile=None):
+    """run_batch_checkの本体（出力パスとチェック結果を返す）"""
+    if scene_file and not os.path.exists(scene_file):
+        raise FileNotFoundError(f"シーンファイルが見つかりません: {scene_file}")
+
+    config_names = [config_name] if isinstance(config_name, str) else list(config_name)
+
+    # チェック項目から必要なシーンオープンのプロファイルを決定
+    if open_profile is None:
+        checks = []
+        for name in config_names:
+            checks.extend(collect_config_checks(load_check_config(name)))
+        open_profile = select_open_profile(checks)
+    settings = resolve_open_profile(open_profile)
+
+    with suspended_refresh(settings["suspend_refresh"]):
+        # シーンファイルを開く
+        if scene_file:
+            open_scene(scene_file, settings)
+
+        # チェックを実行
+        results_by_config = run_config_checks(config_names)
 
     # CSV出力パスを決定
     if not output_csv:
@@ -55,10 +86,63 @@ def run_batch_check(config_name="bg_checks", output_csv=None, scene_file=None):
             scene_name = "untitled"
         output_csv = f"{scene_name}_check_results.csv"
 
-    # CSVに出力
-    export_to_csv(results, output_csv)
+    if isinstance(config_name, str):
+        # CSVに出力
+        export_to_csv(results_by_config[config_name], output_csv)
+        return output_csv, results_by_config[config_name]
 
-    return output_csv
+    # 設定ごとにCSVに出力
+    base, ext = os.path.splitext(output_csv)
+    outputs = {}
+    for name in config_names:
+        outputs[name] = f"{base}_{name}{ext or '.csv'}"
+        export_to_csv(results_by_config[name], outputs[name])
+    return outputs, results_by_config
+
+
+def run_config_checks(config_names):
+    """複数の設定のチェックを現在のシーンに対して実行
+
+    同じチェック関数（同じパラメータ）が複数の設定に含まれる場合は1回だけ実行し、
+    設定側のチェック名・重要度・説明で結果を付け替える
+
+    Args:
+        config_names: 設定ファイル名のリスト
+
+    Returns:
+        dict: {設定名: チェック結果のリスト}
+    """
+    checker = SceneChecker()
+    cache = {}  # (チェック関数名, パラメータ) -> (実行時のチェック項目, 結果)
+    results_by_config = {}
+
+    with checker.get_backend().caching():
+        for config_name in config_names:
+            results = []
+            for check in collect_config_checks(load_check_config(config_name)):
+                key = (check["function"],) + tuple(check.get(name) for name in CHECK_PARAMETERS)
+                if key not in cache:
+                    cache[key] = (check, checker.run_check(check))
+                source_check, source_results = cache[key]
+                results.extend(_relabel_results(source_results, source_check, check))
+            results_by_config[config_name] = results
+
+    return results_by_config
+
+
+def _relabel_results(results, source_check, check):
+    """別の設定で実行したチェック結果を、チェック項目の名前・重要度・説明で付け替える"""
+    if source_check is check:
+        return list(results)
+
+    relabeled = []
+    for result in results:
+        result = dict(result)
+        for key in ("name", "severity", "description"):
+            if result.get(key) == source_check.get(key):
+                result[key] = check.get(key)
+        relabeled.append(result)
+    return relabeled
 
 
 def export_to_csv(results, output_path):
@@ -90,38 +174,114 @@ def export_to_csv(results, output_path):
     print(f"チェック結果をCSVに出力しました: {output_path}")
 
 
-def batch_check_multiple_files(scene_files, config_name="bg_checks", output_dir=None):
+def export_to_csv_long(results, output_path, compress=None):
+    """チェック結果をロング形式（1行1エラー項目）のCSVにストリーミング出力
+
+    エラー項目を1つのセルに結合しないため、数十万件の結果でもメモリ使用量は一定で、
+    表計算ソフトで開けるCSVになる
+
+    Args:
+        results: チェック結果のiterable（itemsはiterableであればよく、1件ずつ読み出す）
+        output_path: 出力先CSVファイルパス
+        compress: gzip圧縮するか（Noneの場合は拡張子が.gzかどうかで判定）
+
+    Returns:
+        int: 出力したエラー項目の行数
+    """
+    if compress is None:
+        compress = output_path.lower().endswith(".gz")
+
+    if compress:
+        csvfile = gzip.open(output_path, "wt", newline="", encoding="utf-8-sig")
+    else:
+        csvfile = open(output_path, "w", newline="", encoding="utf-8-sig")
+
+    rows = 0
+    with csvfile:
+        writer = csv.writer(csvfile)
+
+        # ヘッダー
+        writer.writerow(["チェック名", "重要度", "ノード", "コンポーネント"])
+
+        for result in results:
+            name = result.get("name", "")
+            severity = result.get("severity", "")
+            for item in result.get("items", []):
+                node, component = split_item(item)
+                writer.writerow([name, severity, node, component])
+                rows += 1
+
+    print(f"チェック結果をCSV（ロング形式）に出力しました: {output_path}")
+    return rows
+
+
+def batch_check_multiple_files(scene_files, config_name="bg_checks", output_dir=None, workers=None, mayapy=None,
+                               open_profile=None, timeout=None, manifest_path=None, retry_failed=False,
+                               results_jsonl=None, results_csv=None, results_db=None, sinks=None):
     """複数のシーンファイルをバッチチェック
 
     Args:
         scene_files: チェックするシーンファイルのリスト
-        config_name: 使用する設定ファイル名
+        config_name: 使用する設定ファイル名（リストの場合はシーンを1回開いて設定ごとに出力）
         output_dir: CSV出力先ディレクトリ（Noneの場合は各シーンと同じ場所）
+        workers: 並列実行するmayapyワーカー数（Noneの場合は現在のセッションで順番に実行）
+        mayapy: mayapyのパス（Noneの場合は自動検出）
+        open_profile: シーンオープンのプロファイル（Noneの場合はチェック項目から自動選択）
+        timeout: 1シーンあたりのタイムアウト（秒）。指定した場合はワーカープロセスで実行し、
+                 ハング・クラッシュしたワーカーを再起動する（workers未指定時は1プロセス）
+        manifest_path: 進捗マニフェスト（JSON Lines）のパス。記録済みのシーンはスキップして再開する
+        retry_failed: マニフェストでエラーになっているシーンを再実行するか
+        results_jsonl: 全シーンの結果をシーンごとに逐次書き出すJSON Linesのパス
+        results_csv: 全シーンの結果をシーンごとに逐次書き出す統合CSVのパス
+        results_db: 結果の履歴を蓄積するSQLiteデータベースのパス
+        sinks: 追加の結果シンク（write_scene/closeを持つオブジェクト）のリスト
 
     Returns:
         list: 出力されたCSVファイルパスのリスト
     """
-    output_files = []
+    if workers or timeout:
+        return batch_check_parallel(scene_files, config_name, output_dir, workers=workers or 1, mayapy=mayapy,
+                                    open_profile=open_profile, timeout=timeout, manifest_path=manifest_path,
+                                    retry_failed=retry_failed, results_jsonl=results_jsonl,
+                                    results_csv=results_csv, results_db=results_db, sinks=sinks)
 
-    for scene_file in scene_files:
-        try:
-            # 出力パスを決定
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-                scene_name = os.path.splitext(os.path.basename(scene_file))[0]
-                output_csv = os.path.join(output_dir, f"{scene_name}_check_results.csv")
-            else:
-                scene_dir = os.path.dirname(scene_file)
-                scene_name = os.path.splitext(os.path.basename(scene_file))[0]
-                output_csv = os.path.join(scene_dir, f"{scene_name}_check_results.csv")
+    manifest = load_manifest(manifest_path)
+    pending = set(pending_scene_files(scene_files, manifest, retry_failed))
+    outputs = manifest_outputs(manifest)
+    owned_sinks = open_result_sinks(results_jsonl, results_csv, results_db)
+    all_sinks = owned_sinks + list(sinks or [])
+
+    try:
+        for scene_file in scene_files:
+            if scene_file not in pending:
+                continue
 
-            # バッチチェック実行
-            result_path = run_batch_check(config_name, output_csv, scene_file)
-            output_files.append(result_path)
+            try:
+                # 出力パスを決定
+                output_csv = scene_output_path(scene_file, output_dir)
 
-            print(f"✓ チェック完了: {scene_file}")
+                # バッチチェック実行
+                outputs[scene_file], results = _run_batch_check(config_name, output_csv, scene_file, open_profile)
+                # 結果を保存できた後にマニフェストへ記録する
+                write_to_sinks(all_sinks, scene_file, config_name, results)
+                append_manifest(manifest_path, {"scene_file": scene_file, "status": "ok",
+                                                "output": outputs[scene_file], "error": None})
 
-        except Exception as e:
-            print(f"✗ エラー: {scene_file} - {str(e)}")
+                print(f"✓ チェック完了: {scene_file}")
 
+            except Exception as e:
+                append_manifest(manifest_path, {"scene_file": scene_file, "status": "error",
+                                                "output": None, "error": str(e)})
+                write_to_sinks(all_sinks, scene_file, config_name, [], "error", str(e))
+                print(f"✗ エラー: {scene_file} - {str(e)}")
+    finally:
+        close_sinks(owned_sinks)
+
+    output_files = []
+    for scene_file in scene_files:
+        output = outputs.get(scene_file)
+        if isinstance(output, dict):
+            output_files.extend(output.values())
+        elif output:
+            output_files.append(output)
     return output_files
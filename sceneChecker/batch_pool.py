@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Batch Pool
+複数のmayapyワーカープロセスによる並列バッチ実行
+コーディネーター側はMayaに依存しない
+"""
+
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import traceback
+
+from .sinks import open_result_sinks, write_to_sinks, close_sinks, sinks_want_items
+
+
+# ワーカーからの結果行を識別するプレフィックス（Maya自身の標準出力と区別する）
+RESULT_PREFIX = "@@SCENECHECKER@@"
+
+
+def scene_output_path(scene_file, output_dir=None, suffix="check_results.csv"):
+    """シーンファイルに対応する出力ファイルパスを決定
+
+    Args:
+        scene_file: シーンファイルのパス
+        output_dir: 出力先ディレクトリ（Noneの場合はシーンと同じ場所）
+        suffix: ファイル名の末尾
+
+    Returns:
+        str: 出力ファイルパス
+    """
+    scene_name = os.path.splitext(os.path.basename(scene_file))[0]
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        return os.path.join(output_dir, f"{scene_name}_{suffix}")
+    return os.path.join(os.path.dirname(scene_file), f"{scene_name}_{suffix}")
+
+
+def find_mayapy():
+    """mayapyの実行ファイルを探す
+
+    優先順位: 環境変数MAYAPY → 実行中のMayaと同じディレクトリ → PATH
+
+    Returns:
+        str: mayapyのパス
+    """
+    mayapy = os.environ.get("MAYAPY")
+    if mayapy:
+        return mayapy
+
+    executable = sys.executable or ""
+    exe_dir, exe_name = os.path.split(executable)
+    if exe_name.lower().startswith("mayapy"):
+        return executable
+
+    ext = ".exe" if sys.platform == "win32" else ""
+    candidate = os.path.join(exe_dir, f"mayapy{ext}")
+    if exe_dir and os.path.exists(candidate):
+        return candidate
+
+    found = shutil.which("mayapy")
+    if found:
+        return found
+
+    raise FileNotFoundError("mayapyが見つかりません（環境変数MAYAPYで指定してください）")
+
+
+def _worker_env():
+    """ワーカープロセス用の環境変数"""
+    env = dict(os.environ)
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    python_path = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = os.pathsep.join([package_root, python_path]) if python_path else package_root
+    # 起動時間短縮のためCIP/クラッシュレポートを無効化
+    env.setdefault("MAYA_DISABLE_CIP", "1")
+    env.setdefault("MAYA_DISABLE_CER", "1")
+    return env
+
+
+def load_manifest(manifest_path):
+    """進捗マニフェストを読み込む
+
+    Args:
+        manifest_path: マニフェストファイル（JSON Lines）のパス
+
+    Returns:
+        dict: {シーンファイル: 最後に記録された結果}
+    """
+    records = {}
+    if not manifest_path or not os.path.exists(manifest_path):
+        return records
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 中断時に書きかけになった行は無視
+                continue
+            records[record["scene_file"]] = record
+    return records
+
+
+def append_manifest(manifest_path, record):
+    """進捗マニフェストに1シーンの結果を追記（中断に備えて即座にディスクへ書き出す）"""
+    if not manifest_path:
+        return
+    with open(manifest_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def pending_scene_files(scene_files, manifest, retry_failed=False):
+    """マニフェストに記録済みのシーンを除いたシーンファイルのリストを取得"""
+    return [scene_file for scene_file in scene_files
+            if scene_file not in manifest
+            or (retry_failed and manifest[scene_file].get("status") != "ok")]
+
+
+def manifest_outputs(manifest):
+    """マニフェストに記録済みの出力ファイルを取得"""
+    return {scene_file: record.get("output") for scene_file, record in manifest.items()
+            if record.get("status") == "ok"}
+
+
+class BatchWorker:
+    """1つのmayapyワーカープロセス（ウォッチドッグ付き）"""
+
+    # mayapyの起動（maya.standalone.initialize）を待つ時間（秒）
+    STARTUP_TIMEOUT = 600
+
+    def __init__(self, mayapy):
+        self.mayapy = mayapy
+        self.process = None
+        self.messages = None
+
+    def start(self):
+        """ワーカープロセスを起動して準備完了を待つ
+
+        Returns:
+            bool: 起動に成功した場合True
+        """
+        self.process = subprocess.Popen(
+            [self.mayapy, "-m", "sceneChecker.batch_worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=_worker_env(),
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        # 標準出力は別スレッドで読み、タイムアウト付きで待てるようにする
+        self.messages = queue.Queue()
+        reader = threading.Thread(target=self._read_messages, args=(self.process, self.messages), daemon=True)
+        reader.start()
+
+        try:
+            message = self.messages.get(timeout=self.STARTUP_TIMEOUT)
+        except queue.Empty:
+            message = None
+        if not message or message.get("status") != "ready":
+            self.kill()
+            return False
+        return True
+
+    @staticmethod
+    def _read_messages(process, messages):
+        """ワーカーの標準出力から結果行を読み取る（終了時にNoneを送る）"""
+        for line in process.stdout:
+            if line.startswith(RESULT_PREFIX):
+                try:
+                    messages.put(json.loads(line[len(RESULT_PREFIX):]))
+                except ValueError:
+                    pass
+        messages.put(None)
+
+    def is_alive(self):
+        """ワーカープロセスが動作中かどうか"""
+        return self.process is not None and self.process.poll() is None
+
+    def run(self, job, timeout=None):
+        """ジョブを送信して結果を待つ
+
+        Args:
+            job: ジョブ
+            timeout: 1シーンあたりのタイムアウト（秒、Noneの場合は無制限）
+                     超えた場合はハングとみなしてプロセスを強制終了する
+
+        Returns:
+            dict: ワーカーからの結果（異常終了・タイムアウトの場合はstatusが "crashed" / "timeout"）
+        """
+        try:
+            self.process.stdin.write(json.dumps(job) + "\n")
+            self.process.stdin.flush()
+            message = self.messages.get(timeout=timeout)
+        except (BrokenPipeError, OSError):
+            message = None
+        except queue.Empty:
+            self.kill()
+            return {"scene_file": job["scene_file"], "status": "timeout",
+                    "error": f"タイムアウトしました（{timeout}秒）"}
+
+        if message is None:
+            self.kill()
+            return {"scene_file": job["scene_file"], "status": "crashed",
+                    "error": "ワーカープロセスが異常終了しました"}
+        return message
+
+    def kill(self):
+        """ワーカープロセスを強制終了"""
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self.process = None
+
+    def stop(self):
+        """ワーカープロセスを終了"""
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=60)
+        except Exception:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+
+def batch_check_parallel(scene_files, config_name="bg_checks", output_dir=None, workers=None,
+                         mayapy=None, on_result=None, open_profile=None, timeout=None,
+                         manifest_path=None, retry_failed=False, results_jsonl=None, results_csv=None,
+                         results_db=None, sinks=None):
+    """複数のシーンファイルをmayapyワーカープロセスで並列にバッチチェック
+
+    各シーンはウォッチドッグ付きで実行され、タイムアウト・クラッシュしたワーカーは
+    次のシーンの前に再起動される。manifest_pathを指定すると完了したシーンを記録し、
+    中断後に同じマニフェストで再実行すると未完了のシーンから再開する
+
+    Args:
+        scene_files: チェックするシーンファイルのリスト
+        config_name: 使用する設定ファイル名（リストの場合はシーンを1回開いて設定ごとに出力）
+        output_dir: CSV出力先ディレクトリ（Noneの場合は各シーンと同じ場所）
+        workers: ワーカープロセス数（Noneの場合はCPUコア数）
+        mayapy: mayapyのパス（Noneの場合は自動検出）
+        on_result: シーンごとの結果を受け取るコールバック (message) -> None
+                   messageは "scene_file", "status", "output", "results", "error" を持つdict
+        open_profile: シーンオープンのプロファイル（Noneの場合はチェック項目から自動選択）
+        timeout: 1シーンあたりのタイムアウト（秒、Noneの場合は無制限）
+        manifest_path: 進捗マニフェスト（JSON Lines）のパス
+        retry_failed: マニフェストでエラー・タイムアウトになっているシーンを再実行するか
+        results_jsonl: 全シーンの結果を逐次書き出すJSON Linesのパス
+        results_csv: 全シーンの結果を逐次書き出す統合CSVのパス
+        results_db: 結果の履歴を蓄積するSQLiteデータベースのパス
+        sinks: 追加の結果シンク（write_scene/closeを持つオブジェクト）のリスト
+
+    Returns:
+        list: 出力されたCSVファイルパスのリスト（入力順、再開時は前回までの出力を含む）
+
+    Raises:
+        RuntimeError: 結果の処理（シンク・マニフェスト・on_result）やワーカーの起動で例外が発生したシーンがある場合
+                      （他のシーンの処理を続けた後に送出する。結果を保存できなかったシーンは
+                      マニフェストに記録されないため、再実行で再びチェックされる）
+    """
+    mayapy = mayapy or find_mayapy()
+    owned_sinks = open_result_sinks(results_jsonl, results_csv, results_db)
+    all_sinks = owned_sinks + list(sinks or [])
+    send_items = sinks_want_items(all_sinks)
+
+    manifest = load_manifest(manifest_path)
+    pending = set(pending_scene_files(scene_files, manifest, retry_failed))
+    outputs = manifest_outputs(manifest)
+    if len(pending) < len(scene_files):
+        print(f"マニフェストから再開します: 残り {len(pending)} / {len(scene_files)} シーン")
+
+    jobs = queue.Queue()
+    for scene_file in scene_files:
+        if scene_file not in pending:
+            continue
+        jobs.put({
+            "scene_file": scene_file,
+            "config_name": config_name,
+            "output_csv": scene_output_path(scene_file, output_dir),
+            "open_profile": open_profile,
+            "send_items": send_items,
+        })
+
+    workers = max(1, min(workers or os.cpu_count() or 1, jobs.qsize()))
+    lock = threading.Lock()
+    failures = []  # (シーンファイル, トレースバック)
+
+    def handle(job, message):
+        with lock:
+            # 結果を保存できた後にマニフェストへ記録する（失敗したシーンは再開時に再実行される）
+            write_to_sinks(all_sinks, job["scene_file"], config_name, message.get("results"),
+                           message.get("status"), message.get("error"))
+            append_manifest(manifest_path, {
+                "scene_file": job["scene_file"],
+                "status": message.get("status"),
+                "output": message.get("output"),
+                "error": message.get("error"),
+            })
+            if message.get("status") == "ok":
+                outputs[job["scene_file"]] = message.get("output")
+                print(f"✓ チェック完了: {job['scene_file']}")
+            else:
+                print(f"✗ エラー: {job['scene_file']} - {message.get('error', '')}")
+            if on_result:
+                on_result(message)
+
+    def work():
+        worker = BatchWorker(mayapy)
+        try:
+            while True:
+                try:
+                    job = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                # 1シーンの例外でスレッドが終了し、残りのジョブが処理されなくなるのを防ぐ
+                try:
+                    # クラッシュ・ハングで終了したワーカーは再起動する
+                    if not worker.is_alive() and not worker.start():
+                        message = {"scene_file": job["scene_file"], "status": "crashed",
+                                   "error": "ワーカープロセスを起動できませんでした"}
+                    else:
+                        message = worker.run(job, timeout)
+                    handle(job, message)
+                except Exception:
+                    error = traceback.format_exc()
+                    with lock:
+                        failures.append((job["scene_file"], error))
+                        print(f"✗ 結果の処理に失敗: {job['scene_file']}\n{error}")
+        finally:
+            worker.stop()
+
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        close_sinks(owned_sinks)
+
+    if failures:
+        raise RuntimeError(f"{len(failures)} シーンの処理に失敗しました: "
+                           + ", ".join(scene_file for scene_file, _ in failures))
+
+    output_files = []
+    for scene_file in scene_files:
+        output = outputs.get(scene_file)
+        if isinstance(output, dict):
+            output_files.extend(output.values())
+        elif output:
+            output_files.append(output)
+    return output_files
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Batch Worker
+batch_poolから起動されるmayapyワーカー
+
+標準入力から1行1ジョブのJSONを受け取り、run_batch_checkを実行して
+結果をRESULT_PREFIX付きのJSON行として標準出力に返す
+
+    mayapy -m sceneChecker.batch_worker
+"""
+
+import json
+import sys
+
+from .batch_pool import RESULT_PREFIX
+
+
+def summarize_results(results, include_items=False):
+    """チェック結果をプロセス間で送れる形式に変換（adjust_functionなどを除去）"""
+    summaries = []
+    for result in results:
+        summary = {
+            "name": result.get("name", ""),
+            "severity": result.get("severity", ""),
+            "count": result.get("count", 0),
+            "description": result.get("description", ""),
+            "elapsed": result.get("elapsed", 0.0),
+        }
+        if include_items:
+            summary["items"] = list(result.get("items", []))
+        summaries.append(summary)
+    return summaries
+
+
+def send(channel, message):
+    """コーディネーターに結果を送信"""
+    channel.write(RESULT_PREFIX + json.dumps(message, ensure_ascii=False) + "\n")
+    channel.flush()
+
+
+def process_job(job):
+    """1つのジョブを実行"""
+    from .batch import _run_batch_check
+
+    include_items = job.get("send_items", False)
+    try:
+        output, results = _run_batch_check(job["config_name"], job.get("output_csv"), job["scene_file"],
+                                           job.get("open_profile"))
+        return {
+            "scene_file": job["scene_file"],
+            "status": "ok",
+            "output": output,
+            "results": ({name: summarize_results(r, include_items) for name, r in results.items()}
+                        if isinstance(results, dict) else summarize_results(results, include_items)),
+        }
+    except Exception as e:
+        return {"scene_file": job["scene_file"], "status": "error", "error": str(e)}
+
+
+def main():
+    """ワーカーのメインループ"""
+    # Mayaやチェック処理のprint出力が結果行と混ざらないよう標準エラーに逃がす
+    channel = sys.stdout
+    sys.stdout = sys.stderr
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    send(channel, {"status": "ready"})
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                send(channel, process_job(json.loads(line)))
+    finally:
+        maya.standalone.uninitialize()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Check Runner
+チェックをMayaのイベントループ上で少しずつ実行し、実行中もMayaを操作できるようにする
+
+QTimerで短い時間枠（time_budget）ごとにSceneChecker.iter_checksを進め、
+時間枠を使い切ったらイベントループに制御を返す（ビューポートの更新・ESC・結果ウィンドウの操作が処理される）。
+チェックが完了するたびにresult_readyで結果を通知する
+"""
+
+import time
+
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+
+class CheckRunner(QtCore.QObject):
+    """時間枠ごとにチェックを進める実行器
+
+    1単位（メッシュ1つ分のチェックなど）は途中で中断できないため、
+    大きなメッシュでは1回の時間枠がtime_budgetを超えることがある
+    """
+
+    # 完了したチェックの結果のリスト（エラーがあったもののみ）
+    result_ready = QtCore.Signal(object)
+    # すべてのチェックが終了した（キャンセルされた場合はTrue）
+    finished = QtCore.Signal(bool)
+
+    def __init__(self, checker, selected_checks, progress_callback=None, scope=None, time_budget=0.05,
+                 parent=None):
+        """
+        Args:
+            checker: チェックを実行するSceneChecker
+            selected_checks: 選択されたチェック項目のリスト
+            progress_callback: プログレス更新用のコールバック関数 (current, total, message) -> bool
+                             Falseを返すとキャンセル
+            scope: チェック対象範囲（CheckScope、Noneの場合はシーン全体）
+            time_budget: 1回の時間枠（秒）
+        """
+        super(CheckRunner, self).__init__(parent)
+        self.checker = checker
+        self.time_budget = time_budget
+        self._steps = checker.iter_checks(selected_checks, progress_callback, scope)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    def start(self):
+        """実行を開始（すぐに戻り、チェックはイベントループ上で進む）"""
+        self._timer.start()
+
+    def cancel(self):
+        """実行をキャンセル（実行中の単位が終わった時点で停止）"""
+        self.checker.cancel()
+
+    def is_running(self):
+        """実行中かどうか"""
+        return self._steps is not None
+
+    def _run_slice(self):
+        """1つの時間枠の間チェックを進める"""
+        deadline = time.perf_counter() + self.time_budget
+        try:
+            # 読み取り結果は時間枠の中でのみ共有する（時間枠の間にシーンが変わりうる）
+            with self.checker.get_backend().caching():
+                while time.perf_counter() < deadline:
+                    results = next(self._steps)
+                    if results:
+                        self.result_ready.emit(results)
+        except StopIteration:
+            self._finish()
+            return
+        except Exception:
+            self._finish()
+            raise
+
+        # イベントループに制御を返してから次の時間枠を実行
+        self._timer.start()
+
+    def _finish(self):
+        self._steps.close()
+        self._steps = None
+        self.finished.emit(self.checker.cancelled)
@@ -4,62 +4,25 @@ Maya Scene Checker - Check Selector UI
 チェック項目選択ダイアログ
 """
 
-import json
-import os
+import inspect
 
 try:
     from PySide6 import QtWidgets, QtCore
 except ImportError:
     from PySide2 import QtWidgets, QtCore
 
+from .config import CHECK_PARAMETERS, load_check_config, get_available_configs
+from .scope import CheckScope, get_selection_targets
 
-def load_check_config(config_name="bg_checks"):
-    """チェック設定をJSONファイルから読み込む"""
-    config_dir = os.path.join(os.path.dirname(__file__), "configs")
-    config_path = os.path.join(config_dir, f"{config_name}.json")
 
-    if not os.path.exists(config_path):
-        # デフォルト設定
-        return {
-            "name": "Default Checks",
-            "description": "デフォルトのチェック項目",
-            "categories": {}
-        }
-
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"設定ファイルの読み込みに失敗: {e}")
-        return {
-            "name": "Default Checks",
-            "description": "デフォルトのチェック項目",
-            "categories": {}
-        }
-
-
-def get_available_configs():
-    """利用可能な設定ファイルのリストを取得"""
-    config_dir = os.path.join(os.path.dirname(__file__), "configs")
-    if not os.path.exists(config_dir):
-        return []
-
-    configs = []
-    for filename in os.listdir(config_dir):
-        if filename.endswith(".json"):
-            config_name = filename[:-5]  # .jsonを除去
-            try:
-                with open(os.path.join(config_dir, filename), "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    configs.append({
-                        "id": config_name,
-                        "name": config.get("name", config_name),
-                        "description": config.get("description", "")
-                    })
-            except:
-                pass
-
-    return configs
+# チェック範囲の選択肢（表示名, モード）
+SCOPE_MODES = [
+    ("シーン全体", CheckScope.SCENE),
+    ("選択オブジェクト", CheckScope.SELECTION),
+    ("階層", CheckScope.HIERARCHY),
+    ("オブジェクトセット", CheckScope.SET),
+    ("ネームスペース", CheckScope.NAMESPACE),
+]
 
 
 # 後方互換性のため、デフォルト定義を保持（使用されない）
@@ -237,20 +200,31 @@ class CheckCategoryWidget(QtWidgets.QWidget):
         selected = []
         for checkbox, item in zip(self.checkboxes, self.check_items):
             if checkbox.isChecked():
-                selected.append({
+                check = {
                     "category": self.category_name,
                     "name": item["name"],
                     "description": item["description"],
                     "severity": item.get("severity", "warning"),  # デフォルトはwarning
                     "function": item.get("function", "")
-                })
+                }
+                check.update((key, item[key]) for key in CHECK_PARAMETERS if key in item)
+                selected.append(check)
         return selected
 
 
+def _accepts_scope(callback):
+    """コールバックがscope引数を受け取るか（従来の1引数のコールバックには渡さない）"""
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "scope" or p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+
 class CheckSelectorUI(QtWidgets.QWidget):
     """チェック項目選択ウィンドウ"""
 
-    def __init__(self, config_name="bg_checks", parent=None, callback=None):
+    def __init__(self, config_name="bg_checks", parent=None, callback=None, scope=None):
         super(CheckSelectorUI, self).__init__(parent)
 
         self.setWindowTitle("Maya Scene Checker - チェック項目選択")
@@ -266,7 +240,8 @@ class CheckSelectorUI(QtWidgets.QWidget):
         self.selected_checks = []
         self.config_name = config_name
         self.config = load_check_config(config_name)
-        self.callback = callback  # チェック実行時のコールバック
+        self.callback = callback  # チェック実行時のコールバック (selected_checks[, scope=])
+        self.initial_scope = scope or CheckScope()
 
         self.setup_ui()
         self.apply_stylesheet()
@@ -294,6 +269,33 @@ class CheckSelectorUI(QtWidgets.QWidget):
 
         main_layout.addLayout(header_layout)
 
+        # チェック範囲
+        scope_layout = QtWidgets.QHBoxLayout()
+
+        scope_label = QtWidgets.QLabel("チェック範囲:")
+        scope_label.setStyleSheet("color: #B0B0B0; font-size: 12px;")
+        scope_layout.addWidget(scope_label)
+
+        self.scope_combo = QtWidgets.QComboBox()
+        self.scope_combo.setFixedWidth(160)
+        for label, mode in SCOPE_MODES:
+            self.scope_combo.addItem(label, mode)
+        self.scope_combo.setCurrentIndex(CheckScope.MODES.index(self.initial_scope.mode))
+        self.scope_combo.currentIndexChanged.connect(self.on_scope_mode_changed)
+        scope_layout.addWidget(self.scope_combo)
+
+        self.scope_targets_edit = QtWidgets.QLineEdit(", ".join(self.initial_scope.targets))
+        self.scope_targets_edit.setPlaceholderText("対象のノード / セット / ネームスペース（カンマ区切り）")
+        scope_layout.addWidget(self.scope_targets_edit, stretch=1)
+
+        self.scope_pick_btn = QtWidgets.QPushButton("選択から取得")
+        self.scope_pick_btn.setFixedSize(100, 28)
+        self.scope_pick_btn.clicked.connect(self.on_scope_pick_clicked)
+        scope_layout.addWidget(self.scope_pick_btn)
+
+        main_layout.addLayout(scope_layout)
+        self.on_scope_mode_changed()
+
         # スクロールエリア
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
@@ -361,6 +363,30 @@ class CheckSelectorUI(QtWidgets.QWidget):
 
         self.expand_all_btn.setText("すべて折りたたむ" if expand else "すべて展開")
 
+    def on_scope_mode_changed(self, index=None):
+        """チェック範囲の種類が変更された時"""
+        mode = self.scope_combo.currentData()
+        needs_targets = mode in [CheckScope.HIERARCHY, CheckScope.SET, CheckScope.NAMESPACE]
+        self.scope_targets_edit.setEnabled(needs_targets)
+        self.scope_pick_btn.setEnabled(needs_targets)
+
+    def on_scope_pick_clicked(self):
+        """現在の選択をチェック範囲のターゲットとして取得"""
+        try:
+            targets = get_selection_targets()
+        except Exception:
+            return
+        if self.scope_combo.currentData() == CheckScope.NAMESPACE:
+            # 選択ノードのネームスペースを取得
+            targets = sorted({t.split("|")[-1].rpartition(":")[0] for t in targets} - {""})
+        self.scope_targets_edit.setText(", ".join(targets))
+
+    def get_scope(self):
+        """選択されたチェック範囲を取得"""
+        mode = self.scope_combo.currentData()
+        targets = [t.strip() for t in self.scope_targets_edit.text().split(",") if t.strip()]
+        return CheckScope(mode, targets)
+
     def get_selected_checks(self):
         """選択されたすべてのチェック項目を取得"""
         all_selected = []
@@ -383,7 +409,10 @@ class CheckSelectorUI(QtWidgets.QWidget):
 
         # コールバックがあれば実行
         if self.callback:
-            self.callback(self.selected_checks)
+            if _accepts_scope(self.callback):
+                self.callback(self.selected_checks, scope=self.get_scope())
+            else:
+                self.callback(self.selected_checks)
 
         # ウィンドウを閉じる
         self.close()
@@ -4,100 +4,218 @@ Maya Scene Checker - Checker Logic
 チェックロジックの実装
 """
 
-import maya.cmds as cmds
+import contextlib
+import functools
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    # Maya外（スナップショットに対するチェック）では修正関数は使用できない
+    cmds = None
+
+from .backend import get_default_backend
+from .components import group_components_by_mesh, format_component_ranges
+from . import rules, topology
+from .plugins import get_check_registry
 
 
 # ========================================
 # Adjust関数（修正関数）
 # ========================================
 
+@contextlib.contextmanager
+def _batched_edit(chunk_name):
+    """1つのアンドゥチャンクにまとめ、ビューポート更新を停止して編集する"""
+    cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
+        cmds.refresh()
+
+
+def _batched_adjust(func):
+    """Adjust関数をアンドゥ1回で戻せるバッチ編集として実行するデコレーター"""
+    @functools.wraps(func)
+    def wrapper(items):
+        if not items:
+            return False
+        with _batched_edit(func.__name__):
+            return func(items)
+    return wrapper
+
+
+def _delete_components_per_mesh(items):
+    """コンポーネントをメッシュごとにまとめて削除"""
+    groups, _ = group_components_by_mesh(items)
+    for (mesh, comp_type), indices in groups.items():
+        cmds.delete(format_component_ranges(mesh, comp_type, indices))
+
+
+@_batched_adjust
 def adjust_lamina_faces(items):
     """ラミナフェースを削除"""
-    if items:
-        cmds.select(items)
-        cmds.delete()
-        return True
-    return False
+    _delete_components_per_mesh(items)
+    return True
 
 
+@_batched_adjust
 def adjust_zero_edge_length(items):
     """長さゼロのエッジをマージ"""
-    if items:
-        for edge in items:
-            try:
-                # エッジを構成する頂点を取得してマージ
-                vertices = cmds.polyListComponentConversion(edge, toVertex=True)
-                if vertices:
-                    cmds.polyMergeVertex(vertices, distance=0.001)
-            except:
-                pass
-        return True
-    return False
+    groups, _ = group_components_by_mesh(items)
+    for (mesh, comp_type), indices in groups.items():
+        try:
+            # メッシュ単位でエッジを構成する頂点を取得して1回でマージ
+            edges = format_component_ranges(mesh, comp_type, indices)
+            vertices = cmds.polyListComponentConversion(edges, toVertex=True)
+            if vertices:
+                cmds.polyMergeVertex(vertices, distance=0.001)
+        except:
+            pass
+    return True
 
 
+@_batched_adjust
 def adjust_ngons(items):
     """N-gonを三角形/四角形に分割"""
-    if items:
-        cmds.select(items)
-        cmds.polyTriangulate()
-        return True
-    return False
+    groups, _ = group_components_by_mesh(items)
+    for (mesh, comp_type), indices in groups.items():
+        cmds.polyTriangulate(format_component_ranges(mesh, comp_type, indices))
+    return True
 
 
+@_batched_adjust
 def adjust_zero_area_faces(items):
     """面積ゼロのフェースを削除"""
-    if items:
-        cmds.select(items)
-        cmds.delete()
-        return True
-    return False
+    _delete_components_per_mesh(items)
+    return True
 
 
+@_batched_adjust
 def adjust_non_frozen_transforms(items):
     """トランスフォームをフリーズ"""
-    if items:
-        cmds.select(items)
-        cmds.makeIdentity(apply=True, translate=True, rotate=True, scale=True)
-        return True
-    return False
+    cmds.makeIdentity(items, apply=True, translate=True, rotate=True, scale=True)
+    return True
 
 
+@_batched_adjust
 def adjust_negative_scale(items):
     """負のスケールを修正（ジオメトリを反転してスケールを正に）"""
-    if items:
-        for obj in items:
-            try:
-                # 負のスケール軸を検出
-                scale = cmds.getAttr(f"{obj}.scale")[0]
-                for i, s in enumerate(scale):
-                    if s < 0:
-                        # スケールを正にしてジオメトリを反転
-                        axis = ['X', 'Y', 'Z'][i]
-                        cmds.setAttr(f"{obj}.scale{axis}", abs(s))
-                        # メッシュのノーマルを反転
-                        shapes = cmds.listRelatives(obj, shapes=True, type="mesh")
-                        if shapes:
-                            cmds.polyNormal(shapes[0], normalMode=0, userNormalMode=0)
-            except:
-                pass
-        return True
-    return False
+    flip_shapes = []
+    for obj in items:
+        try:
+            scale = cmds.getAttr(f"{obj}.scale")[0]
+            negative_axes = sum(1 for s in scale if s < 0)
+            if not negative_axes:
+                continue
+            # スケールを正にして3軸まとめて設定
+            cmds.setAttr(f"{obj}.scale", *[abs(s) for s in scale])
+            # 負の軸が奇数個の場合のみノーマルの向きが反転する
+            if negative_axes % 2:
+                shapes = cmds.listRelatives(obj, shapes=True, type="mesh", fullPath=True)
+                if shapes:
+                    flip_shapes.append(shapes[0])
+        except:
+            pass
+
+    # メッシュのノーマルをまとめて反転
+    if flip_shapes:
+        cmds.polyNormal(flip_shapes, normalMode=0, userNormalMode=0)
+    return True
 
 
+@_batched_adjust
 def adjust_unused_influences(items):
     """未使用のインフルエンスを削除"""
-    if items:
-        for item in items:
-            try:
-                # "skinCluster -> influence" の形式から分離
-                parts = item.split(" -> ")
-                if len(parts) == 2:
-                    skin, influence = parts
-                    cmds.skinCluster(skin, edit=True, removeInfluence=influence)
-            except:
-                pass
-        return True
-    return False
+    # "skinCluster -> influence" の形式からskinClusterごとにまとめる
+    influences_by_skin = {}
+    for item in items:
+        parts = item.split(" -> ")
+        if len(parts) == 2:
+            skin, influence = parts
+            influences_by_skin.setdefault(skin, []).append(influence)
+
+    for skin, influences in influences_by_skin.items():
+        try:
+            cmds.skinCluster(skin, edit=True, removeInfluence=influences)
+        except:
+            pass
+    return True
+
+
+# ========================================
+# スコープ・バックエンド
+# ========================================
+
+def _backend(check_info):
+    """チェックで使用するシーンのバックエンド"""
+    return check_info.get("backend") or get_default_backend()
+
+
+def _ls(check_info, **kwargs):
+    """チェック対象のスコープ内でノードを列挙
+
+    check_infoに"scope_nodes"が設定されている場合はその範囲に限定し、
+    未設定の場合はシーン全体を対象とする
+    """
+    return _backend(check_info).ls(check_info.get("scope_nodes"), **kwargs)
+
+
+def _objects_without_cameras(check_info):
+    """カメラを除いたトランスフォームを取得"""
+    backend = _backend(check_info)
+    return [obj for obj in _ls(check_info, transforms=True, long=True)
+            if backend.node_type(obj) != "camera" and not backend.shapes(obj, "camera")]
+
+
+def _content_key(backend, mesh, find, args):
+    """判定結果を共有するキー（判定関数・引数・判定関数が読む配列のハッシュ）"""
+    digests = tuple(
+        backend.memo(("digest", mesh.name, field),
+                     lambda field=field: topology.array_digest(getattr(mesh, field), relative=field == "points"))
+        for field in topology.FINDER_FIELDS[find.__name__])
+    return (find.__name__,) + args + digests
+
+
+def _mesh_findings(check_info, find, *args):
+    """スコープ内のメッシュごとに判定関数を実行し、(メッシュ名, 判定結果) を順に返す
+
+    同じシェイプのインスタンス（DAGパス違い）は最初のパスの判定結果を読み取りなしで再利用し、
+    判定関数が読む配列の内容が同じメッシュ（複製・移動しただけのコピー）は判定を1回だけ行う。
+    判定結果はcaching()のブロック内でチェック間でも共有する（読み取れないメッシュは除外）
+    """
+    backend = _backend(check_info)
+    with backend.caching():
+        meshes = _ls(check_info, type="mesh", long=True)
+        findings_by_shape = {}
+        for mesh, identity in zip(meshes, backend.mesh_identities(meshes)):
+            if identity not in findings_by_shape:
+                try:
+                    data = backend.mesh(mesh)
+                except Exception:
+                    findings_by_shape[identity] = None
+                    continue
+                findings_by_shape[identity] = backend.memo(_content_key(backend, data, find, args),
+                                                           lambda: find(data, *args))
+            findings = findings_by_shape[identity]
+            if findings is not None:
+                yield mesh, findings
+
+
+def _skins(check_info):
+    """スコープ内のskinClusterのウェイトデータを取得（読み取れないものは除外）"""
+    backend = _backend(check_info)
+    skins = []
+    for skin in _ls(check_info, type="skinCluster"):
+        try:
+            skins.append(backend.skin(skin))
+        except Exception:
+            pass
+    return skins
 
 
 # ========================================
@@ -107,17 +225,11 @@ def adjust_unused_influences(items):
 def check_geometry_issues(check_info):
     """ジオメトリの問題をまとめてチェック"""
     results = []
-    meshes = cmds.ls(type="mesh", long=True)
 
     # Non-Manifold頂点
     non_manifold = []
-    for mesh in meshes:
-        cmds.select(mesh)
-        cmds.polySelectConstraint(mode=3, type=0x0001, nonmanifold=1)
-        vertices = cmds.ls(sl=True, flatten=True)
-        cmds.polySelectConstraint(disable=True)
-        if vertices:
-            non_manifold.extend(vertices)
+    for mesh, indices in _mesh_findings(check_info, topology.find_nonmanifold_vertices):
+        non_manifold.extend(f"{mesh}.vtx[{i}]" for i in indices)
 
     if non_manifold:
         results.append({
@@ -131,13 +243,8 @@ def check_geometry_issues(check_info):
 
     # Lamina Faces
     lamina = []
-    for mesh in meshes:
-        cmds.select(mesh)
-        cmds.polySelectConstraint(mode=3, type=0x0008, topology=2)
-        faces = cmds.ls(sl=True, flatten=True)
-        cmds.polySelectConstraint(disable=True)
-        if faces:
-            lamina.extend(faces)
+    for mesh, indices in _mesh_findings(check_info, topology.find_lamina_faces):
+        lamina.extend(f"{mesh}.f[{i}]" for i in indices)
 
     if lamina:
         results.append({
@@ -151,18 +258,9 @@ def check_geometry_issues(check_info):
 
     # Zero Edge Length
     zero_edges = []
-    for mesh in meshes:
-        try:
-            edges = cmds.polyListComponentConversion(mesh, toEdge=True)
-            if edges:
-                cmds.select(edges)
-                cmds.polySelectConstraint(mode=3, type=0x8000, length=1, lengthbound=(0, 0.0001))
-                edge_list = cmds.ls(sl=True, flatten=True)
-                cmds.polySelectConstraint(disable=True)
-                if edge_list:
-                    zero_edges.extend(edge_list)
-        except:
-            pass
+    tolerance = check_info.get("tolerance", topology.ZERO_TOLERANCE)
+    for mesh, indices in _mesh_findings(check_info, topology.find_zero_length_edges, tolerance):
+        zero_edges.extend(f"{mesh}.e[{i}]" for i in indices)
 
     if zero_edges:
         results.append({
@@ -179,19 +277,9 @@ def check_geometry_issues(check_info):
 
 def check_ngons(check_info):
     """N-gonをチェック"""
-    meshes = cmds.ls(type="mesh", long=True)
     ngons = []
-
-    for mesh in meshes:
-        try:
-            cmds.select(mesh)
-            cmds.polySelectConstraint(mode=3, type=0x0008, size=3)
-            faces = cmds.ls(sl=True, flatten=True)
-            cmds.polySelectConstraint(disable=True)
-            if faces:
-                ngons.extend(faces)
-        except:
-            pass
+    for mesh, indices in _mesh_findings(check_info, topology.find_ngons):
+        ngons.extend(f"{mesh}.f[{i}]" for i in indices)
 
     if ngons:
         return {
@@ -207,19 +295,10 @@ def check_ngons(check_info):
 
 def check_zero_area_faces(check_info):
     """面積ゼロのフェースをチェック"""
-    meshes = cmds.ls(type="mesh", long=True)
     zero_faces = []
-
-    for mesh in meshes:
-        try:
-            num_faces = cmds.polyEvaluate(mesh, face=True)
-            for i in range(num_faces):
-                face = f"{mesh}.f[{i}]"
-                area = cmds.polyEvaluate(face, faceArea=True)
-                if area < 0.0001:
-                    zero_faces.append(face)
-        except:
-            pass
+    tolerance = check_info.get("tolerance", topology.ZERO_TOLERANCE)
+    for mesh, indices in _mesh_findings(check_info, topology.find_zero_area_faces, tolerance):
+        zero_faces.extend(f"{mesh}.f[{i}]" for i in indices)
 
     if zero_faces:
         return {
@@ -237,22 +316,22 @@ def check_zero_area_faces(check_info):
 # テクスチャ・UVチェック
 # ========================================
 
+# UV Out of Rangeで報告するUVの最大数
+UV_RANGE_LIMIT = 50
+
+
 def check_uv_issues(check_info):
     """UVの問題をまとめてチェック"""
     results = []
-    meshes = cmds.ls(type="mesh", long=True)
+    backend = _backend(check_info)
 
     # Missing UVs
     missing_uvs = []
-    for mesh in meshes:
-        try:
-            uv_sets = cmds.polyUVSet(mesh, query=True, allUVSets=True)
-            if not uv_sets or len(uv_sets) == 0:
-                transform = cmds.listRelatives(mesh, parent=True, fullPath=True)
-                if transform:
-                    missing_uvs.append(transform[0])
-        except:
-            pass
+    for mesh, has_uvs in _mesh_findings(check_info, topology.has_uv_sets):
+        if not has_uvs:
+            transform = backend.parent(mesh)
+            if transform:
+                missing_uvs.append(transform)
 
     if missing_uvs:
         results.append({
@@ -265,19 +344,10 @@ def check_uv_issues(check_info):
 
     # UV Range (0-1範囲外)
     out_of_range = []
-    for mesh in meshes:
-        try:
-            uvs = cmds.polyListComponentConversion(mesh, toUV=True)
-            if uvs:
-                uvs_flat = cmds.ls(uvs, flatten=True)
-                for uv in uvs_flat:
-                    pos = cmds.polyEditUV(uv, query=True)
-                    if pos and (pos[0] < 0 or pos[0] > 1 or pos[1] < 0 or pos[1] > 1):
-                        out_of_range.append(uv)
-                        if len(out_of_range) >= 50:  # 最大50個まで
-                            break
-        except:
-            pass
+    for mesh, indices in _mesh_findings(check_info, topology.find_uvs_out_of_range, UV_RANGE_LIMIT):
+        out_of_range.extend(f"{mesh}.map[{i}]" for i in indices[:UV_RANGE_LIMIT - len(out_of_range)])
+        if len(out_of_range) >= UV_RANGE_LIMIT:
+            break
 
     if out_of_range:
         results.append({
@@ -285,25 +355,34 @@ def check_uv_issues(check_info):
             "count": len(out_of_range),
             "severity": "warning",
             "description": "0-1範囲外のUVが検出されました",
-            "items": out_of_range
+            "items": out_of_range,
+            "limit": UV_RANGE_LIMIT
         })
 
     return results
 
 
+# ファイルシステムの応答を待つチェック
+# run_checksではテクスチャパスをメインスレッドで取得し、判定をバックグラウンドスレッドで実行する
+IO_BOUND_CHECKS = ("check_missing_textures", "check_texture_sequences")
+
+
+def _texture_paths(check_info):
+    """fileノードとテクスチャパスの組を取得
+
+    check_infoに"texture_paths"が設定されている場合は取得済みのものを使用する
+    （バックグラウンドスレッドからはシーンを読まない）
+    """
+    if "texture_paths" in check_info:
+        return check_info["texture_paths"]
+    nodes = _ls(check_info, type="file")
+    paths = _backend(check_info).get_attrs(nodes, "fileTextureName")
+    return [(node, path) for node, path in zip(nodes, paths) if path is not None]
+
+
 def check_missing_textures(check_info):
     """テクスチャファイルが見つからないマテリアルをチェック"""
-    import os
-    missing = []
-
-    file_nodes = cmds.ls(type="file")
-    for node in file_nodes:
-        try:
-            texture_path = cmds.getAttr(f"{node}.fileTextureName")
-            if texture_path and not os.path.exists(texture_path):
-                missing.append(f"{node} -> {texture_path}")
-        except:
-            pass
+    missing = rules.find_missing_textures(_texture_paths(check_info))
 
     if missing:
         return {
@@ -318,23 +397,7 @@ def check_missing_textures(check_info):
 
 def check_texture_sequences(check_info):
     """テクスチャシーケンスの問題をチェック"""
-    import os
-    import re
-
-    sequence_issues = []
-    file_nodes = cmds.ls(type="file")
-
-    for node in file_nodes:
-        try:
-            texture_path = cmds.getAttr(f"{node}.fileTextureName")
-            if texture_path and "<" in texture_path:  # シーケンス記法
-                # フレーム番号のパターンを検出
-                pattern = re.sub(r'<.*?>', '*', texture_path)
-                directory = os.path.dirname(pattern)
-                if not os.path.exists(directory):
-                    sequence_issues.append(f"{node} -> {texture_path} (ディレクトリが見つかりません)")
-        except:
-            pass
+    sequence_issues = rules.find_sequence_issues(_texture_paths(check_info))
 
     if sequence_issues:
         return {
@@ -354,20 +417,11 @@ def check_texture_sequences(check_info):
 def check_naming_issues(check_info):
     """ネーミングの問題をまとめてチェック（汎用）"""
     results = []
-    all_objects = cmds.ls(transforms=True, long=True)
-
-    # カメラを除外
-    all_objects = [obj for obj in all_objects if cmds.nodeType(obj) != "camera" and not cmds.listRelatives(obj, shapes=True, type="camera")]
+    backend = _backend(check_info)
+    all_objects = _objects_without_cameras(check_info)
 
     # Default Names
-    default_names = []
-    default_patterns = ["pCube", "pSphere", "pCylinder", "pPlane", "pTorus", "polySurface", "group"]
-    for obj in all_objects:
-        short_name = obj.split("|")[-1]
-        for pattern in default_patterns:
-            if short_name.startswith(pattern):
-                default_names.append(obj)
-                break
+    default_names = rules.find_default_names(all_objects)
 
     if default_names:
         results.append({
@@ -380,16 +434,19 @@ def check_naming_issues(check_info):
         })
 
     # Duplicate Names
-    all_short_names = [obj.split("|")[-1] for obj in all_objects]
-    name_count = {}
-    for name in all_short_names:
-        name_count[name] = name_count.get(name, 0) + 1
+    all_short_names = [rules.short_name(obj) for obj in all_objects]
+    name_count = rules.count_short_names(all_objects)
 
     duplicate_names = []
-    for name, count in name_count.items():
-        if count > 1:
-            duplicates = cmds.ls(name, long=True)
-            duplicate_names.extend(duplicates)
+    if check_info.get("scope_nodes") is None:
+        for name, count in name_count.items():
+            if count > 1:
+                duplicate_names.extend(backend.same_name_nodes(name))
+    else:
+        # スコープ内のオブジェクトのみ、シーン全体の同名ノードと照合
+        for obj, name in zip(all_objects, all_short_names):
+            if name_count[name] > 1 or len(backend.same_name_nodes(name)) > 1:
+                duplicate_names.append(obj)
 
     if duplicate_names:
         results.append({
@@ -402,11 +459,7 @@ def check_naming_issues(check_info):
         })
 
     # Invalid Characters
-    invalid_chars = []
-    for obj in all_objects:
-        short_name = obj.split("|")[-1]
-        if any(c in short_name for c in [" ", ".", "-", ":", ";"]):
-            invalid_chars.append(obj)
+    invalid_chars = rules.find_invalid_names(all_objects)
 
     if invalid_chars:
         results.append({
@@ -429,22 +482,9 @@ def check_bg_naming_convention(check_info):
     - modelname: アルファベット1-10文字（例: building, tree）
     - id: 3桁の数字（例: 001, 099）
     """
-    import re
-
-    all_objects = cmds.ls(transforms=True, long=True)
-
-    # カメラを除外
-    all_objects = [obj for obj in all_objects if cmds.nodeType(obj) != "camera" and not cmds.listRelatives(obj, shapes=True, type="camera")]
-
-    invalid_names = []
-
-    # 正規表現パターン: {4文字アルファベット}_{1-10文字アルファベット}_{3桁数字}
-    pattern = re.compile(r'^[a-zA-Z]{4}_[a-zA-Z]{1,10}_\d{3}$')
+    all_objects = _objects_without_cameras(check_info)
 
-    for obj in all_objects:
-        short_name = obj.split("|")[-1]
-        if not pattern.match(short_name):
-            invalid_names.append(f"{obj} (期待形式: area_modelname_id)")
+    invalid_names = rules.find_bg_naming_violations(all_objects)
 
     if invalid_names:
         return {
@@ -465,25 +505,24 @@ def check_bg_naming_convention(check_info):
 def check_transform_issues(check_info):
     """トランスフォームの問題をまとめてチェック"""
     results = []
-    transforms = cmds.ls(type="transform", long=True)
+    backend = _backend(check_info)
+    transforms = _ls(check_info, type="transform", long=True)
+    scales = backend.get_attrs(transforms, "scale")
 
-    # Non-Frozen Transforms
+    # Non-Frozen Transforms（メッシュを持つトランスフォームのみチェック）
     non_frozen = []
-    for transform in transforms:
-        try:
-            # メッシュを持つトランスフォームのみチェック
-            shapes = cmds.listRelatives(transform, shapes=True, type="mesh")
-            if shapes:
-                translate = cmds.getAttr(f"{transform}.translate")[0]
-                rotate = cmds.getAttr(f"{transform}.rotate")[0]
-                scale = cmds.getAttr(f"{transform}.scale")[0]
-
-                if (abs(translate[0]) > 0.0001 or abs(translate[1]) > 0.0001 or abs(translate[2]) > 0.0001 or
-                    abs(rotate[0]) > 0.0001 or abs(rotate[1]) > 0.0001 or abs(rotate[2]) > 0.0001 or
-                    abs(scale[0] - 1.0) > 0.0001 or abs(scale[1] - 1.0) > 0.0001 or abs(scale[2] - 1.0) > 0.0001):
-                    non_frozen.append(transform)
-        except:
-            pass
+    mesh_transforms = [(transform, scale) for transform, scale in zip(transforms, scales)
+                       if backend.shapes(transform, "mesh")]
+    mesh_transform_names = [transform for transform, _ in mesh_transforms]
+    translates = backend.get_attrs(mesh_transform_names, "translate")
+    rotates = backend.get_attrs(mesh_transform_names, "rotate")
+    for (transform, scale), translate, rotate in zip(mesh_transforms, translates, rotates):
+        if translate is None or rotate is None or scale is None:
+            continue
+        if (any(abs(value) > 0.0001 for value in translate) or
+                any(abs(value) > 0.0001 for value in rotate) or
+                any(abs(value - 1.0) > 0.0001 for value in scale)):
+            non_frozen.append(transform)
 
     if non_frozen:
         results.append({
@@ -496,14 +535,8 @@ def check_transform_issues(check_info):
         })
 
     # Negative Scale
-    negative_scale = []
-    for transform in transforms:
-        try:
-            scale = cmds.getAttr(f"{transform}.scale")[0]
-            if scale[0] < 0 or scale[1] < 0 or scale[2] < 0:
-                negative_scale.append(transform)
-        except:
-            pass
+    negative_scale = [transform for transform, scale in zip(transforms, scales)
+                      if scale is not None and any(value < 0 for value in scale)]
 
     if negative_scale:
         results.append({
@@ -524,17 +557,12 @@ def check_transform_issues(check_info):
 
 def check_joint_orientation(check_info):
     """ジョイントの向きをチェック"""
-    joints = cmds.ls(type="joint", long=True)
-    bad_orientation = []
+    joints = _ls(check_info, type="joint", long=True)
+    orients = _backend(check_info).get_attrs(joints, "jointOrient")
 
-    for joint in joints:
-        try:
-            orient = cmds.getAttr(f"{joint}.jointOrient")[0]
-            # ジョイントの向きが極端な値でないかチェック
-            if abs(orient[0]) > 170 or abs(orient[1]) > 170 or abs(orient[2]) > 170:
-                bad_orientation.append(joint)
-        except:
-            pass
+    # ジョイントの向きが極端な値でないかチェック
+    bad_orientation = [joint for joint, orient in zip(joints, orients)
+                       if orient is not None and any(abs(value) > 170 for value in orient)]
 
     if bad_orientation:
         return {
@@ -550,51 +578,32 @@ def check_joint_orientation(check_info):
 def check_skin_weights(check_info):
     """スキンウェイトの問題をチェック"""
     results = []
-    skin_clusters = cmds.ls(type="skinCluster")
 
-    for skin in skin_clusters:
-        try:
-            # ウェイトが0の頂点を検出
-            geometry = cmds.skinCluster(skin, query=True, geometry=True)
-            if geometry:
-                vertices = cmds.ls(f"{geometry[0]}.vtx[*]", flatten=True)
-                zero_weight_verts = []
-
-                for vert in vertices:
-                    weights = cmds.skinPercent(skin, vert, query=True, value=True)
-                    total_weight = sum(weights)
-                    if abs(total_weight) < 0.0001:
-                        zero_weight_verts.append(vert)
-
-                if zero_weight_verts:
-                    results.append({
-                        "name": f"Zero Weight Vertices ({skin})",
-                        "count": len(zero_weight_verts),
-                        "severity": "error",
-                        "description": "ウェイトが0の頂点が検出されました",
-                        "items": zero_weight_verts
-                    })
-        except:
-            pass
+    # ウェイトが0の頂点を検出
+    for skin in _skins(check_info):
+        if not skin.geometry:
+            continue
+        zero_weight_verts = [f"{skin.geometry}.vtx[{i}]" for i in topology.find_zero_weight_vertices(skin)]
+
+        if zero_weight_verts:
+            results.append({
+                "name": f"Zero Weight Vertices ({skin.name})",
+                "count": len(zero_weight_verts),
+                "severity": "error",
+                "description": "ウェイトが0の頂点が検出されました",
+                "items": zero_weight_verts
+            })
 
     return results if results else None
 
 
 def check_unused_influences(check_info):
     """未使用のインフルエンスをチェック"""
-    skin_clusters = cmds.ls(type="skinCluster")
     unused = []
 
-    for skin in skin_clusters:
-        try:
-            influences = cmds.skinCluster(skin, query=True, influence=True)
-            for inf in influences:
-                # インフルエンスのウェイト合計が0に近いかチェック
-                weight_list = cmds.skinCluster(skin, query=True, weightedInfluence=inf)
-                if not weight_list or sum(weight_list) < 0.0001:
-                    unused.append(f"{skin} -> {inf}")
-        except:
-            pass
+    # インフルエンスのウェイト合計が0に近いかチェック
+    for skin in _skins(check_info):
+        unused.extend(f"{skin.name} -> {inf}" for inf in topology.find_unused_influences(skin))
 
     if unused:
         return {
@@ -610,17 +619,11 @@ def check_unused_influences(check_info):
 
 def check_animation_keys(check_info):
     """アニメーションキーの問題をチェック"""
-    anim_curves = cmds.ls(type="animCurve")
-    issues = []
+    anim_curves = _ls(check_info, type="animCurve")
+    key_counts = _backend(check_info).key_counts(anim_curves)
 
-    for curve in anim_curves:
-        try:
-            # キーの数をチェック
-            num_keys = cmds.keyframe(curve, query=True, keyframeCount=True)
-            if num_keys == 1:
-                issues.append(f"{curve} (キーが1つだけ)")
-        except:
-            pass
+    # キーの数をチェック
+    issues = [f"{curve} (キーが1つだけ)" for curve, num_keys in zip(anim_curves, key_counts) if num_keys == 1]
 
     if issues:
         return {
@@ -639,16 +642,10 @@ def check_animation_keys(check_info):
 
 def check_shader_issues(check_info):
     """シェーダーの問題をチェック（lambert1以外の不要なマテリアルを検出）"""
-    shaders = cmds.ls(materials=True)
-    issues = []
+    shaders = _ls(check_info, materials=True)
 
-    for shader in shaders:
-        try:
-            # lambert1以外のすべてのシェーダーを問題として検出
-            if shader != "lambert1":
-                issues.append(shader)
-        except:
-            pass
+    # lambert1以外のすべてのシェーダーを問題として検出
+    issues = rules.find_extra_materials(shaders)
 
     if issues:
         return {
@@ -665,50 +662,338 @@ def check_shader_issues(check_info):
 # SceneCheckerクラス
 # ========================================
 
+# ノード範囲に分割して実行できるチェック -> 分割するノードタイプ
+# （ノードごとに独立して判定し、結果の項目がノードの順に並ぶチェック）
+SPLITTABLE_CHECKS = {
+    "check_geometry_issues": "mesh",
+    "check_ngons": "mesh",
+    "check_zero_area_faces": "mesh",
+    "check_skin_weights": "skinCluster",
+    "check_unused_influences": "skinCluster",
+}
+
+
+# シーンの配列データを読むチェック -> 読むメッシュの配列（skinClusterのチェックはウェイト）
+# （並列実行で共有メモリに配置するデータの絞り込みに使用。topology.FINDER_FIELDS）
+CHECK_MESH_FINDERS = {
+    "check_geometry_issues": ("find_nonmanifold_vertices", "find_lamina_faces", "find_zero_length_edges"),
+    "check_ngons": ("find_ngons",),
+    "check_zero_area_faces": ("find_zero_area_faces",),
+    "check_uv_issues": ("has_uv_sets", "find_uvs_out_of_range"),
+}
+SKIN_CHECKS = ("check_skin_weights", "check_unused_influences")
+
+
+def mesh_fields_for_check(function_name):
+    """チェック関数が読むメッシュの配列名のset"""
+    return {field for finder in CHECK_MESH_FINDERS.get(function_name, ())
+            for field in topology.FINDER_FIELDS[finder]}
+
+
+# 参照ファイルごとに1つのインスタンスだけ実行できるチェック -> 対象のノードタイプ
+# （ノードごとに独立して判定し、結果の項目がノード名で始まるチェック。references.ReferenceMap.plan）
+REFERENCE_CHECKS = dict(SPLITTABLE_CHECKS, check_uv_issues="mesh", check_joint_orientation="joint")
+
+
+def _merge_order(sequences):
+    """複数の部分列の順序を保つように名前を並べる（順序が決まらない場合は最初に現れた順）"""
+    first_seen = {}
+    successors = {}
+    indegree = {}
+    for sequence in sequences:
+        for name in sequence:
+            first_seen.setdefault(name, len(first_seen))
+            indegree.setdefault(name, 0)
+        for before, after in zip(sequence, sequence[1:]):
+            if after not in successors.setdefault(before, set()):
+                successors[before].add(after)
+                indegree[after] += 1
+
+    ready = sorted((name for name, degree in indegree.items() if degree == 0), key=first_seen.get)
+    order = []
+    while ready:
+        name = ready.pop(0)
+        order.append(name)
+        for after in successors.get(name, ()):
+            indegree[after] -= 1
+            if indegree[after] == 0:
+                ready.append(after)
+        ready.sort(key=first_seen.get)
+    return order
+
+
+def merge_check_results(task_results):
+    """ノード範囲に分割して実行したチェックの結果を名前ごとに結合
+
+    項目はノード範囲の順に連結し、件数・実行時間は合計する
+
+    Args:
+        task_results: ノード範囲ごとの結果のリスト（run_checkの戻り値）のリスト
+
+    Returns:
+        list: 結合した結果のリスト
+    """
+    if len(task_results) == 1:
+        return task_results[0]
+
+    merged = {}
+    for results in task_results:
+        for result in results:
+            existing = merged.get(result["name"])
+            if existing is None:
+                merged[result["name"]] = dict(result, items=list(result["items"]))
+            else:
+                existing["items"].extend(result["items"])
+                existing["count"] += result["count"]
+                existing["elapsed"] += result.get("elapsed", 0.0)
+
+    order = _merge_order([[result["name"] for result in results] for results in task_results])
+    return [merged[name] for name in order]
+
+
+def plan_reference_check(check, backend):
+    """同じファイルを参照するリファレンスの重複を除いてチェック項目を絞り込む
+
+    REFERENCE_CHECKSのチェックは、編集のないリファレンスのノードを参照ファイルごとに
+    1つのインスタンスに絞り込んだscope_nodesで実行し、結果をFanOut.applyで他のインスタンスに展開する
+
+    Returns:
+        tuple: (実行するチェック項目, FanOut（展開がない場合はNone）)
+    """
+    node_type = REFERENCE_CHECKS.get(check.get("function"))
+    if node_type is None or check.get("references_planned"):
+        return check, None
+    reference_map = backend.reference_map()
+    if not reference_map.has_duplicates():
+        return check, None
+
+    nodes = backend.ls(check.get("scope_nodes"), type=node_type, long=True)
+    nodes, fan_out = reference_map.plan(nodes)
+    # 分割したタスク（ワーカープロセスを含む）では絞り込みをやり直さない
+    check = dict(check, references_planned=True)
+    if fan_out is not None:
+        check["scope_nodes"] = nodes
+    return check, fan_out
+
+
+def get_check_function(function_name):
+    """関数名からチェック関数を取得（存在しない場合はNone）"""
+    # グローバル関数から取得
+    check_function = globals().get(function_name)
+    if callable(check_function):
+        return check_function
+    # プラグインのチェック関数（初めて要求された時に提供元のモジュールを読み込む）
+    return get_check_registry().load(function_name)
+
+
+def is_builtin_check(function_name):
+    """このモジュールのチェック関数かどうか（プラグインのチェックはFalse）"""
+    return function_name.startswith("check_") and callable(globals().get(function_name))
+
+
+def is_check_function(function_name):
+    """チェック関数として存在するか（プラグインのモジュールは読み込まない）"""
+    return callable(globals().get(function_name)) or get_check_registry().has(function_name)
+
+
+def _call_check_function(function_name, check_info):
+    """チェック関数を実行し、エラーがあった結果のリストを返す"""
+    check_function = get_check_function(function_name)
+    if check_function is None:
+        return []
+
+    start = time.perf_counter()
+    results = check_function(check_info)
+    elapsed = time.perf_counter() - start
+
+    # 複数の結果を返す場合に対応
+    if not isinstance(results, list):
+        results = [results]
+    # エラーがある場合のみ返す
+    results = [result for result in results if result and result.get("count", 0) > 0]
+    for result in results:
+        result["elapsed"] = elapsed  # チェック関数の実行時間（秒）
+    return results
+
+
 class SceneChecker:
     """シーンチェッカークラス"""
 
-    def __init__(self):
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: シーンの読み取りに使用するバックエンド（Noneの場合はデフォルト）
+        """
         self.results = []
         self.cancelled = False
+        self.backend = backend
+
+    def get_backend(self):
+        """チェックで使用するバックエンド"""
+        return self.backend or get_default_backend()
 
-    def run_checks(self, selected_checks, progress_callback=None):
+    def run_checks(self, selected_checks, progress_callback=None, scope=None, workers=None):
         """選択されたチェックを実行
 
         Args:
             selected_checks: 選択されたチェック項目のリスト
             progress_callback: プログレス更新用のコールバック関数 (current, total, message) -> bool
                              Falseを返すとキャンセル
+            scope: チェック対象範囲（CheckScope、Noneの場合はシーン全体）
+            workers: 2以上の場合、抽出したシーンデータに対してワーカープロセスで並列に実行
+                     （parallel.run_checks_parallel、NumPyがない場合・作業量が少ない場合は順番に実行）
+        """
+        self.results = []
+        self.cancelled = False
+        total = len(selected_checks)
+
+        # スコープ内のノードを一度だけ解決して各チェックに渡す
+        scope_nodes = scope.resolve() if scope else None
+        if scope_nodes is not None:
+            selected_checks = [dict(check, scope_nodes=scope_nodes) for check in selected_checks]
+
+        # 複数のチェックが読むメッシュ・スキンは実行中に1回だけ読み取る
+        with self.get_backend().caching():
+            if workers and workers > 1:
+                from . import parallel
+                if parallel.is_available():
+                    results = parallel.run_checks_parallel(self, selected_checks, workers, progress_callback)
+                    # 作業量が少ない場合は順番に実行する
+                    if results is not None:
+                        self.results = results
+                        return self.results
+
+            # ファイルシステムを待つチェックは先にテクスチャパスを取得してバックグラウンドスレッドで開始し、
+            # その間にシーンを読むチェックをメインスレッドで進める
+            executor = ThreadPoolExecutor(max_workers=len(IO_BOUND_CHECKS))
+            try:
+                futures = self._start_io_bound_checks(executor, selected_checks)
+                check_results = []  # チェック順の結果（バックグラウンドのチェックはFuture）
+                for i, check in enumerate(selected_checks):
+                    # キャンセルチェック
+                    if self.cancelled:
+                        break
+
+                    # プログレス更新
+                    if progress_callback:
+                        check_name = check.get("name", "Unknown")
+                        if not progress_callback(i + 1, total, f"チェック中: {check_name}"):
+                            self.cancelled = True
+                            break
+
+                    check_results.append(futures[i] if i in futures else self.run_check(check))
+
+                # バックグラウンドのチェックの完了を待って結果をチェック順に結合
+                for results in check_results:
+                    if isinstance(results, Future):
+                        if self.cancelled and not results.done():
+                            continue
+                        results = results.result()
+                    self.results.extend(results)
+            finally:
+                # キャンセル時は実行中のスレッドの完了を待たない
+                executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+
+        return self.results
+
+    def iter_checks(self, selected_checks, progress_callback=None, scope=None, chunk_size=1):
+        """チェックを細かい単位に分けて順に実行するジェネレーター
+
+        SPLITTABLE_CHECKSのチェックはchunk_size個のノードごとに分けて実行し、1単位ごとに制御を返す。
+        UIのイベントループから少しずつ進めるために使用する（check_runner.CheckRunner）。
+        制御を返している間にAdjustなどでシーンが変わりうるため、メッシュ・スキンの読み取り結果は
+        1単位の中でのみ再利用する（呼び出し側がcaching()のブロック内で進める場合はその範囲で再利用する）
+
+        Args:
+            selected_checks: 選択されたチェック項目のリスト
+            progress_callback: プログレス更新用のコールバック関数 (current, total, message) -> bool
+                             Falseを返すとキャンセル
+            scope: チェック対象範囲（CheckScope、Noneの場合はシーン全体）
+            chunk_size: 1単位で実行するノード数
+
+        Yields:
+            list or None: チェックのすべての単位が完了した時はその結果（エラーがあったもののみ）、
+                          途中の単位の後はNone
         """
         self.results = []
         self.cancelled = False
         total = len(selected_checks)
 
+        scope_nodes = scope.resolve() if scope else None
+        if scope_nodes is not None:
+            selected_checks = [dict(check, scope_nodes=scope_nodes) for check in selected_checks]
+
+        backend = self.get_backend()
         for i, check in enumerate(selected_checks):
-            # キャンセルチェック
             if self.cancelled:
-                break
+                return
 
-            # プログレス更新
             if progress_callback:
                 check_name = check.get("name", "Unknown")
                 if not progress_callback(i + 1, total, f"チェック中: {check_name}"):
                     self.cancelled = True
-                    break
-
-            # グローバル関数から取得
-            check_function = globals().get(check["function"])
-            if check_function and callable(check_function):
-                results = check_function(check)
-                # 複数の結果を返す場合に対応
-                if isinstance(results, list):
-                    for result in results:
-                        if result and result.get("count", 0) > 0:  # エラーがある場合のみ追加
-                            self.results.append(result)
-                elif results and results.get("count", 0) > 0:  # エラーがある場合のみ追加
-                    self.results.append(results)
+                    return
+
+            with backend.caching():
+                check, fan_out = plan_reference_check(check, backend)
+                tasks = self._split_check(check, chunk_size)
+            task_results = []
+            for task in tasks:
+                with backend.caching():
+                    task_results.append(self.run_check(task))
+                if len(task_results) < len(tasks):
+                    yield None
+                    if self.cancelled:
+                        return
+
+            results = merge_check_results(task_results)
+            if fan_out is not None:
+                results = fan_out.apply(results)
+            self.results.extend(results)
+            yield results
+
+    def _split_check(self, check, chunk_size):
+        """SPLITTABLE_CHECKSのチェックをchunk_size個のノードごとに分割"""
+        node_type = SPLITTABLE_CHECKS.get(check.get("function"))
+        if node_type is None:
+            return [check]
+        nodes = self.get_backend().ls(check.get("scope_nodes"), type=node_type, long=True)
+        if len(nodes) <= chunk_size:
+            return [check]
+        return [dict(check, scope_nodes=nodes[start:start + chunk_size]) for start in range(0, len(nodes), chunk_size)]
+
+    def _start_io_bound_checks(self, executor, selected_checks):
+        """IO_BOUND_CHECKSをバックグラウンドスレッドで開始
+
+        テクスチャパスの取得（シーンの読み取り）はメインスレッドで1回だけ行い、
+        スレッドではファイルの存在確認のみを行う
+
+        Returns:
+            dict: {チェックの位置: Future}
+        """
+        io_checks = [(i, check) for i, check in enumerate(selected_checks)
+                     if check.get("function") in IO_BOUND_CHECKS]
+        if not io_checks:
+            return {}
 
-        return self.results
+        texture_paths = _texture_paths(dict(io_checks[0][1], backend=self.get_backend()))
+        return {i: executor.submit(_call_check_function, check["function"], dict(check, texture_paths=texture_paths))
+                for i, check in io_checks}
+
+    def run_check(self, check):
+        """1つのチェックを実行
+
+        Args:
+            check: チェック項目
+
+        Returns:
+            list: エラーがあったチェック結果のリスト
+        """
+        backend = self.get_backend()
+        with backend.caching():
+            check, fan_out = plan_reference_check(check, backend)
+            results = _call_check_function(check.get("function", ""), dict(check, backend=backend))
+            return fan_out.apply(results) if fan_out is not None else results
 
     def cancel(self):
         """チェックをキャンセル"""
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Components
+コンポーネント文字列（"mesh.f[12]" など）の解析・グループ化
+Mayaに依存しない純粋なPython処理
+"""
+
+import re
+
+
+# "node.f[12]" / "node.vtx[3:8]" / "node.map[5]" 形式
+_COMPONENT_PATTERN = re.compile(r'^(?P<node>[^\[\]]+)\.(?P<type>[A-Za-z]+)\[(?P<start>\d+)(?::(?P<end>\d+))?\]$')
+
+
+def parse_component(item):
+    """コンポーネント文字列を分解
+
+    Args:
+        item: "pCube1.f[3]" または "pCube1.f[3:7]" 形式の文字列
+
+    Returns:
+        tuple: (ノード名, コンポーネント種別, 開始インデックス, 終了インデックス)
+               コンポーネントでない場合はNone
+    """
+    match = _COMPONENT_PATTERN.match(item)
+    if not match:
+        return None
+    start = int(match.group("start"))
+    end = int(match.group("end")) if match.group("end") else start
+    return match.group("node"), match.group("type"), start, end
+
+
+def split_item(item):
+    """エラー項目をノードとコンポーネント（詳細）に分解
+
+    "pCube1.f[3]" -> ("pCube1", "f[3]")
+    "skinCluster1 -> joint1" -> ("skinCluster1", "joint1")
+    "|obj (期待形式: ...)" -> ("|obj", "(期待形式: ...)")
+
+    Returns:
+        tuple: (ノード, コンポーネント/詳細)
+    """
+    match = _COMPONENT_PATTERN.match(item)
+    if match:
+        return match.group("node"), item[len(match.group("node")) + 1:]
+    if " -> " in item:
+        node, _, detail = item.partition(" -> ")
+        return node, detail
+    if " (" in item:
+        node, _, detail = item.partition(" (")
+        return node, "(" + detail
+    return item, ""
+
+
+def group_components_by_mesh(items):
+    """コンポーネントをメッシュ・種別ごとにグループ化
+
+    Args:
+        items: コンポーネント文字列のリスト
+
+    Returns:
+        tuple: ({(ノード名, 種別): インデックスのset}, コンポーネント以外の項目のリスト)
+    """
+    groups = {}
+    others = []
+    for item in items:
+        parsed = parse_component(item)
+        if parsed is None:
+            others.append(item)
+            continue
+        node, comp_type, start, end = parsed
+        indices = groups.setdefault((node, comp_type), set())
+        if start == end:
+            indices.add(start)
+        else:
+            indices.update(range(start, end + 1))
+    return groups, others
+
+
+def compress_indices(indices):
+    """インデックスを連続範囲にまとめる
+
+    Args:
+        indices: インデックスのiterable
+
+    Returns:
+        list: (開始, 終了) のリスト
+    """
+    ranges = []
+    for index in sorted(set(indices)):
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    return [(start, end) for start, end in ranges]
+
+
+def format_component_ranges(node, comp_type, indices):
+    """インデックスを範囲形式のコンポーネント文字列に変換
+
+    Returns:
+        list: ["mesh.f[0:99]", "mesh.f[120]"] 形式のリスト
+    """
+    components = []
+    for start, end in compress_indices(indices):
+        if start == end:
+            components.append(f"{node}.{comp_type}[{start}]")
+        else:
+            components.append(f"{node}.{comp_type}[{start}:{end}]")
+    return components
+
+
+def compress_components(items):
+    """コンポーネントのリストをメッシュごとの範囲形式にまとめる
+
+    Args:
+        items: コンポーネント文字列のリスト
+
+    Returns:
+        list: 範囲形式にまとめたコンポーネント + コンポーネント以外の項目
+    """
+    groups, others = group_components_by_mesh(items)
+    compressed = []
+    for (node, comp_type), indices in groups.items():
+        compressed.extend(format_component_ranges(node, comp_type, indices))
+    return compressed + others
+
+
+def selection_targets(items):
+    """エラー項目をMayaで選択できる形式に変換
+
+    コンポーネントはメッシュごとの範囲形式にまとめ、それ以外の項目
+    （"skinCluster1 -> joint1"、"curve1 (キーが1つだけ)" など）はノード名にする
+
+    Args:
+        items: エラー項目の文字列のリスト
+
+    Returns:
+        list: cmds.selectに渡すリスト（重複なし）
+    """
+    groups, others = group_components_by_mesh(items)
+    targets = []
+    for (node, comp_type), indices in groups.items():
+        targets.extend(format_component_ranges(node, comp_type, indices))
+    seen = set()
+    for item in others:
+        node = split_item(item)[0]
+        if node not in seen:
+            seen.add(node)
+            targets.append(node)
+    return targets
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Config
+チェック設定（configs/*.json）の読み込み
+Qt・Mayaに依存しない
+"""
+
+import copy
+import json
+import os
+
+
+# チェック項目に指定できる追加パラメータ（チェック関数にそのまま渡す）
+#   tolerance: 長さ・面積をゼロとみなす閾値（check_geometry_issues, check_zero_area_faces）
+CHECK_PARAMETERS = ["tolerance"]
+
+
+# 重要度として指定できる値
+SEVERITIES = ["error", "warning"]
+
+CONFIG_DIR = os.path.join(os.path.dirname(__file__), "configs")
+
+
+def _default_config():
+    """設定ファイルがない・読み込めない場合のデフォルト設定"""
+    return {
+        "name": "Default Checks",
+        "description": "デフォルトのチェック項目",
+        "categories": {}
+    }
+
+
+def validate_config(config):
+    """設定の内容を検証
+
+    チェック項目ごとに、必須キー（name, description, function, severity）があるか、
+    functionがチェック関数として存在するか（プラグインは宣言のみ確認し、読み込まない）、
+    severityが有効な値かを確認する
+
+    Returns:
+        list: 問題の説明のリスト（問題がない場合は空）
+    """
+    from .checker import is_check_function
+
+    issues = []
+    categories = config.get("categories")
+    if not isinstance(categories, dict):
+        return ["categoriesがありません"]
+
+    for category_name, check_items in categories.items():
+        for position, item in enumerate(check_items):
+            label = f"{category_name}/{item.get('name', position)}"
+            for key in ("name", "description", "function", "severity"):
+                if key not in item:
+                    issues.append(f"{label}: {key}が指定されていません")
+            function = item.get("function")
+            if function and not is_check_function(function):
+                issues.append(f"{label}: チェック関数 {function} が見つかりません")
+            severity = item.get("severity")
+            if severity and severity not in SEVERITIES:
+                issues.append(f"{label}: 不明な重要度 {severity}")
+    return issues
+
+
+class ConfigService:
+    """チェック設定の読み込み
+
+    解析済みの設定をファイルのパスと更新時刻（mtime・サイズ）でキャッシュし、
+    読み込み時に一度だけ検証する。ファイルが更新された場合のみ読み込み直す
+    """
+
+    def __init__(self, config_dir=CONFIG_DIR):
+        self.config_dir = config_dir
+        self._entries = {}  # パス -> (更新時刻, 設定, 検証結果)
+
+    def _path(self, config_name):
+        return os.path.join(self.config_dir, f"{config_name}.json")
+
+    def _entry(self, path, stat=None):
+        """キャッシュを確認して設定を読み込む（ファイルがない場合はNone）"""
+        try:
+            stat = stat or os.stat(path)
+        except OSError:
+            self._entries.pop(path, None)
+            return None
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            issues = validate_config(config)
+        except Exception as e:
+            print(f"設定ファイルの読み込みに失敗: {e}")
+            config = None
+            issues = [str(e)]
+        for issue in issues if config is not None else []:
+            print(f"設定ファイルの問題 ({os.path.basename(path)}): {issue}")
+
+        entry = (stamp, config, issues)
+        self._entries[path] = entry
+        return entry
+
+    def load(self, config_name="bg_checks"):
+        """チェック設定を取得
+
+        呼び出し側が変更してもキャッシュに影響しないよう、キャッシュした設定のコピーを返す
+
+        Returns:
+            dict: 設定（ファイルがない・読み込めない場合はデフォルト設定）
+        """
+        entry = self._entry(self._path(config_name))
+        if entry is None or entry[1] is None:
+            return _default_config()
+        return copy.deepcopy(entry[1])
+
+    def issues(self, config_name):
+        """設定の検証結果（問題の説明のリスト）"""
+        entry = self._entry(self._path(config_name))
+        return list(entry[2]) if entry else []
+
+    def list_configs(self):
+        """利用可能な設定の一覧
+
+        ディレクトリの走査とファイルの更新時刻の確認のみで、変更のないファイルは解析しない
+
+        Returns:
+            list: {"id", "name", "description"} のリスト（id順）
+        """
+        if not os.path.isdir(self.config_dir):
+            return []
+
+        configs = []
+        for dir_entry in os.scandir(self.config_dir):
+            if not dir_entry.name.endswith(".json"):
+                continue
+            config_name = dir_entry.name[:-5]  # .jsonを除去
+            entry = self._entry(dir_entry.path, dir_entry.stat())
+            if entry is None or entry[1] is None:
+                continue
+            config = entry[1]
+            configs.append({
+                "id": config_name,
+                "name": config.get("name", config_name),
+                "description": config.get("description", "")
+            })
+        return sorted(configs, key=lambda config: config["id"])
+
+    def clear(self):
+        """キャッシュを破棄"""
+        self._entries.clear()
+
+
+_config_service = ConfigService()
+
+
+def get_config_service():
+    """デフォルトの設定サービス"""
+    return _config_service
+
+
+def load_check_config(config_name="bg_checks"):
+    """チェック設定をJSONファイルから読み込む（ConfigServiceでキャッシュ）"""
+    return _config_service.load(config_name)
+
+
+def get_available_configs():
+    """利用可能な設定ファイルのリストを取得"""
+    return _config_service.list_configs()
+
+
+def collect_config_checks(config):
+    """設定に含まれるすべてのチェック項目を取得"""
+    all_checks = []
+    for category_name, check_items in config.get("categories", {}).items():
+        for item in check_items:
+            check = {
+                "category": category_name,
+                "name": item["name"],
+                "description": item["description"],
+                "severity": item.get("severity", "warning"),  # デフォルトはwarning
+                "function": item.get("function", "")
+            }
+            check.update((key, item[key]) for key in CHECK_PARAMETERS if key in item)
+            all_checks.append(check)
+    return all_checks
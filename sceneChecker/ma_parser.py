@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Maya ASCII Parser
+Mayaを使わずに.maファイルからノード・親子関係・文字列アトリビュートを抽出するストリーミングパーサー
+
+メッシュの頂点配列など数値のsetAttrは読み飛ばし、ノード名・タイプと文字列値のみを保持する
+リファレンス先のノードはファイルに含まれないため対象外（シーンローカルのノードのみ）
+"""
+
+import shlex
+
+
+# 親を指定せずに作成されるDAGノードのタイプ
+DAG_ROOT_TYPES = {
+    "transform", "joint", "lodGroup", "ikHandle", "clusterHandle", "place3dTexture",
+    "imagePlane", "nucleus", "hairSystem", "pfxHair", "gpuCache", "assemblyReference",
+    "parentConstraint", "pointConstraint", "orientConstraint", "scaleConstraint",
+    "aimConstraint", "poleVectorConstraint",
+}
+
+# ls(transforms=True) に含まれるトランスフォーム派生のタイプ
+TRANSFORM_TYPES = {
+    "transform", "joint", "lodGroup", "ikHandle", "ikEffector", "clusterHandle",
+    "place3dTexture", "parentConstraint", "pointConstraint", "orientConstraint",
+    "scaleConstraint", "aimConstraint", "poleVectorConstraint", "nucleus",
+    "hairSystem", "pfxHair", "gpuCache", "assemblyReference",
+}
+
+# ls(materials=True) に含まれるマテリアルのタイプ
+MATERIAL_TYPES = {
+    "lambert", "blinn", "phong", "phongE", "anisotropic", "layeredShader", "rampShader",
+    "shadingMap", "surfaceShader", "useBackground", "hairTubeShader", "oceanShader",
+    "standardSurface", "openPBRSurface", "StingrayPBS", "aiStandardSurface",
+    "aiStandardHair", "aiFlat", "aiLambert", "aiLayerShader", "aiMixShader",
+    "aiToon", "aiUtility", "aiCarPaint", "aiShadowMatte", "aiWireframe",
+    "RedshiftMaterial", "RedshiftStandardMaterial", "VRayMtl", "PxrSurface", "PxrDisney",
+}
+
+# 文字列アトリビュートの短縮名 -> 正式名
+ATTRIBUTE_ALIASES = {
+    "ftn": "fileTextureName",
+    "cfnp": "computedFileTextureNamePattern",
+    "fn": "fileName",
+}
+
+# 引数を取るcreateNode/setAttrのフラグ
+_CREATE_NODE_ARG_FLAGS = {"-n", "-name", "-p", "-parent", "-uid"}
+_SET_ATTR_ARG_FLAGS = {"-s", "-size", "-k", "-keyable", "-l", "-lock", "-cb", "-channelBox",
+                       "-type", "-typ", "-c", "-clamp"}
+
+
+class MayaAsciiScene:
+    """.maファイルから抽出したシーンデータ"""
+
+    def __init__(self, path):
+        self.path = path
+        self.nodes = {}          # ロングネーム -> ノードタイプ
+        self.parents = {}        # ロングネーム -> 親のロングネーム
+        self.child_nodes = {}    # ロングネーム -> 子のロングネームのリスト
+        self.string_attrs = {}   # (ロングネーム, アトリビュート名) -> 文字列値
+        self.references = []     # {"file", "namespace", "reference_node"} のリスト
+        self._by_short_name = {}
+
+    def nodes_of_type(self, node_types):
+        """指定タイプのノードをロングネームで取得"""
+        return [node for node, node_type in self.nodes.items() if node_type in node_types]
+
+    def transforms(self):
+        """トランスフォーム派生のノードを取得"""
+        return self.nodes_of_type(TRANSFORM_TYPES)
+
+    def materials(self):
+        """マテリアルノードを取得"""
+        return self.nodes_of_type(MATERIAL_TYPES)
+
+    def children(self, node):
+        """直下の子ノードを取得"""
+        return self.child_nodes.get(node, [])
+
+    def get_string_attr(self, node, attr):
+        """文字列アトリビュートの値を取得"""
+        return self.string_attrs.get((node, attr))
+
+    def resolve(self, name):
+        """ファイル内のノード名（ショートネーム/パス）をロングネームに解決"""
+        name = name.lstrip(":")
+        if name in self.nodes:
+            return name
+        candidates = self._by_short_name.get(name.split("|")[-1], [])
+        if "|" in name:
+            suffix = "|" + name.lstrip("|")
+            candidates = [c for c in candidates if c.endswith(suffix)]
+        # 同名の場合は直前に作成されたノード
+        return candidates[-1] if candidates else None
+
+    def add_node(self, node_type, name, parent=None):
+        """ノードを追加してロングネームを返す"""
+        if parent is not None:
+            parent_long = self.resolve(parent) or "|" + parent.lstrip("|")
+            long_name = f"{parent_long}|{name}"
+            self.parents[long_name] = parent_long
+            self.child_nodes.setdefault(parent_long, []).append(long_name)
+        elif node_type in DAG_ROOT_TYPES:
+            long_name = f"|{name}"
+        else:
+            long_name = name
+
+        self.nodes[long_name] = node_type
+        self._by_short_name.setdefault(name, []).append(long_name)
+        return long_name
+
+
+def iter_statements(lines):
+    """.maの行から1コマンドずつ文字列を取り出す
+
+    数値データのsetAttr（メッシュ頂点など）はバッファに溜めずに読み飛ばす
+    """
+    buffer = []
+    skipping = False
+    in_string = False
+
+    for line in lines:
+        if not buffer and not skipping:
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith("//"):
+                continue
+            # 文字列型以外のsetAttrは読み飛ばす
+            if stripped.startswith("setAttr") and '"string"' not in line:
+                skipping = True
+
+        # エスケープされていない引用符の数で文字列の内側かどうかを追跡
+        quotes = line.count('"') - line.count('\\"')
+        if quotes % 2:
+            in_string = not in_string
+
+        if not skipping:
+            buffer.append(line)
+
+        if not in_string and line.rstrip().endswith(";"):
+            if skipping:
+                skipping = False
+            else:
+                yield "".join(buffer).strip()
+                buffer = []
+
+
+def _split(statement):
+    """コマンド文字列をトークンに分割"""
+    try:
+        return shlex.split(statement.rstrip(";"), posix=True)
+    except ValueError:
+        return []
+
+
+def _parse_create_node(scene, tokens):
+    """createNodeコマンドを解析してノードを追加"""
+    if len(tokens) < 2:
+        return None
+    node_type = tokens[1]
+    name = None
+    parent = None
+    i = 2
+    while i < len(tokens):
+        token = tokens[i]
+        if token in _CREATE_NODE_ARG_FLAGS and i + 1 < len(tokens):
+            if token in ("-n", "-name"):
+                name = tokens[i + 1]
+            elif token in ("-p", "-parent"):
+                parent = tokens[i + 1]
+            i += 2
+        else:
+            i += 1
+    if not name:
+        return None
+    return scene.add_node(node_type, name, parent)
+
+
+def _parse_set_attr(scene, tokens, current):
+    """文字列型のsetAttrコマンドを解析"""
+    attr = None
+    attr_type = None
+    values = []
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        if token.startswith("-") and attr is None or token in ("-type", "-typ"):
+            if token in _SET_ATTR_ARG_FLAGS and i + 1 < len(tokens):
+                if token in ("-type", "-typ"):
+                    attr_type = tokens[i + 1]
+                i += 2
+            else:
+                i += 1
+            continue
+        if attr is None:
+            attr = token
+        else:
+            values.append(token)
+        i += 1
+
+    if attr_type != "string" or not attr or not values:
+        return
+
+    if attr.startswith("."):
+        node = current
+        attr_name = attr[1:]
+    else:
+        node_name, _, attr_name = attr.partition(".")
+        node = scene.resolve(node_name)
+    if node is None:
+        return
+
+    attr_name = ATTRIBUTE_ALIASES.get(attr_name, attr_name)
+    scene.string_attrs[(node, attr_name)] = values[-1]
+
+
+def _parse_file_reference(scene, tokens):
+    """fileコマンドからリファレンス情報を取得"""
+    if "-rdi" not in tokens and "-r" not in tokens:
+        return
+    namespace = None
+    reference_node = None
+    for i, token in enumerate(tokens[:-1]):
+        if token in ("-ns", "-namespace"):
+            namespace = tokens[i + 1]
+        elif token in ("-rfn", "-referenceNode"):
+            reference_node = tokens[i + 1]
+    if any(ref["reference_node"] == reference_node for ref in scene.references):
+        return
+    scene.references.append({"file": tokens[-1], "namespace": namespace, "reference_node": reference_node})
+
+
+def parse_maya_ascii(path):
+    """.maファイルをストリーミングで解析
+
+    Args:
+        path: .maファイルのパス
+
+    Returns:
+        MayaAsciiScene: 抽出したシーンデータ
+    """
+    scene = MayaAsciiScene(path)
+    current = None
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for statement in iter_statements(f):
+            command = statement.split(None, 1)[0]
+            if command == "createNode":
+                current = _parse_create_node(scene, _split(statement))
+            elif command == "setAttr":
+                _parse_set_attr(scene, _split(statement), current)
+            elif command == "select":
+                tokens = _split(statement)
+                # select -ne :time1; で既存ノードが編集対象になる
+                if "-ne" in tokens or "-noExpand" in tokens:
+                    current = scene.resolve(tokens[-1]) or tokens[-1].lstrip(":")
+            elif command == "file":
+                _parse_file_reference(scene, _split(statement))
+
+    return scene
@@ -12,6 +12,7 @@ except ImportError:
 from .check_selector import CheckSelectorUI
 from .ui import SceneCheckerUI
 from .checker import SceneChecker
+from .check_runner import CheckRunner
 from .progress_dialog import ProgressDialog
 
 
@@ -32,17 +33,65 @@ def get_maya_main_window():
             return None
 
 
-def run_scene_checker(config_name="bg_checks"):
+def _show_cancelled_message(parent):
+    """キャンセルされたことを通知"""
+    msg = QtWidgets.QMessageBox(parent)
+    msg.setWindowTitle("情報")
+    msg.setText("チェックがキャンセルされました")
+    msg.setIcon(QtWidgets.QMessageBox.Icon.Information)
+    msg.exec()
+
+
+def _run_checks_non_blocking(selected_checks, scope, maya_main):
+    """チェックをイベントループ上で少しずつ実行し、結果を随時ウィンドウに追加する"""
+    global _scene_checker_ui, _check_runner
+
+    # 結果ウィンドウを先に表示（モードレス、parentなしで完全独立）
+    result_ui = SceneCheckerUI(parent=None)
+    result_ui.show()
+
+    # 実行中もMayaを操作できるようにモードレスで表示
+    progress = ProgressDialog("シーンチェック実行中", parent=maya_main, modal=False)
+    progress.show()
+
+    runner = CheckRunner(SceneChecker(), selected_checks, progress.update_progress, scope, parent=result_ui)
+    runner.result_ready.connect(result_ui.add_results)
+
+    def on_finished(cancelled):
+        progress.close()
+        if cancelled:
+            _show_cancelled_message(result_ui)
+
+    runner.finished.connect(on_finished)
+    progress.cancel_requested.connect(runner.cancel)
+    # 結果ウィンドウを閉じたら実行も止める
+    result_ui.destroyed.connect(runner.cancel)
+    result_ui.destroyed.connect(progress.close)
+    runner.start()
+
+    # グローバル変数として保持
+    _scene_checker_ui = result_ui
+    _check_runner = runner
+
+
+def run_scene_checker(config_name="bg_checks", scope=None, blocking=True):
     """シーンチェッカーを実行
 
     Args:
         config_name: 使用する設定ファイル名（デフォルト: "bg_checks"）
+        scope: チェック範囲の初期値（CheckScope、Noneの場合はシーン全体）
+        blocking: Falseの場合、チェックを短い時間枠ごとに実行してMayaを操作可能なままにし、
+                  結果は完了したチェックから順に結果ウィンドウに追加する
     """
     # Mayaのメインウィンドウを取得
     maya_main = get_maya_main_window()
 
-    def on_checks_selected(selected_checks):
+    def on_checks_selected(selected_checks, scope=None):
         """チェック項目が選択された時のコールバック"""
+        if not blocking:
+            _run_checks_non_blocking(selected_checks, scope, maya_main)
+            return
+
         # プログレスダイアログを表示
         progress = ProgressDialog("シーンチェック実行中", parent=maya_main)
         progress.show()
@@ -53,33 +102,21 @@ def run_scene_checker(config_name="bg_checks"):
         def progress_callback(current, total, message):
             return progress.update_progress(current, total, message)
 
-        results = checker.run_checks(selected_checks, progress_callback)
+        results = checker.run_checks(selected_checks, progress_callback, scope)
 
         # プログレスダイアログを閉じる
         progress.close()
 
         # キャンセルされた場合
         if checker.cancelled:
-            msg = QtWidgets.QMessageBox(maya_main)
-            msg.setWindowTitle("情報")
-            msg.setText("チェックがキャンセルされました")
-            msg.setIcon(QtWidgets.QMessageBox.Icon.Information)
-            msg.exec()
+            _show_cancelled_message(maya_main)
             return
 
         # 結果ウィンドウを表示（モードレス、parentなしで完全独立）
         result_ui = SceneCheckerUI(parent=None)
 
         # 結果を追加
-        for result_data in results:
-            result_ui.add_check_result(
-                result_data["name"],
-                result_data["count"],
-                result_data["severity"],
-                result_data["description"],
-                result_data["items"],
-                result_data.get("adjust_function")
-            )
+        result_ui.add_results(results)
 
         result_ui.show()
 
@@ -88,7 +125,8 @@ def run_scene_checker(config_name="bg_checks"):
         _scene_checker_ui = result_ui
 
     # チェック項目選択ウィンドウを表示（モードレス）
-    selector = CheckSelectorUI(config_name=config_name, parent=maya_main, callback=on_checks_selected)
+    selector = CheckSelectorUI(config_name=config_name, parent=maya_main, callback=on_checks_selected,
+                               scope=scope)
     selector.show()
 
     # グローバル変数として保持
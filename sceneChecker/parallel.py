@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Parallel Checks
+抽出済みのシーンデータに対するチェックをプロセスプールで並列実行
+
+Maya APIはメインスレッドからしか呼べないため、メッシュ・スキンウェイトなどの読み取りは
+メインスレッドで行い、配列を共有メモリ（multiprocessing.shared_memory）に配置する。
+ワーカープロセスは共有メモリのビューからSnapshotBackendを組み立て、
+Mayaに依存しないチェック関数を実行する（配列はプロセス間でコピーされない）。
+
+メッシュ・skinCluster単位で判定するチェックはノードを分割して複数のワーカーに割り振り、
+結果は同じ名前ごとに結合して設定ファイルのチェック順に並べる。
+共有メモリには選択されたチェックがスコープ内で読むノード・配列だけを配置し、
+ワーカーの起動のコストに見合わない作業量の場合は並列実行しない。NumPyが必要
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from multiprocessing import shared_memory
+except ImportError:
+    np = None
+
+from .backend import SnapshotBackend
+from .batch_pool import find_mayapy
+from .checker import (CHECK_MESH_FINDERS, SKIN_CHECKS, SPLITTABLE_CHECKS, SceneChecker, is_builtin_check,
+                      merge_check_results, mesh_fields_for_check, plan_reference_check)
+from .snapshot import ARRAY_FILES, as_snapshot_array, empty_snapshot_array, snapshot_from_arrays, write_snapshot
+
+
+# 分割するノードタイプ -> 分割の重みに使う配列
+SPLIT_WEIGHTS = {
+    "mesh": "face_vertices",
+    "skinCluster": "weights",
+}
+
+# 並列実行する最小の作業量（共有メモリに置くメッシュのフェース頂点数とスキンウェイト数の合計）
+# これより少ない場合はワーカーの起動のほうが長くかかるため、順番に実行する
+MIN_PARALLEL_WORK = 1000000
+
+# ワーカープロセス内のスナップショット（_init_workerで設定）
+_worker_backend = None
+_worker_blocks = []
+
+
+def is_available():
+    """並列実行が使用できるかどうか"""
+    return np is not None
+
+
+class _SharedArrayWriter:
+    """共有メモリへの配列の書き出し
+
+    write_snapshotのwriterとして使用する。closeで配列ごとに共有メモリを確保してコピーする
+    """
+
+    def __init__(self):
+        self.chunks = {key: [] for key in ARRAY_FILES}
+        self.lengths = {key: 0 for key in ARRAY_FILES}
+        self.blocks = {}
+
+    def append(self, key, values):
+        """配列を追加し、(開始行, 終了行) を返す"""
+        array = as_snapshot_array(key, values)
+        self.chunks[key].append(array)
+        start = self.lengths[key]
+        self.lengths[key] += len(array)
+        return [start, self.lengths[key]]
+
+    def close(self):
+        for key, chunks in self.chunks.items():
+            if not self.lengths[key]:
+                continue
+            array = np.concatenate(chunks)
+            block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            self.blocks[key] = (block, array.dtype.str, array.shape)
+        self.chunks = {key: [] for key in ARRAY_FILES}
+
+    def descriptors(self):
+        """ワーカーに渡す {配列名: (共有メモリ名, dtype, shape)}"""
+        return {key: (block.name, dtype, shape) for key, (block, dtype, shape) in self.blocks.items()}
+
+    def release(self):
+        """共有メモリを解放"""
+        for block, _, _ in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+
+def _init_worker(index, descriptors):
+    """ワーカープロセスの初期化: 共有メモリのビューからスナップショットを組み立てる"""
+    global _worker_backend
+    arrays = {}
+    for key in ARRAY_FILES:
+        if key not in descriptors:
+            arrays[key] = empty_snapshot_array(key)
+            continue
+        name, dtype, shape = descriptors[key]
+        # spawnで起動したワーカーはメインプロセスのresource_trackerを共有するため、
+        # 接続による登録は重複するだけで、解放（unlink）はメインプロセスが行う
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    _worker_backend = snapshot_from_arrays(index, arrays)
+
+
+def _run_task(check):
+    """ワーカープロセスで1つのチェック（または分割したその一部）を実行"""
+    return SceneChecker(_worker_backend).run_check(check)
+
+
+def _pool_context():
+    """ワーカープロセスの起動方法
+
+    Mayaの実行ファイルはPythonインタープリタとして起動できないため、
+    Mayaのセッション内ではmayapyをワーカーに使用する
+    """
+    context = multiprocessing.get_context("spawn")
+    exe_name = os.path.basename(sys.executable or "").lower()
+    if exe_name.startswith("maya") and not exe_name.startswith("mayapy"):
+        context.set_executable(find_mayapy())
+    return context
+
+
+def _node_weight(index, node, array_key):
+    """分割の重み（ノードの配列の長さ）"""
+    entry = index["meshes"].get(node) or index["skins"].get(node)
+    if not entry:
+        return 1
+    start, end = entry[array_key]
+    return max(1, end - start)
+
+
+def _snapshot_contents(checks, backend):
+    """チェックが読むデータ（共有メモリに置くメッシュ・配列名・skinCluster）
+
+    スコープ（scope_nodes）内で、選択されたチェックが読むノードと配列だけを対象にする。
+    どのデータを読むか分からないチェック（プラグイン）がある場合はシーン全体
+
+    Returns:
+        tuple: (メッシュのリスト, 配列名のset, skinClusterのリスト)（シーン全体の場合はすべてNone）
+    """
+    meshes = {}
+    mesh_fields = set()
+    skins = {}
+    for check in checks:
+        function_name = check.get("function", "")
+        if function_name in CHECK_MESH_FINDERS:
+            meshes.update(dict.fromkeys(backend.ls(check.get("scope_nodes"), type="mesh", long=True)))
+            mesh_fields |= mesh_fields_for_check(function_name)
+        elif function_name in SKIN_CHECKS:
+            skins.update(dict.fromkeys(backend.ls(check.get("scope_nodes"), type="skinCluster")))
+        elif not is_builtin_check(function_name):
+            return None, None, None
+    return list(meshes), mesh_fields, list(skins)
+
+
+def _work_size(backend, meshes, skins):
+    """並列実行する作業量（メッシュのフェース頂点数とスキンウェイト数の合計）
+
+    読み取ったデータはrun_checksのcaching()で保持され、順番に実行する場合もそのまま使われる
+    """
+    size = 0
+    shapes = set()
+    for mesh, identity in zip(meshes, backend.mesh_identities(meshes)):
+        if identity in shapes:
+            continue
+        shapes.add(identity)
+        try:
+            size += len(backend.mesh(mesh).face_vertices)
+        except Exception:
+            pass
+    for skin in skins:
+        try:
+            size += len(backend.skin(skin).weights)
+        except Exception:
+            pass
+    return size
+
+
+def _split_check(check, index, backend, workers):
+    """チェックをワーカーに割り振るタスクに分割
+
+    SPLITTABLE_CHECKSのチェックはスコープ内の対象ノードを、配列の長さがほぼ均等になるように
+    連続した範囲に分割する（ノードの順序を保つため、結合した項目は直列実行と同じ順になる）
+    """
+    node_type = SPLITTABLE_CHECKS.get(check.get("function"))
+    if node_type is None or workers < 2:
+        return [check]
+    array_key = SPLIT_WEIGHTS[node_type]
+    nodes = backend.ls(check.get("scope_nodes"), type=node_type, long=True)
+    if len(nodes) < 2:
+        return [check]
+
+    weights = [_node_weight(index, node, array_key) for node in nodes]
+    target = sum(weights) / workers
+    tasks = []
+    chunk = []
+    chunk_weight = 0
+    for node, weight in zip(nodes, weights):
+        chunk.append(node)
+        chunk_weight += weight
+        if chunk_weight >= target and len(tasks) < workers - 1:
+            tasks.append(dict(check, scope_nodes=chunk))
+            chunk = []
+            chunk_weight = 0
+    if chunk:
+        tasks.append(dict(check, scope_nodes=chunk))
+    return tasks
+
+
+def run_checks_parallel(checker, selected_checks, workers, progress_callback=None):
+    """抽出したシーンデータに対してチェックをプロセスプールで実行
+
+    Args:
+        checker: 実行中のSceneChecker（バックエンドの取得とキャンセルの判定に使用）
+        selected_checks: チェック項目のリスト（スコープはscope_nodesで指定済み）
+        workers: ワーカープロセス数
+        progress_callback: プログレス更新用のコールバック関数 (current, total, message) -> bool
+                         Falseを返すとキャンセル
+
+    Returns:
+        list: エラーがあったチェック結果のリスト（チェック項目の順）
+              作業量がMIN_PARALLEL_WORKより少ない場合はNone（呼び出し側で順番に実行する）
+    """
+    if np is None:
+        raise ImportError("チェックの並列実行にはNumPyが必要です")
+
+    backend = checker.get_backend()
+    # リファレンスの重複はメインプロセスで除き、結合した結果を展開する
+    plans = [plan_reference_check(check, backend) for check in selected_checks]
+    meshes, mesh_fields, skins = _snapshot_contents([check for check, _ in plans], backend)
+    if meshes is not None and _work_size(backend, meshes, skins) < MIN_PARALLEL_WORK:
+        return None
+
+    # メインスレッドでチェックが読むシーンデータを抽出して共有メモリに配置
+    writer = _SharedArrayWriter()
+    index = write_snapshot(backend, writer, meshes, mesh_fields, skins)
+    try:
+        # タスクの分割に使うノード表（配列は含まない）
+        table = SnapshotBackend(index["nodes"], index["parents"], index["type_members"], {}, {}, {}, {})
+        tasks = [_split_check(check, index, table, workers) for check, _ in plans]
+
+        results = []
+        total = len(selected_checks)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(), initializer=_init_worker,
+                                 initargs=(index, writer.descriptors())) as executor:
+            futures = [[executor.submit(_run_task, task) for task in check_tasks] for check_tasks in tasks]
+            try:
+                # 設定ファイルの順に結果を受け取る
+                for i, ((check, fan_out), check_futures) in enumerate(zip(plans, futures)):
+                    if checker.cancelled:
+                        break
+                    if progress_callback:
+                        check_name = check.get("name", "Unknown")
+                        if not progress_callback(i + 1, total, f"チェック中: {check_name}"):
+                            checker.cancelled = True
+                            break
+                    check_results = merge_check_results([future.result() for future in check_futures])
+                    results.extend(fan_out.apply(check_results) if fan_out is not None else check_results)
+            finally:
+                for check_futures in futures:
+                    for future in check_futures:
+                        future.cancel()
+        return results
+    finally:
+        writer.release()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Check Plugins
+スタジオ独自のチェック関数（プロバイダ）の検出と遅延読み込み
+Qt・Mayaに依存しない
+
+プロバイダのチェック関数はマニフェスト（またはエントリーポイント）で宣言し、検出時には
+モジュールを読み込まない。設定ファイルが参照したチェック関数が初めて要求された時に、
+そのプロバイダのモジュールだけを読み込む
+
+プラグインディレクトリ（環境変数 SCENE_CHECKER_PLUGIN_PATH に os.pathsep 区切りで指定、
+またはadd_plugin_dir）:
+
+    studio_checks/
+        scene_checker_plugin.json
+        lighting_checks.py
+
+    scene_checker_plugin.json:
+    {
+        "providers": [
+            {"module": "lighting_checks", "functions": ["check_light_names", "check_light_links"]}
+        ]
+    }
+
+エントリーポイント（グループ "scene_checker.checks"、名前がチェック関数名）:
+
+    [project.entry-points."scene_checker.checks"]
+    check_light_names = "studio_checks.lighting:check_light_names"
+"""
+
+import importlib
+import json
+import os
+import sys
+
+
+# プラグインディレクトリを指定する環境変数
+PLUGIN_PATH_ENV = "SCENE_CHECKER_PLUGIN_PATH"
+
+# プラグインディレクトリのマニフェストのファイル名
+MANIFEST_NAME = "scene_checker_plugin.json"
+
+# チェック関数を提供するエントリーポイントのグループ
+ENTRY_POINT_GROUP = "scene_checker.checks"
+
+
+def plugin_dirs_from_env():
+    """環境変数で指定されたプラグインディレクトリのリスト"""
+    return [path for path in os.environ.get(PLUGIN_PATH_ENV, "").split(os.pathsep) if path]
+
+
+class _Provider:
+    """チェック関数の提供元（読み込みは初回のload時）"""
+
+    def __init__(self, source, module=None, plugin_dir=None, entry_point=None):
+        self.source = source
+        self.module = module
+        self.plugin_dir = plugin_dir
+        self.entry_point = entry_point
+
+    def load(self, function_name):
+        """チェック関数を読み込む"""
+        if self.entry_point is not None:
+            return self.entry_point.load()
+        if self.plugin_dir not in sys.path:
+            sys.path.append(self.plugin_dir)
+        return getattr(importlib.import_module(self.module), function_name, None)
+
+
+class CheckRegistry:
+    """プラグインのチェック関数の表（関数名 -> 提供元）
+
+    マニフェスト・エントリーポイントの走査は最初の参照時に一度だけ行い、
+    各チェック関数はloadで初めて要求された時にモジュールを読み込む
+    """
+
+    def __init__(self, plugin_dirs=None, entry_point_group=ENTRY_POINT_GROUP):
+        """
+        Args:
+            plugin_dirs: プラグインディレクトリのリスト（Noneの場合は環境変数から取得）
+            entry_point_group: エントリーポイントのグループ（Noneの場合はエントリーポイントを使用しない）
+        """
+        self.plugin_dirs = list(plugin_dirs) if plugin_dirs is not None else plugin_dirs_from_env()
+        self.entry_point_group = entry_point_group
+        self._providers = None
+        self._functions = {}  # 関数名 -> 読み込み済みの関数（読み込めなかった場合はNone）
+
+    def _add_provider(self, function_name, provider):
+        existing = self._providers.get(function_name)
+        if existing is not None:
+            print(f"チェック関数 {function_name} が複数のプラグインで定義されています"
+                  f"（{existing.source} を使用、{provider.source} は無視）")
+            return
+        self._providers[function_name] = provider
+
+    def _read_manifest(self, plugin_dir):
+        path = os.path.join(plugin_dir, MANIFEST_NAME)
+        if not os.path.isfile(path):
+            print(f"プラグインのマニフェストがありません: {path}")
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"プラグインのマニフェストの読み込みに失敗 ({path}): {e}")
+            return
+        for provider in manifest.get("providers", []):
+            module = provider.get("module")
+            if not module:
+                print(f"プラグインのマニフェストの問題 ({path}): moduleが指定されていません")
+                continue
+            for function_name in provider.get("functions", []):
+                self._add_provider(function_name, _Provider(f"{path} ({module})", module, plugin_dir))
+
+    def _read_entry_points(self):
+        # importlib.metadataはインストール済みパッケージを走査するため、必要になるまで読み込まない
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=self.entry_point_group):
+            self._add_provider(entry_point.name,
+                               _Provider(f"entry point {entry_point.value}", entry_point=entry_point))
+
+    def providers(self):
+        """{関数名: 提供元}（初回のみマニフェスト・エントリーポイントを走査）"""
+        if self._providers is None:
+            self._providers = {}
+            for plugin_dir in self.plugin_dirs:
+                self._read_manifest(plugin_dir)
+            if self.entry_point_group:
+                self._read_entry_points()
+        return self._providers
+
+    def has(self, function_name):
+        """チェック関数が宣言されているか（モジュールは読み込まない）"""
+        return function_name in self.providers()
+
+    def function_names(self):
+        """宣言されているチェック関数名のリスト"""
+        return sorted(self.providers())
+
+    def load(self, function_name):
+        """チェック関数を取得（初回のみ提供元のモジュールを読み込む）
+
+        Returns:
+            callable or None: チェック関数（宣言されていない・読み込めない場合はNone）
+        """
+        if function_name in self._functions:
+            return self._functions[function_name]
+
+        provider = self.providers().get(function_name)
+        if provider is None:
+            return None
+        try:
+            function = provider.load(function_name)
+        except Exception as e:
+            print(f"チェック関数 {function_name} の読み込みに失敗 ({provider.source}): {e}")
+            function = None
+        if function is not None and not callable(function):
+            print(f"チェック関数 {function_name} が関数ではありません ({provider.source})")
+            function = None
+        self._functions[function_name] = function
+        return function
+
+    def add_plugin_dir(self, plugin_dir):
+        """プラグインディレクトリを追加（次の参照時に走査し直す）"""
+        if plugin_dir not in self.plugin_dirs:
+            self.plugin_dirs.append(plugin_dir)
+            self._providers = None
+
+
+_check_registry = None
+
+
+def get_check_registry():
+    """デフォルトのチェック関数の表"""
+    global _check_registry
+    if _check_registry is None:
+        _check_registry = CheckRegistry()
+    return _check_registry
+
+
+def add_plugin_dir(plugin_dir):
+    """プラグインディレクトリを追加
+
+    子プロセス（並列実行・バッチのmayapyワーカー）にも引き継がれるよう環境変数にも追加する
+    """
+    from .config import get_config_service
+
+    plugin_dir = os.path.abspath(plugin_dir)
+    get_check_registry().add_plugin_dir(plugin_dir)
+    # キャッシュ済みの設定の検証結果（チェック関数が見つからない）を破棄
+    get_config_service().clear()
+    paths = plugin_dirs_from_env()
+    if plugin_dir not in paths:
+        os.environ[PLUGIN_PATH_ENV] = os.pathsep.join(paths + [plugin_dir])
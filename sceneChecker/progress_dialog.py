@@ -13,12 +13,21 @@ except ImportError:
 class ProgressDialog(QtWidgets.QDialog):
     """プログレスバーダイアログ"""
 
-    def __init__(self, title="処理中", parent=None):
+    # キャンセルボタン・ESCが押された
+    cancel_requested = QtCore.Signal()
+
+    def __init__(self, title="処理中", parent=None, modal=True):
+        """
+        Args:
+            title: ウィンドウタイトル
+            parent: 親ウィジェット
+            modal: Falseの場合は表示中もMayaのウィンドウを操作できる（CheckRunnerでの実行用）
+        """
         super(ProgressDialog, self).__init__(parent)
 
         self.setWindowTitle(title)
         self.setMinimumSize(500, 150)
-        self.setModal(True)
+        self.setModal(modal)
         self.cancelled = False
 
         self.setup_ui()
@@ -119,6 +128,7 @@ class ProgressDialog(QtWidgets.QDialog):
         self.cancelled = True
         self.message_label.setText("キャンセル中...")
         self.cancel_btn.setEnabled(False)
+        self.cancel_requested.emit()
 
     def keyPressEvent(self, event):
         """キーイベントハンドラ"""
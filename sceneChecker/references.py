@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - References
+同じファイルを参照するリファレンス（インスタンス）の表と、チェック結果の展開
+Mayaに依存しない純粋なPython処理
+
+レイアウトシーンでは同じプロップが何百回も参照されるが、リファレンス内部のデータ
+（メッシュ・スキン・ジョイント）は参照元のファイルが同じであれば同一になる。
+ReferenceMap.planはファイルごとに1つのインスタンスのノードだけをチェック対象に残し、
+FanOut.applyはその結果をネームスペースを置き換えて他のインスタンスに展開する。
+
+配置（ルートの移動・回転）以外のリファレンス編集があるインスタンスは、シーン内の
+ノードと同じくインスタンスごとにチェックする
+"""
+
+import functools
+import re
+
+from .components import split_item
+
+
+# 配置とみなすアトリビュート（リファレンスのルートノードに対するsetAttrのみ）
+PLACEMENT_ATTRS = {
+    "translate", "translateX", "translateY", "translateZ", "t", "tx", "ty", "tz",
+    "rotate", "rotateX", "rotateY", "rotateZ", "r", "rx", "ry", "rz",
+}
+
+
+def is_placement_edit(edit, root_names):
+    """リファレンス編集がルートノードの配置（移動・回転）のみかどうか
+
+    Args:
+        edit: リファレンス編集の文字列（'setAttr "ns:grp.translate" -type "double3" 1 0 0' など）
+        root_names: リファレンスのルートノードのショートネームのset
+    """
+    tokens = edit.split()
+    if len(tokens) < 2 or tokens[0] != "setAttr":
+        return False
+    node, _, attr = tokens[1].strip('"').rpartition(".")
+    return attr in PLACEMENT_ATTRS and node.rsplit("|", 1)[-1] in root_names
+
+
+def root_names(nodes):
+    """リファレンスのノード（ロングネーム）のうち、親がリファレンス外のDAGノードのショートネーム"""
+    node_set = set(nodes)
+    roots = set()
+    for node in nodes:
+        if node.startswith("|") and node.rpartition("|")[0] not in node_set:
+            roots.add(node.rsplit("|", 1)[-1])
+    return roots
+
+
+@functools.lru_cache(maxsize=None)
+def _namespace_pattern(namespace):
+    # 名前の途中（"other_ns:" や "parent:ns:"）には一致させない
+    return re.compile(r"(?<![\w:])" + re.escape(namespace) + ":")
+
+
+def rename_namespace(text, old, new):
+    """文字列中のノード名のネームスペース old を new に置き換える"""
+    if old + ":" not in text:
+        return text
+    return _namespace_pattern(old).sub(lambda match: new + ":", text)
+
+
+class _Instance:
+    """1つのリファレンス（インスタンス）"""
+
+    def __init__(self, reference):
+        self.file = reference["file"]
+        self.namespace = reference["namespace"].strip(":")
+        self.overridden = reference.get("overridden", False)
+        self.nodes = reference["nodes"]
+        self._keys = None
+        self._by_key = None
+
+    def _relative_key(self, node):
+        """ネームスペースとリファレンス外の親を除いたノード名（インスタンス間で共通）"""
+        prefix = self.namespace + ":"
+        if not node.startswith("|"):
+            return node[len(prefix):] if node.startswith(prefix) else node
+        components = node.split("|")[1:]
+        for start, component in enumerate(components):
+            if component.startswith(prefix):
+                break
+        else:
+            start = 0
+        return "|" + "|".join(c[len(prefix):] if c.startswith(prefix) else c for c in components[start:])
+
+    @property
+    def keys(self):
+        """{ノード名: インスタンス間で共通のキー}"""
+        if self._keys is None:
+            self._keys = {node: self._relative_key(node) for node in self.nodes}
+        return self._keys
+
+    @property
+    def by_key(self):
+        """{インスタンス間で共通のキー: ノード名}"""
+        if self._by_key is None:
+            self._by_key = {key: node for node, key in self.keys.items()}
+        return self._by_key
+
+
+class FanOut:
+    """代表のインスタンスに対するチェック結果を、同じファイルの他のインスタンスに展開する"""
+
+    def __init__(self, owners, targets):
+        """
+        Args:
+            owners: {ノード名: _Instance}（リファレンスのすべてのノード）
+            targets: {代表の_Instance: 展開先の_Instanceのリスト}
+        """
+        self.owners = owners
+        self.targets = targets
+
+    def _map_item(self, item, node, source, target):
+        """代表のインスタンスの項目を展開先のノード名に置き換える"""
+        mapped = target.by_key.get(source.keys.get(node))
+        if mapped is None:
+            mapped = rename_namespace(node, source.namespace, target.namespace)
+        return mapped + rename_namespace(item[len(node):], source.namespace, target.namespace)
+
+    def apply(self, results):
+        """チェック結果を展開
+
+        項目のノードが代表のインスタンスに属する場合、展開先ごとに項目を追加する。
+        結果名にネームスペースを含む場合（"Zero Weight Vertices (ns:skinCluster1)" など）は
+        展開先ごとに別の結果になる。結果に "limit" がある場合は項目数がそれを超えない
+
+        Returns:
+            list: 展開した結果のリスト
+        """
+        expanded = []
+        for result in results:
+            fanned = {}  # 結果名 -> 追加する項目
+            for item in result.get("items", []):
+                node = split_item(item)[0]
+                source = self.owners.get(node)
+                for target in self.targets.get(source, ()):
+                    name = rename_namespace(result["name"], source.namespace, target.namespace)
+                    fanned.setdefault(name, []).append(self._map_item(item, node, source, target))
+            if not fanned:
+                expanded.append(result)
+                continue
+            items = list(result["items"]) + fanned.pop(result["name"], [])
+            if result.get("limit") is not None:
+                items = items[:result["limit"]]
+            expanded.append(dict(result, items=items, count=len(items)))
+            expanded.extend(dict(result, name=name, items=items, count=len(items)) for name, items in fanned.items())
+        return expanded
+
+
+class ReferenceMap:
+    """参照ファイルごとのリファレンス（インスタンス）の表"""
+
+    def __init__(self, references=None):
+        """
+        Args:
+            references: {"file": 参照ファイル（コピー番号なし）, "namespace",
+                         "nodes": リファレンスのノード（DAGノードはロングネーム、入れ子のリファレンスを含む）,
+                         "overridden": 配置以外のリファレンス編集があるか} のリスト
+        """
+        self.references = list(references or [])
+        self.instances = [_Instance(reference) for reference in self.references]
+        self.owners = {}
+        self.files = {}
+        for instance in self.instances:
+            self.files.setdefault(instance.file, []).append(instance)
+            for node in instance.nodes:
+                self.owners[node] = instance
+
+    def has_duplicates(self):
+        """同じファイルを複数回参照しているか"""
+        return any(len(instances) > 1 for instances in self.files.values())
+
+    def plan(self, nodes):
+        """チェックするノードを、参照ファイルごとに1つのインスタンスに絞り込む
+
+        編集のないインスタンスのうち、対象ノードの構成（共通のキー）が同じものは
+        最初のインスタンスのみチェックし、他は結果を展開する
+
+        Args:
+            nodes: チェック対象のノード名のリスト
+
+        Returns:
+            tuple: (チェックするノード名のリスト（元の順）, FanOut（展開がない場合はNone）)
+        """
+        nodes_by_instance = {}
+        for node in nodes:
+            instance = self.owners.get(node)
+            if instance is not None and not instance.overridden:
+                nodes_by_instance.setdefault(instance, []).append(node)
+
+        skipped = set()
+        targets = {}
+        for instances in self.files.values():
+            representatives = {}  # 対象ノードのキーの組 -> 代表のインスタンス
+            for instance in instances:
+                instance_nodes = nodes_by_instance.get(instance)
+                if not instance_nodes:
+                    continue
+                keys = frozenset(instance.keys[node] for node in instance_nodes)
+                source = representatives.setdefault(keys, instance)
+                if source is not instance:
+                    targets.setdefault(source, []).append(instance)
+                    skipped.update(instance_nodes)
+
+        if not targets:
+            return list(nodes), None
+        return [node for node in nodes if node not in skipped], FanOut(self.owners, targets)
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Result Index
+結果ウィンドウの検索・フィルタ用の、全チェック結果のエラー項目に対するインデックス
+Mayaに依存しない純粋なPython処理
+
+検索文字列はスペース区切りの条件のAND
+
+    |maps_root_001|building   ロングネームの前方一致
+    building                  ショートネームの前方一致
+    ns:chara01                ネームスペース（ネストしたネームスペースは "chara01:face"）
+    severity:error            重要度（sev: でも可）
+    check:lamina              チェック名の部分一致（大文字小文字を区別しない）
+
+結果ごとにノード名をソートした配列を持ち、前方一致は二分探索とスライスで求める。
+インデックスは結果の追加後にbuild_pendingで少しずつ作成する（UIのアイドル時）。
+作成が終わる前に検索された場合は、残りをその場で作成する
+"""
+
+import bisect
+import heapq
+import itertools
+import time
+
+from .components import split_item
+
+
+# 前方一致の上限に使う文字
+_MAX_CHAR = chr(0x10FFFF)
+
+# インデックス作成の1ステップで処理する行数（1ステップが1フレームに収まる程度）
+BUILD_CHUNK = 10000
+
+
+def parse_query(text):
+    """検索文字列を条件に分解
+
+    Returns:
+        dict: {"severities", "checks", "namespaces", "paths", "names": 条件のリスト}
+    """
+    query = {"severities": [], "checks": [], "namespaces": [], "paths": [], "names": []}
+    for token in text.split():
+        key, sep, value = token.partition(":")
+        key = key.lower()
+        if sep and value and key in ("severity", "sev"):
+            query["severities"].append(value.lower())
+        elif sep and value and key == "check":
+            query["checks"].append(value.lower())
+        elif sep and value and key == "ns":
+            query["namespaces"].append(value.strip(":"))
+        elif token.startswith("|"):
+            query["paths"].append(token)
+        else:
+            query["names"].append(token)
+    return query
+
+
+def _item_node(item):
+    """エラー項目のノード名"""
+    # コンポーネント（"mesh.f[3]"）はsplit_itemの正規表現を通さずに分解（ノード名に "." は含まれない）
+    if item.endswith("]") and " " not in item:
+        return item.rpartition(".")[0] or item
+    return split_item(item)[0]
+
+
+def _namespace(node):
+    """ノード名（ロングネーム可）のネームスペース（ない場合は空文字）"""
+    short = node.rsplit("|", 1)[-1]
+    return short.rpartition(":")[0]
+
+
+def _sorted_rows(keys, chunk_size):
+    """keysの昇順（安定）に並べた行番号のリストを作るジェネレーター（chunk_size行ごとに制御を返す）
+
+    chunk_size行ずつソートした後、heapq.mergeで少しずつ結合する（同じキーの行は元の順）
+
+    Returns:
+        list: 行番号のリスト（yield fromの値）
+    """
+    runs = []
+    for start in range(0, len(keys), chunk_size):
+        runs.append(sorted(range(start, min(start + chunk_size, len(keys))), key=keys.__getitem__))
+        yield
+    if len(runs) <= 1:
+        return runs[0] if runs else []
+
+    merged = heapq.merge(*runs, key=keys.__getitem__)
+    rows = []
+    while True:
+        chunk = list(itertools.islice(merged, chunk_size))
+        if not chunk:
+            return rows
+        rows.extend(chunk)
+        yield
+
+
+def _take(values, rows, chunk_size):
+    """rowsの順に並べたvaluesのリストを作るジェネレーター（chunk_size行ごとに制御を返す）"""
+    taken = []
+    for start in range(0, len(rows), chunk_size):
+        taken.extend(values[row] for row in rows[start:start + chunk_size])
+        yield
+    return taken
+
+
+class _IndexedResult:
+    """1つのチェック結果のエラー項目のインデックス"""
+
+    def __init__(self, check_name, severity, items):
+        self.check_name = check_name
+        self.severity = severity
+        self.items = items
+        self.built = False
+        self._steps = None
+
+    def build_steps(self, chunk_size=BUILD_CHUNK):
+        """ノード名（ロングネーム・ショートネーム）の整列済み配列とネームスペースの表を作成する
+        ジェネレーター（chunk_size行ごとに制御を返す）"""
+        nodes = []
+        short_names = []
+        namespaces = {}
+        for start in range(0, len(self.items), chunk_size):
+            for row, item in enumerate(self.items[start:start + chunk_size], start):
+                node = _item_node(str(item))
+                nodes.append(node)
+                short_names.append(node.rsplit("|", 1)[-1])
+                namespace = _namespace(node)
+                if namespace:
+                    namespaces.setdefault(namespace, []).append(row)
+            yield
+
+        path_rows = yield from _sorted_rows(nodes, chunk_size)
+        name_rows = yield from _sorted_rows(short_names, chunk_size)
+
+        self.path_keys = yield from _take(nodes, path_rows, chunk_size)
+        self.path_rows = path_rows
+        self.name_keys = yield from _take(short_names, name_rows, chunk_size)
+        self.name_rows = name_rows
+        self.namespaces = namespaces
+        self.built = True
+
+    def build_step(self):
+        """インデックスの作成を1ステップ進める
+
+        Returns:
+            bool: 作成が完了した場合True
+        """
+        if self.built:
+            return True
+        if self._steps is None:
+            self._steps = self.build_steps()
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._steps = None
+        return self.built
+
+    def build(self):
+        """インデックスの作成を完了させる（途中まで作成していない場合は分割せずに作成）"""
+        if self.built:
+            return
+        if self._steps is None:
+            self._steps = self.build_steps(max(1, len(self.items)))
+        for _ in self._steps:
+            pass
+        self._steps = None
+
+    def match_rows(self, query):
+        """項目の条件に一致する行（昇順でない場合がある）のリスト"""
+        if not self.built:
+            self.build()
+
+        matches = []
+        for prefix in query["paths"]:
+            lo = bisect.bisect_left(self.path_keys, prefix)
+            hi = bisect.bisect_left(self.path_keys, prefix + _MAX_CHAR, lo)
+            matches.append(self.path_rows[lo:hi])
+        for prefix in query["names"]:
+            lo = bisect.bisect_left(self.name_keys, prefix)
+            hi = bisect.bisect_left(self.name_keys, prefix + _MAX_CHAR, lo)
+            matches.append(self.name_rows[lo:hi])
+        for namespace in query["namespaces"]:
+            # 子のネームスペースも含める
+            rows = list(self.namespaces.get(namespace, []))
+            for key, key_rows in self.namespaces.items():
+                if key.startswith(namespace + ":"):
+                    rows.extend(key_rows)
+            matches.append(rows)
+
+        if len(matches) == 1:
+            return matches[0]
+        common = set(matches[0])
+        for rows in matches[1:]:
+            common.intersection_update(rows)
+        return sorted(common)
+
+
+class ResultIndex:
+    """全チェック結果のエラー項目に対する検索インデックス"""
+
+    def __init__(self):
+        self.results = []
+        self._pending = 0  # これより前の結果はインデックス作成済み
+
+    def add(self, check_name, severity, items):
+        """チェック結果を追加（インデックスはbuild_pendingまたは最初の検索時に作成）
+
+        Returns:
+            int: 結果のID（追加順）
+        """
+        self.results.append(_IndexedResult(check_name, severity, items or []))
+        return len(self.results) - 1
+
+    def has_pending(self):
+        """インデックスが未作成の結果があるか"""
+        return self._pending < len(self.results)
+
+    def build_pending(self, time_budget=0.01):
+        """未作成のインデックスをtime_budget秒程度まで作成する（1ステップは中断しない）
+
+        Returns:
+            bool: 未作成の結果が残っている場合True
+        """
+        deadline = time.perf_counter() + time_budget
+        while self.has_pending():
+            if self.results[self._pending].build_step():
+                self._pending += 1
+            if time.perf_counter() >= deadline:
+                break
+        return self.has_pending()
+
+    def query(self, text):
+        """検索文字列に一致する結果と行を求める
+
+        Returns:
+            dict or None: {結果のID: 一致した行のリスト（Noneの場合はすべての行）}
+                          一致しない結果は含まない。検索条件がない場合はNone
+        """
+        query = parse_query(text)
+        if not any(query.values()):
+            return None
+
+        filter_items = bool(query["paths"] or query["names"] or query["namespaces"])
+        matches = {}
+        for result_id, result in enumerate(self.results):
+            if query["severities"] and result.severity not in query["severities"]:
+                continue
+            check_name = result.check_name.lower()
+            if not all(check in check_name for check in query["checks"]):
+                continue
+            if not filter_items:
+                matches[result_id] = None
+                continue
+            rows = result.match_rows(query)
+            if rows:
+                matches[result_id] = rows
+        return matches
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Results Database
+バッチ結果の履歴をSQLiteに蓄積し、チェックごと・シーンごとの推移を検索する
+Mayaに依存しない
+"""
+
+import datetime
+import sqlite3
+import threading
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    note TEXT
+);
+CREATE TABLE IF NOT EXISTS scenes (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS scene_checks (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    scene_id INTEGER NOT NULL REFERENCES scenes(id),
+    config TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    checked_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checks (
+    id INTEGER PRIMARY KEY,
+    scene_check_id INTEGER NOT NULL REFERENCES scene_checks(id),
+    name TEXT NOT NULL,
+    severity TEXT,
+    count INTEGER NOT NULL,
+    elapsed REAL
+);
+CREATE TABLE IF NOT EXISTS items (
+    check_id INTEGER NOT NULL REFERENCES checks(id),
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scene_checks_scene ON scene_checks(scene_id, config, id);
+CREATE INDEX IF NOT EXISTS idx_scene_checks_run ON scene_checks(run_id);
+CREATE INDEX IF NOT EXISTS idx_checks_name ON checks(name, scene_check_id);
+CREATE INDEX IF NOT EXISTS idx_checks_scene_check ON checks(scene_check_id);
+CREATE INDEX IF NOT EXISTS idx_items_check ON items(check_id);
+"""
+
+# シーン・設定ごとの最新の結果
+_LATEST_SCENE_CHECKS = """
+SELECT MAX(id) AS id FROM scene_checks GROUP BY scene_id, config
+"""
+
+
+def _now():
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+class ResultsDatabase:
+    """バッチ結果の履歴データベース"""
+
+    def __init__(self, path):
+        self.path = path
+        # 並列バッチではコーディネーターの各スレッドから書き込む（書き込みはSqliteResultSinkで直列化する）
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self._scene_ids = {}
+
+    def close(self):
+        """コミットして閉じる"""
+        self.connection.commit()
+        self.connection.close()
+
+    # ----------------------------------------
+    # 書き込み
+    # ----------------------------------------
+
+    def begin_run(self, note=None):
+        """バッチ実行を開始
+
+        Returns:
+            int: run_id
+        """
+        cursor = self.connection.execute("INSERT INTO runs (started_at, note) VALUES (?, ?)", (_now(), note))
+        return cursor.lastrowid
+
+    def _scene_id(self, path):
+        scene_id = self._scene_ids.get(path)
+        if scene_id is None:
+            self.connection.execute("INSERT OR IGNORE INTO scenes (path) VALUES (?)", (path,))
+            scene_id = self.connection.execute("SELECT id FROM scenes WHERE path = ?", (path,)).fetchone()[0]
+            self._scene_ids[path] = scene_id
+        return scene_id
+
+    def add_scene_results(self, run_id, scene_file, config_name, results, status="ok", error=None):
+        """1シーン・1設定の結果を書き込む（コミットは呼び出し側で行う）"""
+        if isinstance(config_name, (list, tuple)):
+            config_name = ",".join(config_name)
+        cursor = self.connection.execute(
+            "INSERT INTO scene_checks (run_id, scene_id, config, status, error, checked_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (run_id, self._scene_id(scene_file), config_name, status, error, _now()))
+        scene_check_id = cursor.lastrowid
+
+        for result in results or []:
+            cursor = self.connection.execute(
+                "INSERT INTO checks (scene_check_id, name, severity, count, elapsed) VALUES (?, ?, ?, ?, ?)",
+                (scene_check_id, result.get("name", ""), result.get("severity", ""),
+                 result.get("count", 0), result.get("elapsed")))
+            items = result.get("items")
+            if items:
+                check_id = cursor.lastrowid
+                self.connection.executemany("INSERT INTO items (check_id, item) VALUES (?, ?)",
+                                            ((check_id, item) for item in items))
+
+    def commit(self):
+        """コミット"""
+        self.connection.commit()
+
+    # ----------------------------------------
+    # 検索
+    # ----------------------------------------
+
+    def runs(self):
+        """バッチ実行の一覧
+
+        Returns:
+            list: (run_id, started_at, note) のリスト
+        """
+        return self.connection.execute("SELECT id, started_at, note FROM runs ORDER BY id").fetchall()
+
+    def scenes_with_check(self, check_name, config=None):
+        """最新の結果で指定チェックの問題が残っているシーン
+
+        例: "Non-Manifold Vertices" がまだ残っているショットの一覧
+
+        Returns:
+            list: (シーンパス, 設定名, 件数, チェック日時) のリスト
+        """
+        query = f"""
+            SELECT s.path, sc.config, c.count, sc.checked_at
+            FROM checks c
+            JOIN scene_checks sc ON sc.id = c.scene_check_id
+            JOIN scenes s ON s.id = sc.scene_id
+            WHERE c.name = ? AND c.count > 0 AND sc.id IN ({_LATEST_SCENE_CHECKS})
+        """
+        params = [check_name]
+        if config:
+            query += " AND sc.config = ?"
+            params.append(config)
+        return self.connection.execute(query + " ORDER BY s.path", params).fetchall()
+
+    def check_trend(self, check_name, config=None):
+        """バッチ実行ごとの指定チェックの推移
+
+        例: "Missing Textures" がいつ急増したか
+
+        Returns:
+            list: (run_id, started_at, 該当シーン数, 合計件数) のリスト
+        """
+        query = """
+            SELECT r.id, r.started_at, COUNT(DISTINCT sc.scene_id), SUM(c.count)
+            FROM checks c
+            JOIN scene_checks sc ON sc.id = c.scene_check_id
+            JOIN runs r ON r.id = sc.run_id
+            WHERE c.name = ?
+        """
+        params = [check_name]
+        if config:
+            query += " AND sc.config = ?"
+            params.append(config)
+        return self.connection.execute(query + " GROUP BY r.id ORDER BY r.id", params).fetchall()
+
+    def scene_history(self, scene_file, config=None):
+        """指定シーンのチェック結果の履歴
+
+        Returns:
+            list: (run_id, チェック日時, 設定名, ステータス, チェック名, 件数) のリスト
+        """
+        query = """
+            SELECT sc.run_id, sc.checked_at, sc.config, sc.status, c.name, c.count
+            FROM scene_checks sc
+            JOIN scenes s ON s.id = sc.scene_id
+            LEFT JOIN checks c ON c.scene_check_id = sc.id
+            WHERE s.path = ?
+        """
+        params = [scene_file]
+        if config:
+            query += " AND sc.config = ?"
+            params.append(config)
+        return self.connection.execute(query + " ORDER BY sc.id, c.id", params).fetchall()
+
+    def check_items(self, scene_file, check_name, config=None):
+        """最新の結果での指定シーン・チェックのエラー項目
+
+        Returns:
+            list: エラー項目の文字列のリスト
+        """
+        query = f"""
+            SELECT i.item
+            FROM items i
+            JOIN checks c ON c.id = i.check_id
+            JOIN scene_checks sc ON sc.id = c.scene_check_id
+            JOIN scenes s ON s.id = sc.scene_id
+            WHERE s.path = ? AND c.name = ? AND sc.id IN ({_LATEST_SCENE_CHECKS})
+        """
+        params = [scene_file, check_name]
+        if config:
+            query += " AND sc.config = ?"
+            params.append(config)
+        return [row[0] for row in self.connection.execute(query, params)]
+
+
+class SqliteResultSink:
+    """バッチ結果をResultsDatabaseに書き込むシンク
+
+    1つのシンクが1回のバッチ実行（run）に対応し、commit_everyシーンごとにまとめてコミットする。
+    write_scene・closeは複数のスレッドから呼び出せる
+    """
+
+    # ワーカーからエラー項目も受け取る
+    wants_items = True
+
+    def __init__(self, path, note=None, commit_every=100):
+        self.database = ResultsDatabase(path)
+        self.run_id = self.database.begin_run(note)
+        self.commit_every = commit_every
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def write_scene(self, scene_file, config_name, results, status="ok", error=None):
+        """1シーンの結果を書き込む"""
+        with self._lock:
+            if isinstance(results, dict):
+                for name, config_results in results.items():
+                    self.database.add_scene_results(self.run_id, scene_file, name, config_results, status, error)
+            else:
+                self.database.add_scene_results(self.run_id, scene_file, config_name, results, status, error)
+
+            self._pending += 1
+            if self._pending >= self.commit_every:
+                self.database.commit()
+                self._pending = 0
+
+    def close(self):
+        """コミットして閉じる"""
+        with self._lock:
+            self.database.close()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Rules
+ノード名・テクスチャパス・マテリアルの判定ルール
+Mayaに依存しないため、checkerと静的スキャン（static_scan）の両方から使用する
+"""
+
+import os
+import re
+
+
+# デフォルト名のプレフィックス
+DEFAULT_NAME_PATTERNS = ["pCube", "pSphere", "pCylinder", "pPlane", "pTorus", "polySurface", "group"]
+
+# 名前に使用できない文字
+INVALID_NAME_CHARS = [" ", ".", "-", ":", ";"]
+
+# BG命名規則: {4文字アルファベット}_{1-10文字アルファベット}_{3桁数字}
+BG_NAME_PATTERN = re.compile(r'^[a-zA-Z]{4}_[a-zA-Z]{1,10}_\d{3}$')
+
+# 問題としないマテリアル
+DEFAULT_MATERIALS = ["lambert1"]
+
+
+def short_name(path):
+    """ロングネームからショートネームを取得"""
+    return path.split("|")[-1]
+
+
+def find_default_names(objects):
+    """デフォルト名のオブジェクトを取得"""
+    default_names = []
+    for obj in objects:
+        name = short_name(obj)
+        for pattern in DEFAULT_NAME_PATTERNS:
+            if name.startswith(pattern):
+                default_names.append(obj)
+                break
+    return default_names
+
+
+def count_short_names(objects):
+    """ショートネームごとのオブジェクト数を取得"""
+    name_count = {}
+    for obj in objects:
+        name = short_name(obj)
+        name_count[name] = name_count.get(name, 0) + 1
+    return name_count
+
+
+def find_duplicate_names(objects):
+    """ショートネームが重複しているオブジェクトを取得"""
+    name_count = count_short_names(objects)
+    return [obj for obj in objects if name_count[short_name(obj)] > 1]
+
+
+def find_invalid_names(objects):
+    """無効な文字を含む名前のオブジェクトを取得"""
+    invalid = []
+    for obj in objects:
+        name = short_name(obj)
+        if any(c in name for c in INVALID_NAME_CHARS):
+            invalid.append(obj)
+    return invalid
+
+
+def find_bg_naming_violations(objects):
+    """BG命名規則に違反しているオブジェクトを取得（エラー項目の文字列）"""
+    return [f"{obj} (期待形式: area_modelname_id)"
+            for obj in objects if not BG_NAME_PATTERN.match(short_name(obj))]
+
+
+def find_missing_textures(textures):
+    """テクスチャファイルが見つからないfileノードを取得
+
+    Args:
+        textures: (fileノード名, テクスチャパス) のリスト
+
+    Returns:
+        list: エラー項目の文字列のリスト
+    """
+    return [f"{node} -> {path}" for node, path in textures if path and not os.path.exists(path)]
+
+
+def find_sequence_issues(textures):
+    """テクスチャシーケンスのディレクトリが見つからないfileノードを取得
+
+    Args:
+        textures: (fileノード名, テクスチャパス) のリスト
+
+    Returns:
+        list: エラー項目の文字列のリスト
+    """
+    issues = []
+    for node, path in textures:
+        if path and "<" in path:  # シーケンス記法
+            # フレーム番号のパターンを検出
+            pattern = re.sub(r'<.*?>', '*', path)
+            directory = os.path.dirname(pattern)
+            if not os.path.exists(directory):
+                issues.append(f"{node} -> {path} (ディレクトリが見つかりません)")
+    return issues
+
+
+def find_extra_materials(materials):
+    """デフォルト以外のマテリアルを取得"""
+    return [material for material in materials if material not in DEFAULT_MATERIALS]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Scene Open Profiles
+バッチチェック用の軽量なシーンオープン
+"""
+
+import contextlib
+import fnmatch
+
+try:
+    import maya.cmds as cmds
+except ImportError:
+    # Maya外（パッケージの読み込みのみ）ではシーンを開く処理は使用できない
+    cmds = None
+
+
+# チェック関数が必要とするシーンデータ
+#   names: ノード名・ノードタイプ
+#   textures: fileノードのパス文字列
+#   transforms: トランスフォーム値
+#   geometry: メッシュのトポロジー・座標・UV（デフォーマ評価が必要）
+#   deformers: skinClusterのウェイト
+#   animation: アニメーションカーブ
+CHECK_REQUIREMENTS = {
+    "check_geometry_issues": {"names", "geometry"},
+    "check_ngons": {"names", "geometry"},
+    "check_zero_area_faces": {"names", "geometry"},
+    "check_uv_issues": {"names", "geometry"},
+    "check_missing_textures": {"textures"},
+    "check_texture_sequences": {"textures"},
+    "check_naming_issues": {"names"},
+    "check_bg_naming_convention": {"names"},
+    "check_transform_issues": {"names", "transforms"},
+    "check_joint_orientation": {"names", "transforms"},
+    "check_skin_weights": {"deformers"},
+    "check_unused_influences": {"deformers"},
+    "check_animation_keys": {"animation"},
+    "check_shader_issues": {"names"},
+}
+
+# シーンオープンのプロファイル
+#   load_references: "all" / "none" / "top"（1階層目のみ）
+#   reference_patterns: 読み込むリファレンスファイルのパターン（指定時は一致しないリファレンスを読み込まない）
+#   execute_script_nodes: スクリプトノード（UI構成・ビューポート設定など）を実行するか
+#   suspend_refresh: オープン中とチェック中のビューポート更新（テクスチャ読み込みを含む）を停止するか
+#                    （ビューポートのないmayapy・バッチモードでは何もしない。テクスチャはもともと読み込まれない）
+OPEN_PROFILES = {
+    # すべてを読み込む（従来の動作）
+    "full": {
+        "load_references": "all",
+        "execute_script_nodes": True,
+        "suspend_refresh": False,
+    },
+    # リファレンスは読み込むが、UI構成・ビューポート・テクスチャ表示の準備を省略
+    "light": {
+        "load_references": "all",
+        "execute_script_nodes": False,
+        "suspend_refresh": True,
+    },
+    # リファレンスを読み込まない（シーンローカルのノードのみ）
+    "no_references": {
+        "load_references": "none",
+        "execute_script_nodes": False,
+        "suspend_refresh": True,
+    },
+}
+
+# 軽量プロファイルで済むデータ
+_LIGHT_REQUIREMENTS = {"names", "textures", "transforms"}
+
+
+def select_open_profile(checks):
+    """チェック項目から必要なシーンオープンのプロファイルを決定
+
+    "light" または "full" のみを返す。チェックはリファレンス内のノードも対象にするため、
+    "no_references" は結果が変わることを承知で明示的に指定した場合のみ使用する
+
+    Args:
+        checks: チェック項目のリスト
+
+    Returns:
+        str: プロファイル名
+    """
+    requirements = set()
+    for check in checks:
+        # 不明なチェック関数は安全側に倒してすべてを読み込む
+        requirements |= CHECK_REQUIREMENTS.get(check.get("function", ""), {"geometry"})
+
+    if requirements and requirements <= _LIGHT_REQUIREMENTS:
+        return "light"
+    return "full"
+
+
+def resolve_open_profile(profile):
+    """プロファイル名またはdictを設定のdictに変換"""
+    if isinstance(profile, dict):
+        settings = dict(OPEN_PROFILES["full"])
+        settings.update(profile)
+        return settings
+    if profile not in OPEN_PROFILES:
+        raise ValueError(f"不明なシーンオープンのプロファイルです: {profile}")
+    return dict(OPEN_PROFILES[profile])
+
+
+def open_scene(scene_file, profile="full"):
+    """プロファイルに従ってシーンを開く
+
+    ビューポート更新の停止（suspend_refresh）は呼び出し側でsuspended_refreshを使って行う
+
+    Args:
+        scene_file: シーンファイルのパス
+        profile: プロファイル名またはプロファイル設定のdict
+    """
+    settings = resolve_open_profile(profile)
+    flags = {
+        "open": True,
+        "force": True,
+        "prompt": False,
+        "executeScriptNodes": settings["execute_script_nodes"],
+    }
+
+    patterns = settings.get("reference_patterns")
+    if patterns:
+        _open_with_selected_references(scene_file, patterns, flags)
+        return
+
+    load_references = settings["load_references"]
+    if load_references == "none":
+        flags["loadReferenceDepth"] = "none"
+    elif load_references == "top":
+        flags["loadReferenceDepth"] = "topOnly"
+    cmds.file(scene_file, **flags)
+
+
+def _open_with_selected_references(scene_file, patterns, flags):
+    """パターンに一致するリファレンスのみを読み込んでシーンを開く"""
+    # リファレンスを読み込まずにロード設定だけを構築
+    cmds.file(scene_file, buildLoadSettings=True, **flags)
+
+    # 0番目はメインシーン
+    for index in range(1, cmds.selLoadSettings(query=True, numSettings=True)):
+        reference_file = cmds.selLoadSettings(str(index), query=True, fileName=True)
+        load = any(fnmatch.fnmatch(reference_file, pattern) for pattern in patterns)
+        cmds.selLoadSettings(str(index), edit=True, deferReference=not load)
+
+    cmds.file(scene_file, loadSettings="implicitLoadSettings", **flags)
+
+
+@contextlib.contextmanager
+def suspended_refresh(enabled=True):
+    """ビューポート更新を停止（バッチ/ヘッドレスでは何もしない）"""
+    if not enabled or cmds.about(batch=True):
+        yield
+        return
+
+    cmds.refresh(suspend=True)
+    try:
+        yield
+    finally:
+        cmds.refresh(suspend=False)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Check Scope
+チェック対象範囲（選択・階層・セット・ネームスペース）の解決
+"""
+
+import maya.cmds as cmds
+
+
+class CheckScope:
+    """チェック対象範囲
+
+    mode:
+        "scene": シーン全体（デフォルト）
+        "selection": 現在の選択とその子階層
+        "hierarchy": 指定したノードとその子階層
+        "set": 指定したオブジェクトセットのメンバーとその子階層
+        "namespace": 指定したネームスペース内のノード
+    """
+
+    SCENE = "scene"
+    SELECTION = "selection"
+    HIERARCHY = "hierarchy"
+    SET = "set"
+    NAMESPACE = "namespace"
+
+    MODES = [SCENE, SELECTION, HIERARCHY, SET, NAMESPACE]
+
+    def __init__(self, mode=SCENE, targets=None):
+        if mode not in self.MODES:
+            raise ValueError(f"不明なスコープです: {mode}")
+        self.mode = mode
+        self.targets = list(targets or [])
+
+    def __repr__(self):
+        return f"CheckScope({self.mode!r}, {self.targets!r})"
+
+    def is_scene(self):
+        """シーン全体が対象かどうか"""
+        return self.mode == self.SCENE
+
+    def resolve(self):
+        """スコープ内のノードを解決
+
+        Returns:
+            list: スコープ内のノード名（ロングネーム）のリスト
+                  シーン全体が対象の場合はNone
+        """
+        if self.is_scene():
+            return None
+
+        if self.mode == self.NAMESPACE:
+            nodes = []
+            for namespace in self.targets:
+                if cmds.namespace(exists=namespace):
+                    nodes.extend(cmds.namespaceInfo(namespace, listOnlyDependencyNodes=True,
+                                                    recurse=True, dagPath=True) or [])
+            return cmds.ls(nodes, long=True) if nodes else []
+
+        roots = self._resolve_roots()
+        if not roots:
+            return []
+
+        # DAG階層を展開
+        dag_nodes = set(roots)
+        dag_nodes.update(cmds.listRelatives(roots, allDescendents=True, fullPath=True) or [])
+        dag_nodes = list(dag_nodes)
+
+        return cmds.ls(dag_nodes + self._dependency_nodes(dag_nodes), long=True)
+
+    def _resolve_roots(self):
+        """スコープの起点となるDAGノードを取得"""
+        if self.mode == self.SELECTION:
+            return cmds.ls(sl=True, long=True, objectsOnly=True, dag=True) or []
+
+        if self.mode == self.HIERARCHY:
+            return cmds.ls(self.targets, long=True, dag=True) or []
+
+        if self.mode == self.SET:
+            members = []
+            for object_set in self.targets:
+                if cmds.objExists(object_set):
+                    members.extend(cmds.sets(object_set, query=True) or [])
+            return cmds.ls(members, long=True, objectsOnly=True, dag=True) if members else []
+
+        return []
+
+    @staticmethod
+    def _dependency_nodes(dag_nodes):
+        """DAGノードに関連するDGノード（デフォーマ、シェーダー、アニメーションカーブ）を取得"""
+        related = []
+
+        shapes = cmds.ls(dag_nodes, shapes=True, long=True) or []
+        if shapes:
+            # skinClusterなどのデフォーマ
+            related.extend(cmds.listHistory(shapes, pruneDagObjects=True) or [])
+
+            # シェーディンググループ以下のマテリアルとテクスチャ
+            shading_engines = cmds.listConnections(shapes, type="shadingEngine") or []
+            if shading_engines:
+                shading_engines = list(set(shading_engines))
+                related.extend(shading_engines)
+                related.extend(cmds.listHistory(shading_engines, pruneDagObjects=True) or [])
+
+        # アニメーションカーブ
+        related.extend(cmds.listConnections(dag_nodes, type="animCurve", source=True,
+                                            destination=False) or [])
+
+        return list(set(related))
+
+
+def get_selection_targets():
+    """現在の選択をスコープのターゲットとして取得"""
+    return cmds.ls(sl=True, long=True) or []
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Result Sinks
+複数シーンのバッチ結果を1つのファイルへ逐次書き出す（JSON Lines / 統合CSV）
+Mayaに依存しない
+"""
+
+import csv
+import json
+import os
+
+from .results_db import SqliteResultSink
+
+
+# 統合出力の列
+RESULT_FIELDS = ["scene", "config", "check", "severity", "count", "elapsed", "status", "error"]
+
+
+def iter_result_rows(scene_file, config_name, results, status="ok", error=None):
+    """1シーンのチェック結果を統合出力の行に変換
+
+    Args:
+        scene_file: シーンファイルのパス
+        config_name: 設定ファイル名（resultsがdictの場合は無視）
+        results: チェック結果のリスト、または {設定名: チェック結果のリスト}
+        status: シーンの処理結果（"ok", "error", "timeout", "crashed"）
+        error: エラーメッセージ
+
+    Yields:
+        dict: RESULT_FIELDSをキーに持つ行
+    """
+    if isinstance(results, dict):
+        for name, config_results in results.items():
+            yield from iter_result_rows(scene_file, name, config_results, status, error)
+        return
+
+    if isinstance(config_name, (list, tuple)):
+        config_name = ",".join(config_name)
+
+    empty = True
+    for result in results or []:
+        empty = False
+        yield {
+            "scene": scene_file,
+            "config": config_name,
+            "check": result.get("name", ""),
+            "severity": result.get("severity", ""),
+            "count": result.get("count", 0),
+            "elapsed": round(result.get("elapsed", 0.0), 6),
+            "status": status,
+            "error": error or "",
+        }
+
+    # 問題がなかったシーン・失敗したシーンも1行記録する
+    if empty:
+        yield {
+            "scene": scene_file,
+            "config": config_name,
+            "check": "",
+            "severity": "",
+            "count": 0,
+            "elapsed": 0.0,
+            "status": status,
+            "error": error or "",
+        }
+
+
+class JsonLinesResultSink:
+    """JSON Lines形式の統合出力（1行1チェック結果）"""
+
+    def __init__(self, path):
+        self.path = path
+        # 再開時に追記できるよう追記モードで開く
+        self.file = open(path, "a", encoding="utf-8")
+
+    def write_scene(self, scene_file, config_name, results, status="ok", error=None):
+        """1シーンの結果を書き出す"""
+        for row in iter_result_rows(scene_file, config_name, results, status, error):
+            self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """ファイルを閉じる"""
+        self.file.close()
+
+
+class CsvResultSink:
+    """統合CSV出力（1行1チェック結果）"""
+
+    def __init__(self, path):
+        self.path = path
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="", encoding="utf-8-sig" if is_new else "utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+        if is_new:
+            self.writer.writeheader()
+
+    def write_scene(self, scene_file, config_name, results, status="ok", error=None):
+        """1シーンの結果を書き出す"""
+        self.writer.writerows(iter_result_rows(scene_file, config_name, results, status, error))
+        self.file.flush()
+
+    def close(self):
+        """ファイルを閉じる"""
+        self.file.close()
+
+
+def open_result_sinks(results_jsonl=None, results_csv=None, results_db=None):
+    """統合出力のシンクを作成
+
+    Args:
+        results_jsonl: JSON Lines出力のパス
+        results_csv: 統合CSV出力のパス
+        results_db: 履歴データベース（SQLite）のパス
+
+    Returns:
+        list: シンクのリスト
+    """
+    opened = []
+    if results_jsonl:
+        opened.append(JsonLinesResultSink(results_jsonl))
+    if results_csv:
+        opened.append(CsvResultSink(results_csv))
+    if results_db:
+        opened.append(SqliteResultSink(results_db))
+    return opened
+
+
+def sinks_want_items(sinks):
+    """エラー項目を必要とするシンクがあるかどうか"""
+    return any(getattr(sink, "wants_items", False) for sink in sinks)
+
+
+def write_to_sinks(sinks, scene_file, config_name, results, status="ok", error=None):
+    """すべてのシンクに1シーンの結果を書き出す"""
+    for sink in sinks:
+        sink.write_scene(scene_file, config_name, results, status, error)
+
+
+def close_sinks(sinks):
+    """すべてのシンクを閉じる"""
+    for sink in sinks:
+        sink.close()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Snapshot Files
+チェックに必要なシーンデータをディスクに書き出し、Mayaなしでメモリマップして読み込む
+
+スナップショットはディレクトリで、以下のファイルから構成される
+
+    index.json      ノード表・親子関係・アトリビュート・カーブのキー数・リファレンスと、
+                    各メッシュ・skinClusterの配列上の位置
+    points.f8       全メッシュの頂点座標 (N, 3)
+    face_counts.i4  フェースごとの頂点数
+    face_verts.i4   フェースの頂点インデックス
+    edges.i4        エッジの頂点インデックス (E, 2)
+    uvs.f8          UV座標 (U, 2)
+    weights.f8      スキンウェイト（skinClusterごとに (頂点数, インフルエンス数)）
+
+配列はメッシュごとに追記しながら書き出すため、書き出し時のメモリ使用量は1メッシュ分で済む。
+読み込み時は numpy.memmap で開き、各メッシュの配列はそのビューになる（ページキャッシュを共有）。
+NumPyが必要（Maya 2025のmayapyには同梱されている）
+"""
+
+import json
+import os
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .backend import MeshData, SkinData, SnapshotBackend, get_default_backend
+from .checker import SceneChecker
+from .config import collect_config_checks, load_check_config
+
+
+SNAPSHOT_VERSION = 2
+INDEX_FILE = "index.json"
+
+# 配列ファイル名 -> (dtype, 1要素あたりの列数)
+ARRAY_FILES = {
+    "points": ("points.f8", "<f8", 3),
+    "face_counts": ("face_counts.i4", "<i4", 1),
+    "face_vertices": ("face_verts.i4", "<i4", 1),
+    "edges": ("edges.i4", "<i4", 2),
+    "uvs": ("uvs.f8", "<f8", 2),
+    "weights": ("weights.f8", "<f8", 1),
+}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("スナップショットファイルの読み書きにはNumPyが必要です")
+
+
+def as_snapshot_array(key, values):
+    """配列をスナップショットの形式（dtype・列数）に変換"""
+    _, dtype, columns = ARRAY_FILES[key]
+    array = np.asarray(values, dtype=dtype)
+    return array.reshape(-1, columns) if columns > 1 else array.reshape(-1)
+
+
+def empty_snapshot_array(key):
+    """長さゼロの配列"""
+    _, dtype, columns = ARRAY_FILES[key]
+    return np.zeros((0, columns) if columns > 1 else (0,), dtype=dtype)
+
+
+class _ArrayWriter:
+    """配列ファイルへの追記"""
+
+    def __init__(self, directory):
+        self.files = {}
+        self.lengths = {}
+        for key, (filename, _, _) in ARRAY_FILES.items():
+            self.files[key] = open(os.path.join(directory, filename), "wb")
+            self.lengths[key] = 0
+
+    def append(self, key, values):
+        """配列を追記し、(開始行, 終了行) を返す"""
+        array = as_snapshot_array(key, values)
+        array.tofile(self.files[key])
+        start = self.lengths[key]
+        self.lengths[key] += len(array)
+        return [start, self.lengths[key]]
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+
+def write_snapshot(source, writer, meshes=None, mesh_fields=None, skins=None):
+    """バックエンドからシーンを読み取り、配列をwriterに書き出す
+
+    Args:
+        source: 読み取り元のバックエンド
+        writer: append(key, values) -> [開始行, 終了行] と close() を持つ書き出し先
+                （書き出し後にlengthsで各配列の全長を返す）
+        meshes: 書き出すメッシュのロングネーム（Noneの場合はすべて）
+        mesh_fields: 書き出すメッシュの配列名（Noneの場合はすべて。他の配列は空になる）
+        skins: 書き出すskinCluster（Noneの場合はすべて）
+
+    Returns:
+        dict: インデックス（index.jsonの内容）
+    """
+    # ノード表・アトリビュートなどの小さなデータはメモリ上のスナップショットから取得
+    table = SnapshotBackend.capture(source, include_geometry=False)
+
+    mesh_entries = {}
+    skin_entries = {}
+    try:
+        mesh_names = list(table.type_members["mesh"] if meshes is None else meshes)
+        entries_by_shape = {}
+        for mesh_name, identity in zip(mesh_names, source.mesh_identities(mesh_names)):
+            # インスタンス（同じシェイプの別のDAGパス）は同じ範囲の配列を参照する
+            if identity in entries_by_shape:
+                mesh_entries[mesh_name] = entries_by_shape[identity]
+                continue
+            try:
+                mesh = source.mesh(mesh_name)
+            except Exception:
+                continue
+            entry = {}
+            for key in ("points", "face_counts", "face_vertices", "edges", "uvs"):
+                written = mesh_fields is None or key in mesh_fields
+                entry[key] = writer.append(key, getattr(mesh, key) if written else [])
+            entry["uv_sets"] = list(mesh.uv_sets) if mesh_fields is None or "uv_sets" in mesh_fields else []
+            mesh_entries[mesh_name] = entries_by_shape[identity] = entry
+
+        for skin_name in table.type_members["skinCluster"] if skins is None else skins:
+            try:
+                skin = source.skin(skin_name)
+            except Exception:
+                continue
+            skin_entries[skin_name] = {
+                "geometry": skin.geometry,
+                "influences": list(skin.influences),
+                "weights": writer.append("weights", skin.weights),
+            }
+    finally:
+        writer.close()
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "nodes": table.nodes,
+        "parents": table.parents,
+        "type_members": {key: sorted(members) for key, members in table.type_members.items()},
+        "attrs": table.attrs,
+        "key_counts": table.curve_key_counts,
+        "references": table.references,
+        "meshes": mesh_entries,
+        "skins": skin_entries,
+        "lengths": writer.lengths,
+    }
+
+
+def save_snapshot(path, backend=None):
+    """現在のシーン（またはバックエンド）のスナップショットを書き出す
+
+    Args:
+        path: 書き出し先のディレクトリ（存在しない場合は作成）
+        backend: 読み取り元のバックエンド（Noneの場合はデフォルト）
+
+    Returns:
+        str: 書き出したディレクトリ
+    """
+    _require_numpy()
+    os.makedirs(path, exist_ok=True)
+    index = write_snapshot(backend or get_default_backend(), _ArrayWriter(path))
+    with open(os.path.join(path, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+
+    return path
+
+
+def _open_arrays(path, lengths):
+    """配列ファイルをメモリマップで開く"""
+    arrays = {}
+    for key, (filename, dtype, columns) in ARRAY_FILES.items():
+        length = lengths.get(key, 0)
+        if length == 0:
+            arrays[key] = empty_snapshot_array(key)
+            continue
+        shape = (length, columns) if columns > 1 else (length,)
+        arrays[key] = np.memmap(os.path.join(path, filename), dtype=dtype, mode="r", shape=shape)
+    return arrays
+
+
+def snapshot_from_arrays(index, arrays):
+    """インデックスと配列からSnapshotBackendを組み立てる
+
+    Args:
+        index: write_snapshotが返したインデックス
+        arrays: {配列名: 全メッシュ・skinCluster分を連結した配列}
+
+    Returns:
+        SnapshotBackend: 各メッシュ・skinClusterの配列がarraysのビューになったスナップショット
+    """
+    def view(key, span):
+        return arrays[key][span[0]:span[1]]
+
+    meshes = {}
+    for name, entry in index["meshes"].items():
+        meshes[name] = MeshData(name, view("points", entry["points"]), view("face_counts", entry["face_counts"]),
+                                view("face_vertices", entry["face_vertices"]), view("edges", entry["edges"]),
+                                view("uvs", entry["uvs"]), entry["uv_sets"])
+
+    skins = {}
+    for name, entry in index["skins"].items():
+        weights = view("weights", entry["weights"])
+        influence_count = len(entry["influences"])
+        if influence_count:
+            weights = weights.reshape(-1, influence_count)
+        skins[name] = SkinData(name, entry["geometry"], entry["influences"], weights)
+
+    attrs = {attr: {node: tuple(value) if isinstance(value, list) else value for node, value in values.items()}
+             for attr, values in index["attrs"].items()}
+
+    return SnapshotBackend(index["nodes"], index["parents"], index["type_members"], attrs,
+                           meshes, skins, index["key_counts"], index.get("references"))
+
+
+def load_snapshot(path):
+    """スナップショットを読み込む
+
+    Args:
+        path: save_snapshotで書き出したディレクトリ
+
+    Returns:
+        SnapshotBackend: 配列がメモリマップされたスナップショット
+    """
+    _require_numpy()
+    with open(os.path.join(path, INDEX_FILE), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    if index.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"対応していないスナップショットのバージョンです: {index.get('version')}")
+
+    return snapshot_from_arrays(index, _open_arrays(path, index["lengths"]))
+
+
+def check_snapshot(path, config_name="bg_checks", overrides=None):
+    """スナップショットに対して設定のチェックを実行（Maya不要）
+
+    Args:
+        path: スナップショットのディレクトリ
+        config_name: 使用する設定ファイル名
+        overrides: すべてのチェック項目に上書きするパラメータ（例: {"tolerance": 0.001}）
+
+    Returns:
+        list: エラーがあったチェック結果のリスト
+    """
+    checks = collect_config_checks(load_check_config(config_name))
+    if overrides:
+        checks = [dict(check, **overrides) for check in checks]
+    return SceneChecker(load_snapshot(path)).run_checks(checks)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Static Scan
+Mayaを使わずに.maファイルを事前スキャンする（ネーミング・テクスチャ・シェーダーのチェック）
+
+ノード名と文字列アトリビュートのみで判定できるチェックを、ma_parserの抽出結果に対して
+checkerと同じルール（rules）で実行する。複数ファイルはプロセスプールで並列に処理する
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from . import rules
+from .config import load_check_config
+from .ma_parser import parse_maya_ascii
+
+
+def _objects_without_cameras(scene):
+    """カメラを除いたトランスフォームを取得"""
+    return [obj for obj in scene.transforms()
+            if not any(scene.nodes[child] == "camera" for child in scene.children(obj))]
+
+
+def _texture_paths(scene):
+    """fileノードとテクスチャパスの組を取得"""
+    return [(node, scene.get_string_attr(node, "fileTextureName"))
+            for node in scene.nodes_of_type({"file"})]
+
+
+def _result(check_info, items, **overrides):
+    """チェック結果のdictを作成"""
+    result = {
+        "name": check_info["name"],
+        "count": len(items),
+        "severity": check_info.get("severity", "warning"),
+        "description": check_info["description"],
+        "items": items,
+        "adjust_function": None
+    }
+    result.update(overrides)
+    return result
+
+
+def static_naming_issues(scene, check_info):
+    """check_naming_issues相当"""
+    objects = _objects_without_cameras(scene)
+    results = []
+
+    default_names = rules.find_default_names(objects)
+    if default_names:
+        results.append(_result(check_info, default_names, name="Default Names", severity="warning",
+                               description="デフォルト名のオブジェクトが検出されました"))
+
+    duplicate_names = rules.find_duplicate_names(objects)
+    if duplicate_names:
+        results.append(_result(check_info, duplicate_names, name="Duplicate Names", severity="error",
+                               description="重複した名前のオブジェクトが検出されました"))
+
+    invalid_chars = rules.find_invalid_names(objects)
+    if invalid_chars:
+        results.append(_result(check_info, invalid_chars, name="Invalid Characters", severity="warning",
+                               description="無効な文字を含む名前が検出されました"))
+
+    return results
+
+
+def static_bg_naming_convention(scene, check_info):
+    """check_bg_naming_convention相当"""
+    invalid_names = rules.find_bg_naming_violations(_objects_without_cameras(scene))
+    return _result(check_info, invalid_names, severity="error") if invalid_names else None
+
+
+def static_missing_textures(scene, check_info):
+    """check_missing_textures相当"""
+    missing = rules.find_missing_textures(_texture_paths(scene))
+    return _result(check_info, missing) if missing else None
+
+
+def static_texture_sequences(scene, check_info):
+    """check_texture_sequences相当"""
+    issues = rules.find_sequence_issues(_texture_paths(scene))
+    return _result(check_info, issues) if issues else None
+
+
+def static_shader_issues(scene, check_info):
+    """check_shader_issues相当（ファイルに含まれないデフォルトノードは対象外）"""
+    issues = rules.find_extra_materials([rules.short_name(node) for node in scene.materials()])
+    if issues:
+        return _result(check_info, issues, severity=check_info.get("severity", "error"),
+                       description="不要なマテリアルが見つかりました（シェーダーは実機側で付与するため）")
+    return None
+
+
+# チェック関数名 -> 静的チェック関数
+STATIC_CHECKS = {
+    "check_naming_issues": static_naming_issues,
+    "check_bg_naming_convention": static_bg_naming_convention,
+    "check_missing_textures": static_missing_textures,
+    "check_texture_sequences": static_texture_sequences,
+    "check_shader_issues": static_shader_issues,
+}
+
+
+def static_checks_for_config(config_name):
+    """設定のうち静的スキャンで実行できるチェック項目を取得"""
+    config = load_check_config(config_name)
+    checks = []
+    for category_name, check_items in config.get("categories", {}).items():
+        for item in check_items:
+            if item.get("function") in STATIC_CHECKS:
+                checks.append(dict(item, category=category_name,
+                                   severity=item.get("severity", "warning")))
+    return checks
+
+
+def static_check_scene(scene_file, checks):
+    """1つの.maファイルに静的チェックを実行
+
+    Args:
+        scene_file: .maファイルのパス
+        checks: チェック項目のリスト（STATIC_CHECKSにない関数は無視）
+
+    Returns:
+        list: エラーがあったチェック結果のリスト
+    """
+    scene = parse_maya_ascii(scene_file)
+    results = []
+    for check in checks:
+        static_function = STATIC_CHECKS.get(check.get("function", ""))
+        if not static_function:
+            continue
+        check_results = static_function(scene, check)
+        if not isinstance(check_results, list):
+            check_results = [check_results]
+        results.extend(r for r in check_results if r and r.get("count", 0) > 0)
+    return results
+
+
+def _scan_one(args):
+    """プロセスプール用: 1ファイルをスキャン"""
+    scene_file, checks = args
+    try:
+        return scene_file, static_check_scene(scene_file, checks), None
+    except Exception as e:
+        return scene_file, [], str(e)
+
+
+def prescan_files(scene_files, config_name="bg_checks", workers=None):
+    """複数の.maファイルをMayaを使わずに事前スキャン
+
+    Args:
+        scene_files: .maファイルのリスト（.ma以外は無視）
+        config_name: 使用する設定ファイル名（静的スキャンできるチェックのみ実行）
+        workers: プロセス数（Noneの場合はCPUコア数、1の場合は現在のプロセスで実行）
+
+    Returns:
+        dict: {シーンファイル: チェック結果のリスト}
+    """
+    checks = static_checks_for_config(config_name)
+    scene_files = [f for f in scene_files if f.lower().endswith(".ma")]
+    jobs = [(scene_file, checks) for scene_file in scene_files]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(jobs) <= 1:
+        outputs = [_scan_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            outputs = list(executor.map(_scan_one, jobs, chunksize=chunksize))
+
+    results = {}
+    for scene_file, scene_results, error in outputs:
+        if error:
+            print(f"✗ エラー: {scene_file} - {error}")
+        results[scene_file] = scene_results
+
+    return results
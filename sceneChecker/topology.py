@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+Maya Scene Checker - Topology
+メッシュ配列（頂点座標・フェースの頂点リスト・エッジ・UV）とスキンウェイトに対する判定
+Mayaに依存しない純粋なPython処理
+
+各関数はbackend.MeshData / backend.SkinDataを受け取り、該当するインデックスのリストを返す。
+配列がNumPy配列（スナップショットファイルのメモリマップなど）の場合はベクトル化して判定する
+"""
+
+import array
+import hashlib
+import math
+import sys
+
+# NumPyは配列が渡された時のみ使用する。NumPy配列を受け取る時点でNumPyは読み込み済みのため
+# ここでは読み込まない（checkerの読み込み・バッチワーカーの起動を軽くする）
+np = None
+
+
+# 長さ・面積をゼロとみなす閾値
+ZERO_TOLERANCE = 0.0001
+
+# 頂点座標のハッシュで丸める小数点以下の桁数
+DIGEST_DECIMALS = 6
+
+
+def _is_array(values):
+    """NumPy配列かどうか"""
+    global np
+    if np is None:
+        np = sys.modules.get("numpy")
+        if np is None:
+            return False
+    return isinstance(values, np.ndarray)
+
+
+def _as_list(values):
+    """NumPy配列をPythonのリストに変換"""
+    return values.tolist() if _is_array(values) else values
+
+
+def array_digest(values, relative=False):
+    """配列の内容のハッシュ（同じ内容のメッシュの判定結果を共有するためのキー）
+
+    Args:
+        values: MeshDataの配列（リストまたはNumPy配列）
+        relative: 先頭の要素からの相対値を丸めてハッシュする（頂点座標。移動しただけのコピーを同じ内容とみなす）
+    """
+    if _is_array(values):
+        if relative and len(values):
+            # + 0.0 で -0.0 を 0.0 にそろえる
+            values = np.round(values - values[0], DIGEST_DECIMALS) + 0.0
+        data = np.ascontiguousarray(values)
+        return (data.shape, hashlib.blake2b(data.tobytes(), digest_size=16).digest())
+    if relative and len(values):
+        # 相対値を小数点以下DIGEST_DECIMALS桁の整数に量子化する（roundより速く、-0.0も生じない）
+        x0, y0, z0 = values[0]
+        scale = 10 ** DIGEST_DECIMALS
+        floor = math.floor
+        data = array.array("q", [floor(c) for x, y, z in values
+                                 for c in ((x - x0) * scale + 0.5, (y - y0) * scale + 0.5, (z - z0) * scale + 0.5)])
+        return ((len(values),), hashlib.blake2b(data.tobytes(), digest_size=16).digest())
+    if values and isinstance(values[0], str):
+        # UVセット名（名前に含まれない \0 で区切る）
+        data = "\0".join(values).encode("utf-8")
+    elif values and not isinstance(values[0], (int, float)):
+        # 要素ごとの長さと値を並べてパックする
+        data = (array.array("q", [len(value) for value in values]).tobytes()
+                + array.array("d", [x for value in values for x in value]).tobytes())
+    else:
+        data = array.array("d", values).tobytes()
+    return ((len(values),), hashlib.blake2b(data, digest_size=16).digest())
+
+
+def _face_offsets(face_counts):
+    """フェースごとのface_vertices上の開始位置（NumPy）"""
+    return np.concatenate(([0], np.cumsum(face_counts)[:-1])).astype(np.int64)
+
+
+def iter_faces(mesh):
+    """フェースごとの頂点インデックスを順に返す
+
+    Yields:
+        tuple: (フェースインデックス, 頂点インデックスのリスト)
+    """
+    face_vertices = _as_list(mesh.face_vertices)
+    offset = 0
+    for face_index, count in enumerate(_as_list(mesh.face_counts)):
+        yield face_index, face_vertices[offset:offset + count]
+        offset += count
+
+
+def find_nonmanifold_vertices(mesh):
+    """非多様体頂点
+
+    3枚以上のフェースが共有するエッジの頂点と、
+    頂点を囲むフェースが複数の扇に分かれている頂点（蝶ネクタイ状）を検出する
+
+    Returns:
+        list: 頂点インデックスのリスト
+    """
+    if _is_array(mesh.face_vertices) and len(mesh.face_vertices):
+        return _nonmanifold_vertices_array(mesh)
+
+    face_vertices = _as_list(mesh.face_vertices)
+
+    # エッジ -> そのエッジを含むフェースのコーナー（face_verticesの位置）の組
+    edge_corners = {}
+    offset = 0
+    for count in _as_list(mesh.face_counts):
+        for k in range(count):
+            corner = offset + k
+            next_corner = offset + (k + 1) % count
+            a, b = face_vertices[corner], face_vertices[next_corner]
+            key = (a, b) if a < b else (b, a)
+            pair = (corner, next_corner) if a < b else (next_corner, corner)
+            edge_corners.setdefault(key, []).append(pair)
+        offset += count
+
+    # 2枚のフェースが共有するエッジをまたいで、同じ頂点のコーナー同士をつなぐ
+    group = list(range(len(face_vertices)))
+
+    def root(corner):
+        while group[corner] != corner:
+            group[corner] = group[group[corner]]
+            corner = group[corner]
+        return corner
+
+    nonmanifold = set()
+    for edge, pairs in edge_corners.items():
+        if len(pairs) > 2:
+            nonmanifold.update(edge)
+        elif len(pairs) == 2:
+            (a1, b1), (a2, b2) = pairs
+            group[root(a1)] = root(a2)
+            group[root(b1)] = root(b2)
+
+    # 頂点のコーナーが複数のグループに分かれていれば扇が複数ある
+    fans = {}
+    for corner, vertex in enumerate(face_vertices):
+        fans.setdefault(vertex, set()).add(root(corner))
+    nonmanifold.update(vertex for vertex, roots in fans.items() if len(roots) > 1)
+
+    return sorted(nonmanifold)
+
+
+def _nonmanifold_vertices_array(mesh):
+    """find_nonmanifold_verticesのNumPy版"""
+    face_counts = np.asarray(mesh.face_counts, dtype=np.int64)
+    face_vertices = np.asarray(mesh.face_vertices, dtype=np.int64)
+    corner_count = len(face_vertices)
+    vertex_count = int(face_vertices.max()) + 1
+    corners = np.arange(corner_count)
+    offsets = _face_offsets(face_counts)
+    next_corners = corners + 1
+    next_corners[offsets + face_counts - 1] = offsets
+
+    # コーナーごとの辺（小さい頂点のコーナー, 大きい頂点のコーナー）とエッジのキー
+    a = face_vertices
+    b = face_vertices[next_corners]
+    swap = a > b
+    low_corners = np.where(swap, next_corners, corners)
+    high_corners = np.where(swap, corners, next_corners)
+    keys = np.minimum(a, b) * vertex_count + np.maximum(a, b)
+
+    order = np.argsort(keys, kind="stable")
+    unique_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+
+    # 3枚以上のフェースが共有するエッジ
+    shared_keys = unique_keys[counts > 2]
+    nonmanifold = set(np.concatenate((shared_keys // vertex_count, shared_keys % vertex_count)).tolist())
+
+    # 2枚のフェースが共有するエッジをまたいで同じ頂点のコーナー同士をつなぎ、
+    # 連結成分を最小のコーナー番号でラベル付けする
+    first = order[starts[counts == 2]]
+    second = order[starts[counts == 2] + 1]
+    left = np.concatenate((low_corners[first], high_corners[first]))
+    right = np.concatenate((low_corners[second], high_corners[second]))
+    labels = corners.copy()
+    while True:
+        merged = np.minimum(labels[left], labels[right])
+        updated = labels.copy()
+        np.minimum.at(updated, left, merged)
+        np.minimum.at(updated, right, merged)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+
+    # 頂点のコーナーが複数のラベルに分かれていれば扇が複数ある
+    fans = np.unique(face_vertices * corner_count + labels) // corner_count
+    nonmanifold.update(np.flatnonzero(np.bincount(fans, minlength=vertex_count) > 1).tolist())
+
+    return sorted(nonmanifold)
+
+
+def find_lamina_faces(mesh):
+    """ラミナフェース（すべての頂点を別のフェースと共有するフェース）
+
+    Returns:
+        list: フェースインデックスのリスト
+    """
+    seen = {}
+    lamina = set()
+    for face_index, vertices in iter_faces(mesh):
+        key = frozenset(vertices)
+        if key in seen:
+            lamina.update((seen[key], face_index))
+        else:
+            seen[key] = face_index
+    return sorted(lamina)
+
+
+def find_zero_length_edges(mesh, tolerance=ZERO_TOLERANCE):
+    """長さがtolerance以下のエッジ
+
+    Returns:
+        list: エッジインデックスのリスト
+    """
+    points = mesh.points
+    if _is_array(points) and len(mesh.edges):
+        edges = np.asarray(mesh.edges)
+        lengths = np.linalg.norm(points[edges[:, 0]] - points[edges[:, 1]], axis=1)
+        return np.flatnonzero(lengths <= tolerance).tolist()
+    return [edge_index for edge_index, (a, b) in enumerate(mesh.edges)
+            if math.dist(points[a], points[b]) <= tolerance]
+
+
+def find_ngons(mesh):
+    """5頂点以上のフェース
+
+    Returns:
+        list: フェースインデックスのリスト
+    """
+    if _is_array(mesh.face_counts):
+        return np.flatnonzero(mesh.face_counts > 4).tolist()
+    return [face_index for face_index, count in enumerate(mesh.face_counts) if count > 4]
+
+
+def face_area(points, vertices):
+    """フェースの面積（Newell法、非平面のフェースにも対応）"""
+    nx = ny = nz = 0.0
+    for a, b in zip(vertices, vertices[1:] + vertices[:1]):
+        x1, y1, z1 = points[a]
+        x2, y2, z2 = points[b]
+        nx += (y1 - y2) * (z1 + z2)
+        ny += (z1 - z2) * (x1 + x2)
+        nz += (x1 - x2) * (y1 + y2)
+    return 0.5 * math.sqrt(nx * nx + ny * ny + nz * nz)
+
+
+def find_zero_area_faces(mesh, tolerance=ZERO_TOLERANCE):
+    """面積がtolerance未満のフェース
+
+    Returns:
+        list: フェースインデックスのリスト
+    """
+    points = mesh.points
+    if _is_array(points) and len(mesh.face_counts):
+        return np.flatnonzero(face_areas(mesh) < tolerance).tolist()
+    return [face_index for face_index, vertices in iter_faces(mesh)
+            if face_area(points, vertices) < tolerance]
+
+
+def face_areas(mesh):
+    """全フェースの面積（NumPy、Newell法）
+
+    Returns:
+        numpy.ndarray: フェースインデックス順の面積
+    """
+    face_counts = np.asarray(mesh.face_counts, dtype=np.int64)
+    face_vertices = np.asarray(mesh.face_vertices, dtype=np.int64)
+    offsets = _face_offsets(face_counts)
+
+    # 各コーナーの次のコーナー（フェースの最後のコーナーは先頭に戻る）
+    next_corners = np.arange(1, len(face_vertices) + 1)
+    next_corners[offsets + face_counts - 1] = offsets
+
+    current = mesh.points[face_vertices]
+    following = mesh.points[face_vertices[next_corners]]
+    x1, y1, z1 = current[:, 0], current[:, 1], current[:, 2]
+    x2, y2, z2 = following[:, 0], following[:, 1], following[:, 2]
+    normal = np.stack([
+        np.add.reduceat((y1 - y2) * (z1 + z2), offsets),
+        np.add.reduceat((z1 - z2) * (x1 + x2), offsets),
+        np.add.reduceat((x1 - x2) * (y1 + y2), offsets),
+    ], axis=1)
+    return 0.5 * np.linalg.norm(normal, axis=1)
+
+
+def has_uv_sets(mesh):
+    """UVセットがあるかどうか"""
+    return bool(mesh.uv_sets)
+
+
+def find_uvs_out_of_range(mesh, limit=None):
+    """0-1範囲外のUV
+
+    Args:
+        limit: 最大件数（Noneの場合は無制限）
+
+    Returns:
+        list: UVインデックスのリスト
+    """
+    if _is_array(mesh.uvs):
+        outside = np.flatnonzero(((mesh.uvs < 0) | (mesh.uvs > 1)).any(axis=1))
+        return outside[:limit].tolist()
+
+    out_of_range = []
+    for uv_index, (u, v) in enumerate(mesh.uvs):
+        if u < 0 or u > 1 or v < 0 or v > 1:
+            out_of_range.append(uv_index)
+            if limit is not None and len(out_of_range) >= limit:
+                break
+    return out_of_range
+
+
+def find_zero_weight_vertices(skin, tolerance=ZERO_TOLERANCE):
+    """ウェイトの合計がゼロの頂点
+
+    Returns:
+        list: 頂点インデックスのリスト
+    """
+    if _is_array(skin.weights):
+        if skin.weights.ndim != 2:
+            return []
+        return np.flatnonzero(np.abs(skin.weights.sum(axis=1)) < tolerance).tolist()
+    return [vertex for vertex, weights in enumerate(skin.weights) if abs(sum(weights)) < tolerance]
+
+
+def find_unused_influences(skin, tolerance=ZERO_TOLERANCE):
+    """ウェイトの合計がゼロのインフルエンス
+
+    Returns:
+        list: インフルエンス名のリスト
+    """
+    if _is_array(skin.weights):
+        if skin.weights.ndim != 2:
+            return list(skin.influences)
+        totals = skin.weights.sum(axis=0)
+        return [influence for influence, total in zip(skin.influences, totals) if total < tolerance]
+
+    totals = [sum(column) for column in zip(*skin.weights)] or [0.0] * len(skin.influences)
+    return [influence for influence, total in zip(skin.influences, totals) if total < tolerance]
+
+
+# 判定関数ごとに読むMeshDataの配列（checkerはこの配列のハッシュが同じメッシュの判定結果を共有する）
+FINDER_FIELDS = {
+    "find_nonmanifold_vertices": ("face_counts", "face_vertices"),
+    "find_lamina_faces": ("face_counts", "face_vertices"),
+    "find_zero_length_edges": ("points", "edges"),
+    "find_ngons": ("face_counts",),
+    "find_zero_area_faces": ("points", "face_counts", "face_vertices"),
+    "has_uv_sets": ("uv_sets",),
+    "find_uvs_out_of_range": ("uvs",),
+}
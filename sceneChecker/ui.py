@@ -9,10 +9,68 @@ try:
 except ImportError:
     from PySide2 import QtWidgets, QtCore, QtGui
 
+from .components import selection_targets
+from .result_index import ResultIndex
+
+
+class ItemListModel(QtCore.QAbstractListModel):
+    """エラー項目のリストモデル
+
+    項目ごとのオブジェクトは作らず、表示文字列は表示時に生成する。
+    行はスクロールに合わせてFETCH_SIZE件ずつ公開する（canFetchMore/fetchMore）。
+    set_rowsで表示する行を元の項目の行番号のリストで絞り込む（検索フィルタ）
+    """
+
+    FETCH_SIZE = 1000
+
+    def __init__(self, items, parent=None):
+        super(ItemListModel, self).__init__(parent)
+        self._items = items
+        self._rows = None  # 表示する元の行番号（Noneの場合はすべて）
+        self._loaded = 0
+
+    def set_rows(self, rows):
+        """表示する行を設定（Noneの場合はすべての行）"""
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = 0
+        self.endResetModel()
+
+    def _row_count(self):
+        return len(self._items) if self._rows is None else len(self._rows)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self.item(index.row()))
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and self._loaded < self._row_count()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_SIZE, self._row_count() - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def item(self, row):
+        """行のエラー項目"""
+        return self._items[row if self._rows is None else self._rows[row]]
+
 
 class CheckResultWidget(QtWidgets.QWidget):
     """個別のチェック結果を表示するウィジェット"""
 
+    # リストの選択をMayaに反映するまでの待ち時間（ミリ秒、ドラッグ中の連続した変更をまとめる）
+    SELECTION_DELAY_MS = 150
+
     def __init__(self, check_name, count, severity, description="", items=None, adjust_function=None, parent=None):
         super(CheckResultWidget, self).__init__(parent)
 
@@ -23,6 +81,7 @@ class CheckResultWidget(QtWidgets.QWidget):
         self.items = items or []
         self.adjust_function = adjust_function
         self.is_expanded = False
+        self.row_filter = None  # 検索フィルタで表示する行（Noneの場合はすべて）
 
         self.setup_ui()
 
@@ -58,9 +117,9 @@ class CheckResultWidget(QtWidgets.QWidget):
 
         # カウント（色付き）
         count_color = self.get_count_color()
-        count_label = QtWidgets.QLabel(f"({self.count})")
-        count_label.setStyleSheet(f"font-weight: bold; font-size: 13px; color: {count_color};")
-        header_layout.addWidget(count_label)
+        self.count_label = QtWidgets.QLabel(f"({self.count})")
+        self.count_label.setStyleSheet(f"font-weight: bold; font-size: 13px; color: {count_color};")
+        header_layout.addWidget(self.count_label)
 
         header_layout.addStretch()
 
@@ -108,9 +167,18 @@ class CheckResultWidget(QtWidgets.QWidget):
 
         layout.addWidget(self.header)
 
-        # 詳細コンテンツ
+        # 詳細コンテンツは最初に展開した時に作成する
+        self.content = None
+
+        # クリックイベント
+        self.header.mousePressEvent = self.toggle_expand
+
+    def build_content(self):
+        """詳細コンテンツ（説明文・エラー項目のリスト）を作成"""
+        if self.content is not None:
+            return
+
         self.content = QtWidgets.QWidget()
-        self.content.setVisible(False)
         content_layout = QtWidgets.QVBoxLayout(self.content)
         content_layout.setContentsMargins(40, 12, 12, 12)
 
@@ -127,13 +195,17 @@ class CheckResultWidget(QtWidgets.QWidget):
             items_label.setStyleSheet("color: #FFFFFF; font-size: 11px; font-weight: bold; padding-top: 4px;")
             content_layout.addWidget(items_label)
 
-            # リストビュー
-            self.items_list = QtWidgets.QListWidget()
+            # リストビュー（件数が多くても表示範囲の行だけを描画する）
+            self.items_model = ItemListModel(self.items, self)
+            if self.row_filter is not None:
+                self.items_model.set_rows(self.row_filter)
+            self.items_list = QtWidgets.QListView()
             self.items_list.setMaximumHeight(200)
+            self.items_list.setUniformItemSizes(True)
             self.items_list.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
-            self.items_list.addItems(self.items)
+            self.items_list.setModel(self.items_model)
             self.items_list.setStyleSheet("""
-                QListWidget {
+                QListView {
                     background-color: #2A2A3E;
                     color: #D0D0D0;
                     border: none;
@@ -141,15 +213,15 @@ class CheckResultWidget(QtWidgets.QWidget):
                     font-family: 'Consolas', monospace;
                     padding: 4px;
                 }
-                QListWidget::item {
+                QListView::item {
                     padding: 4px;
                     border-radius: 2px;
                 }
-                QListWidget::item:selected {
+                QListView::item:selected {
                     background-color: #4A90E2;
                     color: white;
                 }
-                QListWidget::item:hover {
+                QListView::item:hover {
                     background-color: #3A3A4E;
                 }
                 QScrollBar:vertical {
@@ -163,8 +235,12 @@ class CheckResultWidget(QtWidgets.QWidget):
                 }
             """)
 
-            # 選択時のイベント接続
-            self.items_list.itemSelectionChanged.connect(self.on_selection_changed)
+            # 選択時のイベント接続（変更が落ち着いてからMayaに反映する）
+            self.selection_timer = QtCore.QTimer(self)
+            self.selection_timer.setSingleShot(True)
+            self.selection_timer.setInterval(self.SELECTION_DELAY_MS)
+            self.selection_timer.timeout.connect(self.sync_selection)
+            self.items_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
             content_layout.addWidget(self.items_list)
 
@@ -174,10 +250,16 @@ class CheckResultWidget(QtWidgets.QWidget):
             }
         """)
 
-        layout.addWidget(self.content)
+        self.layout().addWidget(self.content)
 
-        # クリックイベント
-        self.header.mousePressEvent = self.toggle_expand
+    def set_row_filter(self, rows):
+        """検索フィルタで表示する行を設定（Noneの場合はすべての行）"""
+        if rows is None and self.row_filter is None:
+            return
+        self.row_filter = rows
+        self.count_label.setText(f"({self.count})" if rows is None else f"({len(rows)}/{self.count})")
+        if self.content is not None and self.items:
+            self.items_model.set_rows(rows)
 
     def get_severity_icon(self):
         """重要度に応じたアイコンと色を返す"""
@@ -209,7 +291,10 @@ class CheckResultWidget(QtWidgets.QWidget):
     def toggle_expand(self, event):
         """展開/折りたたみの切り替え"""
         self.is_expanded = not self.is_expanded
-        self.content.setVisible(self.is_expanded)
+        if self.is_expanded:
+            self.build_content()
+        if self.content is not None:
+            self.content.setVisible(self.is_expanded)
         self.expand_icon.setText("▼" if self.is_expanded else "▶")
 
     def on_adjust_clicked(self):
@@ -248,22 +333,27 @@ class CheckResultWidget(QtWidgets.QWidget):
             msg.setIcon(QMessageBox.Icon.Critical)
             msg.exec()
 
-    def on_selection_changed(self):
-        """リストビューの選択が変更された時の処理"""
+    def on_selection_changed(self, *args):
+        """リストビューの選択が変更された時の処理（Mayaへの反映を遅延）"""
+        self.selection_timer.start()
+
+    def selected_items(self):
+        """リストビューで選択されているエラー項目（行の順）"""
+        rows = []
+        for selection_range in self.items_list.selectionModel().selection():
+            rows.extend(range(selection_range.top(), selection_range.bottom() + 1))
+        return [str(self.items_model.item(row)) for row in sorted(set(rows))]
+
+    def sync_selection(self):
+        """選択されたエラー項目をMayaで選択
+
+        コンポーネントはメッシュごとの範囲形式（"mesh.f[0:999]"）にまとめて1回のcmds.selectで選択する
+        """
         try:
             import maya.cmds as cmds
-            selected_items = self.items_list.selectedItems()
-            if selected_items:
-                # 選択されたアイテムからオブジェクト名を抽出
-                selection = []
-                for item in selected_items:
-                    item_text = item.text()
-                    # "pCube1.vtx[45]" のような形式からMayaで選択可能な形式に変換
-                    selection.append(item_text)
-
-                # Mayaで選択
-                if selection:
-                    cmds.select(selection, replace=True)
+            selection = selection_targets(self.selected_items())
+            if selection:
+                cmds.select(selection, replace=True)
         except ImportError:
             # Maya環境外では何もしない
             pass
@@ -289,6 +379,13 @@ class SceneCheckerUI(QtWidgets.QWidget):
         self.setWindowModality(QtCore.Qt.NonModal)
 
         self.check_results = []
+        self.severity_counts = {"error": 0, "warning": 0, "success": 0}
+        self.result_index = ResultIndex()
+        # 検索インデックスはアイドル時に少しずつ作成する（最初の検索で作成を待たないように）
+        self.index_timer = QtCore.QTimer(self)
+        self.index_timer.setSingleShot(True)
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self._build_index)
 
         self.setup_ui()
         self.apply_stylesheet()
@@ -331,6 +428,13 @@ class SceneCheckerUI(QtWidgets.QWidget):
 
         main_layout.addLayout(self.summary_layout)
 
+        # 検索・フィルタ
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("検索: |ロングネーム  名前  ns:ネームスペース  severity:error  check:チェック名")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        main_layout.addWidget(self.filter_edit)
+
         # チェック結果エリア
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
@@ -365,22 +469,84 @@ class SceneCheckerUI(QtWidgets.QWidget):
 
     def add_check_result(self, check_name, count, severity, description="", items=None, adjust_function=None):
         """チェック結果を追加"""
+        self._insert_result(check_name, count, severity, description, items, adjust_function)
+
+        # サマリーを更新
+        self.update_summary()
+        self._refilter()
+
+    def add_results(self, results):
+        """チェック結果（run_checksの戻り値）をまとめて追加
+
+        追加中は再描画を止め、サマリーは最後に1回だけ更新する
+
+        Args:
+            results: チェック結果のリスト
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            for result_data in results:
+                self._insert_result(
+                    result_data["name"],
+                    result_data["count"],
+                    result_data["severity"],
+                    result_data["description"],
+                    result_data["items"],
+                    result_data.get("adjust_function")
+                )
+        finally:
+            self.setUpdatesEnabled(True)
+
+        self.update_summary()
+        self._refilter()
+
+    def _refilter(self):
+        """検索文字列が入力されていれば、追加された結果にも適用"""
+        if self.filter_edit.text():
+            self.apply_filter(self.filter_edit.text())
+
+    def _insert_result(self, check_name, count, severity, description, items, adjust_function):
+        """結果のウィジェット（ヘッダーのみ）を作成して追加し、件数を集計"""
         result_widget = CheckResultWidget(check_name, count, severity, description, items, adjust_function)
         self.results_layout.insertWidget(self.results_layout.count() - 1, result_widget)
         self.check_results.append(result_widget)
+        self.result_index.add(check_name, severity, result_widget.items)
+        if not self.index_timer.isActive():
+            self.index_timer.start()
+        if severity in self.severity_counts:
+            self.severity_counts[severity] += 1
 
-        # サマリーを更新
-        self.update_summary()
+    def _build_index(self):
+        """検索インデックスの作成を1つの時間枠だけ進め、残りがあればイベントループの後に続ける"""
+        if self.result_index.build_pending():
+            self.index_timer.start()
 
     def update_summary(self):
         """サマリーを更新"""
-        errors = sum(1 for r in self.check_results if r.severity == "error")
-        warnings = sum(1 for r in self.check_results if r.severity == "warning")
-        successes = sum(1 for r in self.check_results if r.severity == "success")
-
-        self.error_summary.setText(f"エラー: {errors}")
-        self.warning_summary.setText(f"警告: {warnings}")
-        self.success_summary.setText(f"成功: {successes}")
+        self.error_summary.setText(f"エラー: {self.severity_counts['error']}")
+        self.warning_summary.setText(f"警告: {self.severity_counts['warning']}")
+        self.success_summary.setText(f"成功: {self.severity_counts['success']}")
+
+    def apply_filter(self, text):
+        """検索文字列で結果を絞り込む
+
+        ウィジェットは作り直さず、一致しない結果を非表示にし、
+        一致した結果のリストは一致した行のみを表示する
+        """
+        matches = self.result_index.query(text)
+        self.setUpdatesEnabled(False)
+        try:
+            for result_id, result_widget in enumerate(self.check_results):
+                if matches is None:
+                    result_widget.set_row_filter(None)
+                    result_widget.setVisible(True)
+                elif result_id in matches:
+                    result_widget.set_row_filter(matches[result_id])
+                    result_widget.setVisible(True)
+                else:
+                    result_widget.setVisible(False)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def expand_all(self):
         """すべての結果を展開"""